@@ -0,0 +1,95 @@
+# benchmarks/bench_decode.py
+"""
+HiTi SDK JPEG 축소 디코딩 벤치마크
+
+고해상도 JPEG을 용지 크기로 변환할 때 전체 해상도 디코딩과 축소(draft) 디코딩의
+시간, 디코딩된 이미지 메모리, 최종 결과의 PSNR을 비교합니다.
+PSNR이 --min-psnr 미만이면 종료 코드 1로 끝납니다 (품질 기준 테스트는 tests/test_decode.py).
+"""
+import os
+import sys
+import math
+import time
+import argparse
+import tempfile
+
+from PIL import Image, ImageChops, ImageStat
+
+# 모듈 경로 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from hiti_sdk.constants import PaperType
+from hiti_sdk.image import _open_image
+
+
+def psnr(a, b):
+    """두 RGB 이미지의 PSNR(dB) 계산"""
+    stat = ImageStat.Stat(ImageChops.difference(a, b))
+    mse = sum(stat.sum2) / (len(stat.sum2) * a.size[0] * a.size[1])
+    if mse == 0:
+        return float('inf')
+    return 10 * math.log10(255 ** 2 / mse)
+
+
+def render(image_path, size, draft):
+    """이미지를 열어 용지 크기로 변환하고 (결과, 디코딩 크기, 소요 시간)을 반환"""
+    start = time.perf_counter()
+    img = _open_image(image_path, size) if draft else Image.open(image_path)
+    img.load()
+    decoded_size = img.size
+    result = img.resize(size, Image.LANCZOS).convert('RGB')
+    return result, decoded_size, time.perf_counter() - start
+
+
+def make_source(path, width, height):
+    """카메라 사진과 비슷한 부드러운 그라디언트 + 노이즈 JPEG 생성"""
+    gradient = Image.linear_gradient("L").resize((width, height))
+    Image.merge("RGB", (
+        gradient,
+        Image.radial_gradient("L").resize((width, height)),
+        Image.blend(gradient, Image.effect_noise((width, height), 24).convert("L"), 0.3),
+    )).save(path, quality=92)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='HiTi JPEG 축소 디코딩 벤치마크')
+    parser.add_argument('--source', nargs=2, type=int, default=[6000, 4000], metavar=('W', 'H'),
+                        help='합성 원본 크기 (기본값: 6000 4000)')
+    parser.add_argument('--min-psnr', type=float, default=35.0, help='허용 최소 PSNR (기본값: 35dB)')
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source = os.path.join(tmp_dir, "source.jpg")
+        make_source(source, *args.source)
+
+        print(f"원본: {args.source[0]}x{args.source[1]} JPEG")
+        print(f"{'용지':<22}{'전체(ms)':>10}{'축소(ms)':>10}{'디코딩 크기':>14}{'메모리(MB)':>16}{'PSNR(dB)':>10}")
+
+        for paper_type in [PaperType.PHOTO_4X6, PaperType.PHOTO_6X9, PaperType.PHOTO_4X6_SPLIT_3UP]:
+            size = PaperType.get_dimensions(paper_type)
+            if paper_type == PaperType.PHOTO_4X6_SPLIT_3UP:
+                size = (size[0] // 3, size[1])
+
+            full, full_decoded, full_time = render(source, size, draft=False)
+            fast, fast_decoded, fast_time = render(source, size, draft=True)
+
+            # Pillow는 RGB 픽셀을 4바이트로 저장
+            full_mb = full_decoded[0] * full_decoded[1] * 4 / 1e6
+            fast_mb = fast_decoded[0] * fast_decoded[1] * 4 / 1e6
+            quality = psnr(full, fast)
+
+            print(f"{paper_type.name:<22}{full_time * 1000:>10.0f}{fast_time * 1000:>10.0f}"
+                  f"{f'{fast_decoded[0]}x{fast_decoded[1]}':>14}{f'{full_mb:.0f} -> {fast_mb:.0f}':>16}{quality:>10.1f}")
+
+            if quality < args.min_psnr:
+                print(f"  -> PSNR 기준 미달: {paper_type.name}")
+                failed = True
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# benchmarks/bench_image.py
+"""
+HiTi SDK 이미지 변환 벤치마크
+
+모든 PaperType 크기에 대해 RGB -> BGR 비트맵 변환 시간을 측정합니다.
+--verify 옵션을 주면 기존 getpixel 방식의 결과와 바이트 단위로 비교합니다
+(작은 크기의 회귀 테스트는 tests/test_image.py).
+"""
+import os
+import sys
+import time
+import argparse
+
+from PIL import Image
+
+# 모듈 경로 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from hiti_sdk.constants import PaperType
+from hiti_sdk.image import _to_bgr_buffer
+
+
+def legacy_bgr_buffer(img):
+    """기존 getpixel 루프 방식의 BGR 변환 (비교 기준)"""
+    width, height = img.size
+    rowsize = ((width * 3 + 3) // 4) * 4
+    bitmap_data = bytearray(rowsize * height)
+    for y in range(height):
+        for x in range(width):
+            r, g, b = img.getpixel((x, y))
+            idx = y * rowsize + x * 3
+            bitmap_data[idx:idx+3] = bytes([b, g, r])
+    return bytes(bitmap_data)
+
+
+def make_test_image(width, height):
+    """행마다 패딩 여부를 확인할 수 있는 합성 테스트 이미지 생성"""
+    return Image.merge("RGB", (
+        Image.linear_gradient("L").resize((width, height)),
+        Image.radial_gradient("L").resize((width, height)),
+        Image.effect_noise((width, height), 64).convert("L"),
+    ))
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='HiTi 이미지 변환 벤치마크')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (기본값: 5)')
+    parser.add_argument('--verify', action='store_true', help='기존 방식과 바이트 단위 비교 (느림)')
+    args = parser.parse_args()
+
+    print(f"{'용지':<22}{'크기':>12}{'평균(ms)':>12}{'MPix/s':>10}")
+    failed = False
+
+    for paper_type in PaperType:
+        width, height = PaperType.get_dimensions(paper_type)
+        img = make_test_image(width, height)
+
+        elapsed = []
+        for _ in range(max(1, args.repeat)):
+            start = time.perf_counter()
+            _, _, _, data = _to_bgr_buffer(img)
+            elapsed.append(time.perf_counter() - start)
+
+        avg = sum(elapsed) / len(elapsed)
+        mpix = width * height / avg / 1e6
+        print(f"{paper_type.name:<22}{f'{width}x{height}':>12}{avg * 1000:>12.1f}{mpix:>10.1f}")
+
+        if args.verify:
+            if data != legacy_bgr_buffer(img):
+                print(f"  -> 불일치: {paper_type.name}")
+                failed = True
+
+        img.close()
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
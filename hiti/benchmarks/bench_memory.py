@@ -0,0 +1,64 @@
+# benchmarks/bench_memory.py
+"""
+HiTi SDK 인쇄 준비 단계 최대 메모리(RSS) 측정
+
+prepare_image 후 매수만큼 to_bitmap을 호출하는 인쇄 경로를 흉내 내고,
+프로세스 최대 RSS와 tracemalloc 최대 할당량을 출력합니다.
+측정값이 섞이지 않도록 용지 유형마다 별도 프로세스에서 실행하세요.
+"""
+import os
+import sys
+import argparse
+import resource
+import tempfile
+import tracemalloc
+
+from PIL import Image
+
+# 모듈 경로 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from hiti_sdk.constants import PaperType, Orientation
+from hiti_sdk.image import prepare_image
+
+
+def max_rss_mb():
+    """현재 프로세스의 최대 RSS (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='HiTi 인쇄 준비 메모리 측정')
+    parser.add_argument('--paper', default='PHOTO_8X12', help='용지 유형 이름 (기본값: PHOTO_8X12)')
+    parser.add_argument('--copies', type=int, default=3, help='to_bitmap 호출 횟수 (기본값: 3)')
+    args = parser.parse_args()
+
+    paper_type = PaperType[args.paper]
+    width, height = PaperType.get_dimensions(paper_type)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        image_path = os.path.join(tmp_dir, "source.png")
+        Image.effect_noise((width, height), 64).convert("RGB").save(image_path)
+
+        baseline = max_rss_mb()
+        tracemalloc.start()
+
+        image_data = prepare_image(image_path, paper_type, Orientation.PORTRAIT)
+        bitmaps = [image_data.to_bitmap() for _ in range(max(1, args.copies))]
+
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"용지: {paper_type.name} ({width}x{height}), 버퍼: {len(image_data.data_buffer) / 1e6:.1f} MB")
+    print(f"to_bitmap 호출: {len(bitmaps)}회")
+    print(f"최대 RSS: {max_rss_mb():.1f} MB (시작 시 {baseline:.1f} MB)")
+    print(f"tracemalloc 최대: {traced_peak / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
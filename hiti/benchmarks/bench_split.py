@@ -0,0 +1,63 @@
+# benchmarks/bench_split.py
+"""
+HiTi SDK 분할 이미지 생성 벤치마크
+
+2UP/3UP 분할 용지에 대해 create_split_image의 소요 시간을 스레드 수별로 측정합니다.
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+from PIL import Image
+
+# 모듈 경로 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from hiti_sdk.constants import PaperType, Orientation
+from hiti_sdk.image import create_split_image
+
+SPLIT_PAPER_TYPES = [
+    PaperType.PHOTO_6X9_SPLIT_2UP,
+    PaperType.PHOTO_4X6_SPLIT_2UP,
+    PaperType.PHOTO_5X7_SPLIT_2UP,
+    PaperType.PHOTO_4X6_SPLIT_3UP,
+]
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='HiTi 분할 이미지 생성 벤치마크')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 3], help='비교할 스레드 수 (기본값: 1 2 3)')
+    parser.add_argument('--source', nargs=2, type=int, default=[4000, 3000], metavar=('W', 'H'),
+                        help='합성 원본 크기 (기본값: 4000 3000)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (기본값: 3)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 원본 이미지 3장 생성
+        sources = []
+        for i in range(3):
+            path = os.path.join(tmp_dir, f"source_{i}.jpg")
+            Image.effect_noise(tuple(args.source), 32 + i * 8).convert("RGB").save(path, quality=90)
+            sources.append(path)
+
+        header = ''.join(f"{f'{w}스레드(ms)':>14}" for w in args.workers)
+        print(f"{'용지':<22}{header}")
+
+        for paper_type in SPLIT_PAPER_TYPES:
+            count = 3 if paper_type == PaperType.PHOTO_4X6_SPLIT_3UP else 2
+            row = f"{paper_type.name:<22}"
+            for workers in args.workers:
+                elapsed = []
+                for _ in range(max(1, args.repeat)):
+                    start = time.perf_counter()
+                    create_split_image(sources[:count], paper_type, Orientation.PORTRAIT, max_workers=workers)
+                    elapsed.append(time.perf_counter() - start)
+                row += f"{min(elapsed) * 1000:>14.0f}"
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/bench_startup.py
+"""
+HiTi SDK 시작 시간 벤치마크
+
+DLL 로드, find_printers(), HiTiPrinter() 생성에 걸리는 시간을 측정합니다.
+DLL을 매번 새로 로드하는 경우와 공유 DLL을 사용하는 경우를 비교합니다.
+HITI_SDK_SIMULATOR=1로 실행하면 프린터 없이 SDK 쪽 비용만 측정합니다.
+"""
+import os
+import sys
+import time
+import argparse
+
+# 모듈 경로 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from hiti_sdk.device import HiTiDll, find_printers
+from hiti_sdk.printer import HiTiPrinter
+from hiti_sdk.exceptions import PrinterError
+
+
+def measure(func, repeat):
+    """func를 repeat번 실행하여 (최소, 평균) 소요 시간(ms) 반환"""
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed.append((time.perf_counter() - start) * 1000)
+    return min(elapsed), sum(elapsed) / len(elapsed)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='HiTi SDK 시작 시간 벤치마크')
+    parser.add_argument('--dll', help='HTRTAPI.dll 경로 (기본값: 기본 위치에서 검색)')
+    parser.add_argument('--repeat', type=int, default=10, help='반복 횟수 (기본값: 10)')
+    args = parser.parse_args()
+    repeat = max(1, args.repeat)
+
+    try:
+        # 첫 로드 (공유 DLL 생성)
+        start = time.perf_counter()
+        shared = HiTiDll.shared(args.dll)
+        first_load = (time.perf_counter() - start) * 1000
+    except PrinterError as e:
+        print(f"DLL을 로드할 수 없습니다: {e}")
+        sys.exit(1)
+
+    print(f"{'항목':<28}{'최소(ms)':>12}{'평균(ms)':>12}")
+    print(f"{'첫 DLL 로드':<28}{first_load:>12.2f}{first_load:>12.2f}")
+
+    results = []
+    if isinstance(shared, HiTiDll):
+        results.append(("DLL 새로 로드", lambda: HiTiDll(args.dll)))
+    else:
+        print("시뮬레이터 사용 중 (HITI_SDK_SIMULATOR): DLL 새로 로드는 측정하지 않습니다.")
+    results += [
+        ("공유 DLL", lambda: HiTiDll.shared(args.dll)),
+        ("find_printers()", find_printers),
+    ]
+
+    if find_printers():
+        results.append(("find_printers()+HiTiPrinter()", lambda: HiTiPrinter().close()))
+    else:
+        print("연결된 프린터가 없어 HiTiPrinter() 생성은 측정하지 않습니다.")
+
+    for label, func in results:
+        best, mean = measure(func, repeat)
+        print(f"{label:<28}{best:>12.2f}{mean:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
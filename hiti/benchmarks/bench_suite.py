@@ -0,0 +1,235 @@
+# benchmarks/bench_suite.py
+"""
+HiTi SDK 벤치마크 모음
+
+prepare_image, create_split_image, ImageData.to_bitmap과 시뮬레이터를 사용한
+print_image/print_split_images 전체 경로를 모든 PaperType과 인쇄 방향,
+여러 원본 해상도에 대해 측정합니다. 지연 시간 백분위수, 초당 픽셀 수,
+tracemalloc 최대 할당량을 출력하고 JSON으로 저장할 수 있습니다.
+
+--baseline으로 이전 결과를 주면 중앙값 지연 시간이나 최대 메모리가 허용치 이상
+늘어난 항목을 출력하고 종료 코드 1로 끝납니다.
+
+    python bench_suite.py --output before.json
+    python bench_suite.py --baseline before.json --output after.json
+"""
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+
+import PIL
+from PIL import Image
+
+# 모듈 경로 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from hiti_sdk.constants import PaperType, Orientation
+from hiti_sdk.image import prepare_image, create_split_image, ImageData
+from hiti_sdk.layout import get_layout
+from hiti_sdk.cache import PageCache
+from hiti_sdk.printer import HiTiPrinter
+from hiti_sdk.simulator import install_simulator, SimulatedPrinter
+from bench_image import make_test_image
+
+DEFAULT_SOURCES = [(1600, 1200), (4000, 3000), (6000, 4000)]
+QUICK_SOURCES = [(4000, 3000)]
+
+
+def percentile(values, pct):
+    """정렬된 값 목록의 백분위수 (nearest-rank)"""
+    index = max(0, min(len(values) - 1, int(round(pct / 100.0 * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+def run_case(name, func, pixels, repeat, warmup=1):
+    """
+    func를 반복 실행하여 측정 결과를 반환합니다.
+    시간 측정이 끝난 뒤 tracemalloc을 켜고 한 번 더 실행하여 최대 할당량을 잽니다.
+    """
+    for _ in range(warmup):
+        func()
+
+    elapsed = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        elapsed.append((time.perf_counter() - start) * 1000)
+    elapsed.sort()
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    p50 = percentile(elapsed, 50)
+    result = {
+        "p50_ms": p50,
+        "p90_ms": percentile(elapsed, 90),
+        "p99_ms": percentile(elapsed, 99),
+        "max_ms": elapsed[-1],
+        "mpix_per_sec": pixels / (p50 / 1000) / 1e6 if p50 > 0 else 0.0,
+        "peak_alloc_mb": peak / (1024 * 1024),
+        "repeat": repeat,
+    }
+    print(f"{name:<58}{result['p50_ms']:>10.1f}{result['p90_ms']:>10.1f}{result['p99_ms']:>10.1f}"
+          f"{result['mpix_per_sec']:>10.1f}{result['peak_alloc_mb']:>10.1f}")
+    return result
+
+
+def make_sources(tmp_dir, sizes):
+    """원본 크기별 합성 JPEG 3장씩 생성"""
+    sources = {}
+    for width, height in sizes:
+        paths = []
+        for i in range(3):
+            path = os.path.join(tmp_dir, f"source_{width}x{height}_{i}.jpg")
+            make_test_image(width, height).rotate(i * 90, expand=False).save(path, quality=90)
+            paths.append(path)
+        sources[(width, height)] = paths
+    return sources
+
+
+def bench_image(results, sources, orientations, repeat):
+    """prepare_image, create_split_image, to_bitmap 측정"""
+    for (src_w, src_h), paths in sources.items():
+        for paper_type in PaperType:
+            for orientation in orientations:
+                page_w, page_h = PaperType.get_dimensions(paper_type)
+                pixels = page_w * page_h
+                suffix = f"{paper_type.name}/{orientation.name}/{src_w}x{src_h}"
+
+                results[f"prepare_image/{suffix}"] = run_case(
+                    f"prepare_image/{suffix}",
+                    lambda: prepare_image(paths[0], paper_type, orientation),
+                    pixels, repeat
+                )
+
+                count = get_layout(paper_type).count
+                if count >= 2:
+                    split_paths = (paths * count)[:count]
+                    results[f"create_split_image/{suffix}"] = run_case(
+                        f"create_split_image/{suffix}",
+                        lambda: create_split_image(split_paths, paper_type, orientation),
+                        pixels, repeat
+                    )
+
+    # to_bitmap은 원본 크기와 무관하므로 용지 유형별로 한 번만 측정
+    first_source = next(iter(sources.values()))[0]
+    for paper_type in PaperType:
+        image_data = prepare_image(first_source, paper_type, Orientation.PORTRAIT)
+        pixels = image_data.width * image_data.height
+        results[f"to_bitmap/{paper_type.name}"] = run_case(
+            f"to_bitmap/{paper_type.name}",
+            lambda: ImageData(image_data.width, image_data.height, image_data.data_buffer).to_bitmap(),
+            pixels, repeat
+        )
+
+
+def bench_print(results, sources, repeat):
+    """시뮬레이터에 print_image/print_split_images 전체 경로 측정 (페이지 캐시 사용 안 함)"""
+    simulator = install_simulator([SimulatedPrinter("HiTi Benchmark", record_pages=False)], time_scale=0)
+    printer = HiTiPrinter("HiTi Benchmark", page_cache=PageCache(max_bytes=0))
+
+    try:
+        (src_w, src_h), paths = sorted(sources.items())[len(sources) // 2]
+        for paper_type in PaperType:
+            page_w, page_h = PaperType.get_dimensions(paper_type)
+            suffix = f"{paper_type.name}/PORTRAIT/{src_w}x{src_h}"
+            count = get_layout(paper_type).count
+
+            if count >= 2:
+                split_paths = (paths * count)[:count]
+                func = lambda: printer.print_split_images(split_paths, paper_type, Orientation.PORTRAIT)
+                name = f"print_split_images/{suffix}"
+            else:
+                func = lambda: printer.print_image(paths[0], paper_type, Orientation.PORTRAIT)
+                name = f"print_image/{suffix}"
+
+            results[name] = run_case(name, func, page_w * page_h, repeat)
+
+            # 시뮬레이터가 받은 비트맵 크기 확인
+            page = simulator.printers[0].pages[-1]
+            if (page.width, page.height) != (page_w, page_h):
+                raise RuntimeError(f"{name}: 잘못된 비트맵 크기 {page.width}x{page.height}")
+    finally:
+        printer.close()
+
+
+def compare(results, baseline, threshold, memory_threshold):
+    """기준 결과와 비교하여 느려지거나 메모리가 늘어난 항목 목록 반환"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        if result["p50_ms"] > base["p50_ms"] * (1 + threshold):
+            regressions.append(f"{name}: p50 {base['p50_ms']:.1f}ms -> {result['p50_ms']:.1f}ms")
+        if result["peak_alloc_mb"] > base["peak_alloc_mb"] * (1 + memory_threshold) + 0.5:
+            regressions.append(f"{name}: 메모리 {base['peak_alloc_mb']:.1f}MB -> {result['peak_alloc_mb']:.1f}MB")
+    return regressions
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='HiTi SDK 벤치마크 모음')
+    parser.add_argument('--repeat', type=int, default=5, help='항목별 반복 횟수 (기본값: 5)')
+    parser.add_argument('--quick', action='store_true', help='원본 4000x3000, 세로 방향만 측정')
+    parser.add_argument('--only', choices=['image', 'print'], help='일부 항목만 측정')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일')
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help='허용 지연 시간 증가 비율 (기본값: 0.15)')
+    parser.add_argument('--memory-threshold', type=float, default=0.10,
+                        help='허용 메모리 증가 비율 (기본값: 0.10)')
+    args = parser.parse_args()
+    repeat = max(1, args.repeat)
+
+    sizes = QUICK_SOURCES if args.quick else DEFAULT_SOURCES
+    orientations = [Orientation.PORTRAIT] if args.quick else list(Orientation)
+
+    print(f"{'항목':<58}{'p50(ms)':>10}{'p90(ms)':>10}{'p99(ms)':>10}{'MPix/s':>10}{'할당(MB)':>10}")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sources = make_sources(tmp_dir, sizes)
+        if args.only in (None, 'image'):
+            bench_image(results, sources, orientations, repeat)
+        if args.only in (None, 'print'):
+            bench_print(results, sources, repeat)
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pillow": PIL.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.memory_threshold)
+        if regressions:
+            print(f"\n성능 저하 {len(regressions)}건:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\n기준 결과 대비 성능 저하 없음")
+
+
+if __name__ == "__main__":
+    main()
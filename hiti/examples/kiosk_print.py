@@ -70,6 +70,11 @@ def print_photo(printer, image_path, copies=1):
         status, desc = printer.get_status()
         print(f"프린터 상태: {desc}")
         
+        # 상태가 바뀔 때마다 출력
+        printer.device.monitor.subscribe(
+            lambda code, desc: print(f"프린터 상태 변경: {desc} (0x{code:08X})")
+        )
+        
         # 용지 정보 출력
         print("용지 크기: 6x8 (고정)")
         print("인쇄 방향: 가로 (고정)")
@@ -81,31 +86,18 @@ def print_photo(printer, image_path, copies=1):
             if i > 0:
                 print(f"다음 인쇄({i+1}/{copies})를 위해 대기 중...")
                 
-                # 최대 30초 동안 기다림
-                for wait_time in range(30):
-                    try:
-                        status_code, status_desc = printer.device.check_status()
-                        
-                        # 인쇄 진행 중(0x00000002) 상태이면 계속 대기
-                        if status_code == 0x00000002:
-                            print(f"인쇄 진행 중... ({wait_time+1}초 경과)")
-                            time.sleep(1)
-                            continue
-                            
-                        # 준비 완료(0)이면 다음 인쇄 진행
-                        if status_code == 0:
-                            print("프린터 준비 완료, 다음 인쇄 시작")
-                            break
-                            
-                        # 그 외 상태인 경우, 심각한 오류인지 확인
-                        if (status_code & 0x00080000) or (status_code & 0x00008000):
-                            print(f"프린터 오류 발생: {status_desc}")
-                            return False
-                            
-                    except Exception as e:
-                        print(f"상태 확인 중 오류: {e}")
-                    
-                    time.sleep(1)
+                # 최대 30초 동안 인쇄 진행 중 상태가 끝날 때까지 대기
+                status_code = printer.device.monitor.wait_for(
+                    lambda code: not printer.device.decode_status(code).active,
+                    timeout=30
+                )
+                
+                if status_code == 0:
+                    print("프린터 준비 완료, 다음 인쇄 시작")
+                elif status_code is not None:
+                    _, status_desc = printer.device.monitor.latest
+                    print(f"프린터 오류 발생: {status_desc}")
+                    return False
             
             # 현재 인쇄 시작
             print(f"'{image_path}' 인쇄 중... ({i+1}/{copies})")
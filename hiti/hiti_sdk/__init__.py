@@ -12,7 +12,20 @@ from .printer import HiTiPrinter, PrinterStatus, PaperType, Orientation, PrintMo
 from .exceptions import PrinterError, ConnectionError, PrintError
 from .device import find_printers, HiTiDevice
 from .constants import DeviceStatus, RibbonType, PrintCommand, DeviceInfoType
-from .image import prepare_image
+from .image import prepare_image, PageTemplate
+from .cache import PageCache
+from .layout import SheetLayout, get_layout, register_layout
+from .jobs import PrintQueue, PrintJob
+from .monitor import StatusMonitor
+from .aio import AsyncHiTiPrinter
+from .pool import HiTiPrinterPool
+from .models import ModelCapabilities, register_model
+from .info import DeviceInfoCache
+from .status import DecodedStatus, StatusSeverity, StatusCategory, decode_status
+from .tracing import PrintTrace, add_trace_hook, remove_trace_hook
+from .history import DurationHistory, default_history
+from .spool import PrintSpool, SpoolEntry
+from .farm import RenderFarm
 
 __version__ = "0.1.0"
 __all__ = [
@@ -30,5 +43,30 @@ __all__ = [
     "RibbonType",
     "PrintCommand",
     "DeviceInfoType",
-    "prepare_image"
+    "prepare_image",
+    "PageTemplate",
+    "PageCache",
+    "SheetLayout",
+    "get_layout",
+    "register_layout",
+    "PrintQueue",
+    "PrintJob",
+    "StatusMonitor",
+    "AsyncHiTiPrinter",
+    "HiTiPrinterPool",
+    "ModelCapabilities",
+    "register_model",
+    "DeviceInfoCache",
+    "DecodedStatus",
+    "StatusSeverity",
+    "StatusCategory",
+    "decode_status",
+    "PrintTrace",
+    "add_trace_hook",
+    "remove_trace_hook",
+    "DurationHistory",
+    "default_history",
+    "PrintSpool",
+    "SpoolEntry",
+    "RenderFarm"
 ]
\ No newline at end of file
@@ -0,0 +1,276 @@
+# hiti_sdk/aio.py
+"""
+asyncio 이벤트 루프용 HiTi 프린터 인터페이스
+"""
+import os
+import asyncio
+import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from .constants import PaperType, Orientation, PrintMode
+from .exceptions import PrintError, StatusError, ImageError
+from .layout import get_layout
+from .image import check_image_source, describe_source
+from .printer import HiTiPrinter, PrinterStatus
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+class AsyncHiTiPrinter:
+    """
+    HiTiPrinter의 asyncio 버전
+
+    DLL을 호출하는 작업은 장치 전용 단일 스레드 실행기에서, 이미지 변환은 기본
+    실행기에서 실행됩니다. 상태 대기는 상태 모니터의 알림을 받는 asyncio Future로
+    처리하므로 이벤트 루프를 막지 않습니다.
+    """
+    def __init__(self, printer):
+        """
+        비동기 프린터를 초기화합니다. 보통은 create()를 사용합니다.
+
+        Args:
+            printer (HiTiPrinter): 연결된 프린터
+        """
+        self.printer = printer
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=f"hiti-aio-{os.path.basename(printer.device.printer_name)}"
+        )
+
+    @classmethod
+    async def create(cls, printer_name=None, page_cache=None):
+        """
+        프린터에 연결하고 비동기 프린터를 생성합니다.
+
+        Args:
+            printer_name (str, optional): 프린터 이름. None인 경우 첫 번째 발견된 프린터 사용
+            page_cache (PageCache, optional): 준비된 페이지 캐시
+
+        Returns:
+            AsyncHiTiPrinter: 연결된 비동기 프린터
+
+        Raises:
+            ConnectionError: 프린터에 연결할 수 없는 경우
+        """
+        loop = asyncio.get_running_loop()
+        printer = await loop.run_in_executor(None, functools.partial(HiTiPrinter, printer_name, page_cache))
+        return cls(printer)
+
+    async def _call(self, func, *args, **kwargs):
+        """장치 전용 실행기에서 DLL 호출 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _wait_for(self, predicate, timeout, poll_interval=None):
+        """
+        상태 코드가 조건을 만족할 때까지 이벤트 루프를 막지 않고 대기합니다.
+
+        Returns:
+            int: 조건을 만족한 상태 코드. 타임아웃 시 None
+        """
+        return await self.printer.device.monitor.wait_for_async(predicate, timeout, poll_interval)
+
+    async def get_status(self, max_age=None):
+        """
+        프린터 상태를 확인합니다. HiTiPrinter.get_status와 같습니다.
+
+        Returns:
+            tuple: (PrinterStatus, str) - 상태 코드와 설명
+        """
+        return await self._call(self.printer.get_status, max_age)
+
+    async def get_device_info(self, max_age=None):
+        """
+        프린터 장치 정보를 가져옵니다. HiTiPrinter.get_device_info와 같습니다.
+
+        Args:
+            max_age (float, optional): 리본 정보/인쇄 매수의 허용 나이(초).
+                None이면 캐시 기본값, 0이면 항상 새로 조회
+
+        Returns:
+            dict: 프린터 정보
+        """
+        return await self._call(self.printer.get_device_info, max_age)
+
+    async def wait_until_ready(self, timeout=60, check_interval=0.5):
+        """
+        프린터가 준비될 때까지 대기합니다.
+
+        Args:
+            timeout (float): 최대 대기 시간(초)
+            check_interval (float): 대기 중 상태 확인 간격(초)
+
+        Returns:
+            bool: 프린터가 준비되었으면 True, 그렇지 않으면 False
+        """
+        try:
+            status_code = await self._wait_for(
+                lambda code: not self.printer.device.decode_status(code).active,
+                timeout,
+                poll_interval=check_interval
+            )
+        except Exception as e:
+            logger.error(f"프린터 대기 중 오류 발생: {e}")
+            raise StatusError(f"프린터 대기 실패: {e}")
+
+        if status_code is None:
+            logger.warning(f"프린터 준비 대기 타임아웃: {timeout}초")
+            return False
+
+        return self.printer.device._is_ready_status(status_code)
+
+    async def _wait_for_completion(self, timeout):
+        """인쇄가 끝날 때까지 대기 (HiTiPrinter._wait_for_completion의 비동기 버전)"""
+        status_code = await self._wait_for(
+            lambda code: self.printer.device.decode_status(code).state in (PrinterStatus.READY, PrinterStatus.ERROR),
+            timeout
+        )
+
+        if status_code is None:
+            return False
+
+        if status_code != 0:
+            _, status_desc = self.printer.device.monitor.latest
+            raise PrintError(f"인쇄 중 오류 발생: {status_desc}", status_code)
+
+        # 인쇄 중에 조회된 리본 잔량/인쇄 매수는 오래된 값이므로 무효화
+        self.printer.device.info.invalidate()
+        return True
+
+    async def _check_ready_to_print(self, wait_for_completion, timeout):
+        """인쇄를 시작할 수 있는 상태인지 확인 (HiTiPrinter._check_ready_to_print의 비동기 버전)"""
+        status, status_desc = await self.get_status()
+        if status not in [PrinterStatus.READY, PrinterStatus.BUSY]:
+            if status == PrinterStatus.ERROR:
+                raise PrintError(f"프린터 오류 상태: {status_desc}")
+            elif status == PrinterStatus.OFFLINE:
+                raise PrintError("프린터가 오프라인 상태입니다.")
+            elif status == PrinterStatus.PRINTING:
+                if not wait_for_completion:
+                    raise PrintError("프린터가 이미 인쇄 중입니다.")
+                # 인쇄 중이면 완료될 때까지 대기
+                if not await self.wait_until_ready(timeout):
+                    raise PrintError("인쇄 중인 작업이 완료될 때까지 기다리는 동안 타임아웃 발생")
+
+    async def print_image(self, image_path, paper_type=PaperType.PHOTO_4X6,
+                          orientation=Orientation.PORTRAIT, copies=1, print_mode=PrintMode.STANDARD,
+                          apply_matte=False, wait_for_completion=False, timeout=120):
+        """
+        이미지를 인쇄합니다. 인자와 동작은 HiTiPrinter.print_image와 같습니다.
+
+        Returns:
+            bool: 성공 여부
+
+        Raises:
+            PrintError: 인쇄 실패 시
+            ImageError: 이미지 처리 실패 시
+        """
+        loop = asyncio.get_running_loop()
+        printer = self.printer
+
+        try:
+            # 이미지 입력 확인 (파일 경로이면 파일이 있는지 확인)
+            check_image_source(image_path)
+
+            # 프린터 상태 확인
+            await self._check_ready_to_print(wait_for_completion, timeout)
+
+            # 이미지 준비 (DLL 실행기를 막지 않도록 기본 실행기에서 실행)
+            image_data = await loop.run_in_executor(
+                None, printer.page_cache.get_or_prepare, image_path, paper_type, orientation
+            )
+
+            # 인쇄 요청 (매수 처리는 HiTiPrinter와 같고, 완료 대기는 이벤트 루프에서 처리)
+            await self._call(
+                printer._print_prepared_image,
+                image_data, describe_source(image_path), paper_type, orientation, copies,
+                print_mode, apply_matte, False, timeout
+            )
+
+            # 마지막 인쇄 완료 대기
+            if wait_for_completion:
+                if await self._wait_for_completion(timeout // 2):
+                    logger.info("모든 인쇄가 완료되었습니다.")
+                    return True
+                logger.warning(f"마지막 인쇄 완료 대기 중 타임아웃 발생 ({timeout//2}초)")
+
+            return True
+
+        except ImageError:
+            # 이미지 오류는 그대로 전달
+            raise
+        except Exception as e:
+            logger.error(f"인쇄 중 오류 발생: {e}")
+            if isinstance(e, PrintError):
+                raise
+            raise PrintError(f"이미지 인쇄 중 오류 발생: {e}")
+
+    async def print_split_images(self, image_paths, paper_type=PaperType.PHOTO_6X9_SPLIT_2UP,
+                                 orientation=Orientation.PORTRAIT, copies=1, print_mode=PrintMode.STANDARD,
+                                 apply_matte=False, wait_for_completion=False, timeout=120):
+        """
+        여러 이미지를 하나의 용지에 분할 인쇄합니다. 인자와 동작은 HiTiPrinter.print_split_images와 같습니다.
+
+        Returns:
+            bool: 성공 여부
+
+        Raises:
+            PrintError: 인쇄 실패 시
+            ImageError: 이미지 처리 실패 시
+        """
+        loop = asyncio.get_running_loop()
+        printer = self.printer
+
+        try:
+            # 용지 타입 확인 (여러 장 배치가 정의된 용지만 가능)
+            if get_layout(paper_type).count < 2:
+                raise ValueError(f"분할 인쇄에 적합하지 않은 용지 타입: {paper_type}")
+
+            # 이미지 입력 확인
+            for source in image_paths:
+                check_image_source(source)
+
+            # 프린터 상태 확인
+            await self._check_ready_to_print(wait_for_completion, timeout)
+
+            # 분할 이미지 생성
+            image_data = await loop.run_in_executor(
+                None, printer.page_cache.get_or_create_split, image_paths, paper_type, orientation
+            )
+
+            # 인쇄 요청 (완료 대기는 이벤트 루프에서 처리)
+            await self._call(
+                printer._print_prepared_sheet,
+                image_data, len(image_paths), paper_type, orientation, copies,
+                print_mode, apply_matte, False, timeout
+            )
+
+            if wait_for_completion:
+                if await self._wait_for_completion(timeout):
+                    logger.info("인쇄가 완료되었습니다.")
+                    return True
+                raise PrintError(f"인쇄 완료 대기 중 타임아웃 발생 ({timeout}초)")
+
+            return True
+
+        except ImageError:
+            # 이미지 오류는 그대로 전달
+            raise
+        except Exception as e:
+            logger.error(f"분할 인쇄 중 오류 발생: {e}")
+            if isinstance(e, PrintError):
+                raise
+            raise PrintError(f"분할 이미지 인쇄 중 오류 발생: {e}")
+
+    async def close(self):
+        """실행기와 프린터의 백그라운드 스레드를 종료합니다."""
+        await self._call(self.printer.close)
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
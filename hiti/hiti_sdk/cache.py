@@ -0,0 +1,236 @@
+# hiti_sdk/cache.py
+"""
+인쇄용으로 준비된 페이지(ImageData) 캐시
+"""
+import os
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+from .image import prepare_image, create_split_image, describe_source, _contiguous
+from . import tracing
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 기본 캐시 용량 (8x12 페이지 약 4장 분량)
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+
+class PageCache:
+    """
+    준비된 인쇄 페이지를 보관하는 LRU 캐시
+
+    원본 파일, 용지 유형, 인쇄 방향을 키로 하여 완성된 ImageData를 보관합니다.
+    같은 페이지를 다시 인쇄하면 디코딩, 크기 조정, BGR 변환을 모두 건너뜁니다.
+    인코딩된 이미지 바이트는 내용 해시로 식별하고, PIL 이미지와 배열은 캐시하지 않습니다.
+    add_pack()으로 등록한 사전 렌더링 결과(AssetPack)는 캐시에 없을 때 렌더링하기 전에 찾아봅니다.
+    """
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, use_content_hash=False, renderer=None, packs=None):
+        """
+        페이지 캐시를 초기화합니다.
+
+        Args:
+            max_bytes (int): 캐시가 보관할 최대 버퍼 크기(바이트). 0이면 캐시를 사용하지 않음
+            use_content_hash (bool): True이면 파일 내용 해시로, False이면 경로+수정 시각+크기로 파일을 식별
+            renderer (RenderFarm, optional): 캐시에 없는 페이지를 준비할 렌더러. None이면 현재 프로세스에서 준비.
+                렌더러의 결과는 렌더러의 버퍼 슬롯을 붙잡지 않도록 복사하여 보관
+            packs (list, optional): 사전 렌더링 결과(AssetPack) 목록
+        """
+        self.max_bytes = max_bytes
+        self.use_content_hash = use_content_hash
+        self.renderer = renderer
+        self.packs = list(packs or [])
+        self.hits = 0
+        self.pack_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _file_key(self, image_path):
+        """원본 식별 키 생성. 인코딩된 바이트는 내용 해시, PIL 이미지와 배열은 None (캐시하지 않음)"""
+        if isinstance(image_path, (bytes, bytearray, memoryview)):
+            return hashlib.sha1(_contiguous(image_path)).hexdigest()
+        if not isinstance(image_path, (str, os.PathLike)):
+            return None
+
+        if self.use_content_hash:
+            digest = hashlib.sha1()
+            with open(image_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+            return digest.hexdigest()
+
+        stat = os.stat(image_path)
+        return (os.path.realpath(image_path), stat.st_mtime_ns, stat.st_size)
+
+    def make_key(self, image_paths, paper_type, orientation):
+        """
+        캐시 키를 생성합니다.
+
+        Args:
+            image_paths (str | list): 이미지 입력 또는 분할 인쇄용 목록
+            paper_type (PaperType): 용지 유형
+            orientation (Orientation): 인쇄 방향
+
+        Returns:
+            tuple: 캐시 키. 식별할 수 없는 메모리 이미지(PIL 이미지, 배열)가 있으면 None
+        """
+        if isinstance(image_paths, (list, tuple)):
+            files = tuple(self._file_key(path) for path in image_paths)
+            if None in files:
+                return None
+        else:
+            files = self._file_key(image_paths)
+            if files is None:
+                return None
+        return (files, int(paper_type), int(orientation))
+
+    def get(self, key):
+        """
+        캐시된 페이지를 가져옵니다.
+
+        Returns:
+            ImageData: 캐시된 페이지. 없으면 None
+        """
+        with self._lock:
+            image_data = self._entries.get(key)
+            if image_data is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return image_data
+
+    def put(self, key, image_data):
+        """
+        페이지를 캐시에 저장합니다. 용량을 넘으면 가장 오래 사용되지 않은 페이지부터 제거합니다.
+        """
+        size = len(image_data.data_buffer)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old.data_buffer)
+
+            self._entries[key] = image_data
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted.data_buffer)
+                self.evictions += 1
+
+    def add_pack(self, pack):
+        """
+        사전 렌더링 결과를 등록합니다. 먼저 등록한 결과부터 찾습니다.
+
+        Args:
+            pack (AssetPack): hiti_sdk.prerender.AssetPack
+        """
+        self.packs.append(pack)
+
+    def _find_in_packs(self, image_path, paper_type, orientation):
+        """사전 렌더링 결과에서 페이지 찾기 (매핑된 페이지이므로 LRU에는 넣지 않음)"""
+        for pack in self.packs:
+            image_data = pack.find(image_path, paper_type, orientation)
+            if image_data is not None:
+                with self._lock:
+                    self.pack_hits += 1
+                return image_data
+        return None
+
+    def get_or_prepare(self, image_path, paper_type, orientation):
+        """
+        캐시에서 페이지를 찾고, 없으면 사전 렌더링 결과에서 찾고,
+        그래도 없으면 prepare_image로 준비한 뒤 저장합니다.
+
+        Returns:
+            ImageData: 준비된 이미지 데이터
+        """
+        key = self.make_key(image_path, paper_type, orientation)
+        image_data = self.get(key) if key is not None else None
+        if image_data is None and self.packs:
+            image_data = self._find_in_packs(image_path, paper_type, orientation)
+            if image_data is not None:
+                logger.info(f"사전 렌더링된 페이지 사용: {describe_source(image_path)}")
+                trace = tracing.current()
+                if trace is not None:
+                    trace.cache_hit = True
+                return image_data
+        if image_data is None:
+            if self.renderer is not None:
+                image_data = self.renderer.prepare_image(image_path, paper_type, orientation)
+                if key is not None:
+                    # 캐시에 보관하는 동안 렌더링 팜의 공유 메모리 슬롯을 점유하지 않도록 복사
+                    image_data = image_data.copy()
+            else:
+                image_data = prepare_image(image_path, paper_type, orientation)
+            if key is not None:
+                self.put(key, image_data)
+        else:
+            logger.info(f"캐시된 페이지 사용: {describe_source(image_path)}")
+            trace = tracing.current()
+            if trace is not None:
+                trace.cache_hit = True
+        return image_data
+
+    def get_or_create_split(self, image_paths, paper_type, orientation):
+        """
+        캐시에서 분할 페이지를 찾고, 없으면 create_split_image로 생성한 뒤 저장합니다.
+
+        Returns:
+            ImageData: 준비된 이미지 데이터
+        """
+        key = self.make_key(list(image_paths), paper_type, orientation)
+        image_data = self.get(key) if key is not None else None
+        if image_data is None:
+            if self.renderer is not None:
+                image_data = self.renderer.create_split_image(image_paths, paper_type, orientation)
+                if key is not None:
+                    # 캐시에 보관하는 동안 렌더링 팜의 공유 메모리 슬롯을 점유하지 않도록 복사
+                    image_data = image_data.copy()
+            else:
+                image_data = create_split_image(image_paths, paper_type, orientation)
+            if key is not None:
+                self.put(key, image_data)
+        else:
+            logger.info(f"캐시된 분할 페이지 사용: {len(image_paths)}개 이미지")
+            trace = tracing.current()
+            if trace is not None:
+                trace.cache_hit = True
+        return image_data
+
+    def clear(self):
+        """캐시를 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            dict: 적중/실패/제거 횟수, 사전 렌더링 결과 적중 횟수, 항목 수, 사용 중인 바이트 수
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "pack_hits": self.pack_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "current_bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
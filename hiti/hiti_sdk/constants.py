@@ -132,30 +132,9 @@ class DeviceStatus(IntEnum):
     
     @classmethod
     def get_description(cls, status_code):
-        """상태 코드에 대한 설명 반환"""
-        descriptions = {
-            cls.OK: "정상",
-            cls.BUSY: "프린터가 사용 중입니다",
-            cls.OFFLINE: "프린터가 오프라인 상태입니다",
-            cls.PRINTING: "프린터가 인쇄 중입니다",
-            cls.COVER_OPEN: "커버가 열려 있습니다",
-            cls.COVER_OPEN2: "커버가 열려 있습니다",
-            cls.PAPER_OUT: "용지가 없습니다",
-            cls.PAPER_JAM: "용지 걸림이 발생했습니다",
-            cls.PAPER_TYPE_MISMATCH: "용지 유형이 일치하지 않습니다",
-            cls.PAPER_TRAY_MISMATCH: "용지 트레이가 일치하지 않습니다",
-            cls.TRAY_MISSING: "용지 트레이가 없습니다",
-            cls.RIBBON_MISSING: "리본이 없습니다",
-            cls.OUT_OF_RIBBON: "리본이 부족합니다",
-            cls.RIBBON_TYPE_MISMATCH: "리본 유형이 일치하지 않습니다",
-            cls.RIBBON_ERROR: "리본 오류가 발생했습니다",
-            cls.WRITE_FAIL: "프린터로 데이터 전송이 실패했습니다",
-            cls.READ_FAIL: "프린터에서 데이터 수신이 실패했습니다",
-            cls.PROCESSING_DATA: "드라이버가 인쇄 데이터를 처리 중입니다",
-            cls.SENDING_DATA: "드라이버가 데이터를 프린터로 전송 중입니다",
-            0x00000002: "인쇄 진행 중",  # 추가: 프린터 상태 코드 0x00000002,
-        }
-        return descriptions.get(status_code, f"알 수 없는 상태 코드: 0x{status_code:08X}")
+        """상태 코드에 대한 설명 반환 (공통 상태 코드 표 사용)"""
+        from .status import DEFAULT_DECODER
+        return DEFAULT_DECODER.decode(status_code).description
 
 
 # P720L/P728L/P520L/P750L 전용 추가 오류 코드
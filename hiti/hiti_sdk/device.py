@@ -5,6 +5,7 @@ HiTi 프린터와 직접 통신하기 위한 DLL 인터페이스 및 기본 장
 import os
 import sys
 import logging
+import threading
 import time
 from pathlib import Path
 import ctypes
@@ -13,11 +14,28 @@ from cffi import FFI
 
 from .constants import DeviceStatus, RibbonType, PrintCommand, DeviceInfoType
 from .exceptions import PrinterError, ConnectionError, DeviceError, DLLError
+from .monitor import StatusMonitor
+from .models import get_capabilities, DEFAULT_CAPABILITIES
+from .status import get_decoder, DEFAULT_DECODER, PrinterStatus
+from .info import DeviceInfoCache
+from .history import CompletionTracker, DurationHistory
+from . import tracing
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
 
+# 장치 정보 유형별 버퍼 크기 (바이트)
+INFO_BUFFER_SIZES = {
+    DeviceInfoType.MFG_SERIAL: 256,
+    DeviceInfoType.MODEL_NAME: 256,
+    DeviceInfoType.FIRMWARE_VERSION: 256,
+    DeviceInfoType.RIBBON_INFO: 8,   # 2개의 DWORD
+    DeviceInfoType.PRINT_COUNT: 4,   # 1개의 DWORD
+    DeviceInfoType.CUTTER_COUNT: 4,  # 1개의 DWORD
+}
+
+
 class HITI_USB_PRINTER(Structure):
     """HiTi USB 프린터 구조체"""
     _fields_ = [
@@ -64,6 +82,60 @@ class BITMAP(Structure):
 
 class HiTiDll:
     """HiTi 프린터 DLL 래퍼 클래스"""
+    # 프로세스 전체에서 공유하는 DLL 인스턴스 (경로별)
+    _shared = {}
+    _shared_lock = threading.Lock()
+    
+    @classmethod
+    def shared(cls, dll_path=None):
+        """
+        프로세스 전체에서 공유하는 DLL 인스턴스를 반환합니다.
+        
+        처음 호출될 때 DLL을 로드하고 함수 원형을 설정하며, 이후에는 같은 인스턴스를
+        반환합니다. 여러 스레드에서 동시에 호출해도 DLL은 한 번만 로드됩니다.
+        
+        Args:
+            dll_path (str, optional): DLL 경로. None인 경우 기본 위치에서 검색
+            
+        Returns:
+            HiTiDll: 공유 DLL 인스턴스
+            
+        Raises:
+            DLLError: DLL 로드 실패 시
+        """
+        key = dll_path if dll_path is None else os.path.abspath(dll_path)
+        
+        dll = cls._shared.get(key)
+        if dll is not None:
+            return dll
+        
+        with cls._shared_lock:
+            dll = cls._shared.get(key)
+            if dll is None:
+                if dll_path is None and os.environ.get("HITI_SDK_SIMULATOR"):
+                    # 프린터 없이 실행 (시뮬레이터 사용)
+                    from .simulator import SimulatedHiTiDll
+                    dll = SimulatedHiTiDll()
+                    logger.info("HiTi SDK 시뮬레이터 사용")
+                else:
+                    dll = cls(dll_path)
+                cls._shared[key] = dll
+            return dll
+    
+    @classmethod
+    def set_shared(cls, dll, dll_path=None):
+        """
+        공유 DLL 인스턴스를 교체합니다 (시뮬레이터 등 다른 백엔드 사용 시).
+        이미 생성된 HiTiDevice에는 영향을 주지 않습니다.
+        
+        Args:
+            dll: HiTiDll과 같은 함수를 제공하는 객체
+            dll_path (str, optional): 교체할 DLL 경로. None인 경우 기본 DLL
+        """
+        key = dll_path if dll_path is None else os.path.abspath(dll_path)
+        with cls._shared_lock:
+            cls._shared[key] = dll
+    
     def __init__(self, dll_path=None):
         """HiTi SDK DLL을 로드하고 필요한 함수를 초기화합니다."""
         if dll_path is None:
@@ -245,14 +317,105 @@ class HiTiDevice:
         self.model_no = model_no
         self.index_no = index_no
         
+        # 같은 장치에 대한 DLL 호출 직렬화
+        self._lock = threading.RLock()
+        self._monitor = None
+        self._capabilities = None
+        self._decoder = None
+        self._model_retry_at = 0.0  # 모델 이름 조회 실패 후 다시 조회할 시각
+        self._info = None
+        self.tracker = CompletionTracker()
+        self._info_buf = (ctypes.c_ubyte * max(INFO_BUFFER_SIZES.values()))()
+        self._info_len = wintypes.DWORD(0)
+        
         try:
-            # DLL 로드
-            self.dll = HiTiDll()
+            # 공유 DLL 사용 (처음 한 번만 로드)
+            self.dll = HiTiDll.shared()
             logger.info(f"장치 초기화 성공: {printer_name}")
         except DLLError as e:
             logger.error(f"장치 초기화 실패: {e}")
             raise
     
+    @property
+    def monitor(self):
+        """장치 상태 모니터 (처음 사용할 때 생성)"""
+        with self._lock:
+            if self._monitor is None:
+                self._monitor = StatusMonitor(self)
+            return self._monitor
+    
+    @property
+    def info(self):
+        """장치 정보 캐시 (처음 사용할 때 생성)"""
+        with self._lock:
+            if self._info is None:
+                self._info = DeviceInfoCache(self)
+            return self._info
+    
+    def _model_name(self):
+        """
+        모델 이름 조회. 실패하면 None을 반환하고, 장치 정보 유효 시간 동안은 다시 조회하지 않음
+        (절전 중이거나 연결 직후 일시적으로 실패할 수 있음)
+        """
+        with self._lock:
+            if time.time() < self._model_retry_at:
+                return None
+            try:
+                return self.info.get(DeviceInfoType.MODEL_NAME)
+            except Exception as e:
+                self._model_retry_at = time.time() + self.info.ttl
+                logger.warning(f"모델 이름 조회 실패, {self.info.ttl:.0f}초 후 다시 조회: {e}")
+                return None
+    
+    @property
+    def capabilities(self):
+        """모델 기능 (모델 이름을 확인할 때까지는 DEFAULT_CAPABILITIES를 반환하고 저장하지 않음)"""
+        capabilities = self._capabilities
+        if capabilities is not None:
+            return capabilities
+        with self._lock:
+            if self._capabilities is None:
+                model_name = self._model_name()
+                if model_name is None:
+                    return DEFAULT_CAPABILITIES
+                self._capabilities = get_capabilities(model_name)
+                logger.debug(f"모델 기능: {model_name} -> {self._capabilities}")
+            return self._capabilities
+    
+    @property
+    def status_decoder(self):
+        """상태 코드 해석기 (모델 이름을 확인할 때까지는 DEFAULT_DECODER를 반환하고 저장하지 않음)"""
+        decoder = self._decoder
+        if decoder is not None:
+            return decoder
+        with self._lock:
+            if self._decoder is None:
+                model_name = self._model_name()
+                if model_name is None:
+                    return DEFAULT_DECODER
+                self._decoder = get_decoder(model_name)
+                logger.debug(f"상태 코드 해석기: {model_name} -> {self._decoder}")
+            return self._decoder
+    
+    def decode_status(self, status_code):
+        """
+        상태 코드를 이 장치의 모델에 맞게 해석합니다.
+        
+        Args:
+            status_code (int): 상태 코드
+        
+        Returns:
+            DecodedStatus: 해석된 상태 (상태, 심각도, 복구 가능 여부, 분류, 설명)
+        """
+        return self.status_decoder.decode(status_code)
+    
+    def close(self):
+        """상태 모니터 스레드를 종료합니다."""
+        with self._lock:
+            monitor, self._monitor = self._monitor, None
+        if monitor is not None:
+            monitor.stop()
+    
     def check_status(self):
         """
         프린터 상태를 확인합니다.
@@ -267,22 +430,18 @@ class HiTiDevice:
             status = wintypes.DWORD(0)
             printer_name_bytes = self.printer_name.encode('utf-8')
             
-            result = self.dll.check_printer_status(printer_name_bytes, byref(status))
+            with self._lock:
+                result = self.dll.check_printer_status(printer_name_bytes, byref(status))
             
             if result != 0:
                 raise DeviceError(f"프린터 상태 확인 실패", result)
             
             status_code = status.value
+            decoded = self.decode_status(status_code)
+            status_desc = decoded.description
             
-            # 특수 상태 코드 처리
-            if status_code == 0x00000002:
-                # 0x00000002는 일부 HiTi 프린터에서 사용하는 인쇄 진행 중 상태 코드
-                # 이것은 정상적인 상태이므로 오류로 처리하지 않음
-                status_desc = "인쇄 진행 중"
-                logger.debug(f"프린터 상태: {status_desc} (0x{status_code:08X})")
-                return status_code, status_desc
-                
-            status_desc = DeviceStatus.get_description(status_code)
+            # 진행 중인 인쇄가 끝났으면 소요 시간 기록
+            self.tracker.observe(decoded)
             
             logger.debug(f"프린터 상태: {status_desc} (0x{status_code:08X})")
             
@@ -308,7 +467,8 @@ class HiTiDevice:
         try:
             printer_name_bytes = self.printer_name.encode('utf-8')
             
-            result = self.dll.do_command(printer_name_bytes, command)
+            with self._lock:
+                result = self.dll.do_command(printer_name_bytes, command)
             
             if result != 0:
                 raise DeviceError(f"명령 전송 실패 (명령: {command})", result)
@@ -337,26 +497,21 @@ class HiTiDevice:
             printer_name_bytes = self.printer_name.encode('utf-8')
             
             # 정보 유형에 따라 버퍼 크기 결정
-            if info_type in [DeviceInfoType.MFG_SERIAL, DeviceInfoType.MODEL_NAME, DeviceInfoType.FIRMWARE_VERSION]:
-                buffer_size = 256
-                data_buf = (ctypes.c_ubyte * buffer_size)()
-            elif info_type == DeviceInfoType.RIBBON_INFO:
-                buffer_size = 8  # 2개의 DWORD (8바이트)
-                data_buf = (ctypes.c_ubyte * buffer_size)()
-            elif info_type in [DeviceInfoType.PRINT_COUNT, DeviceInfoType.CUTTER_COUNT]:
-                buffer_size = 4  # 1개의 DWORD (4바이트)
-                data_buf = (ctypes.c_ubyte * buffer_size)()
-            else:
+            buffer_size = INFO_BUFFER_SIZES.get(info_type)
+            if buffer_size is None:
                 raise ValueError(f"지원하지 않는 정보 유형: {info_type}")
             
-            data_len = wintypes.DWORD(buffer_size)
-            
-            result = self.dll.get_device_info(
-                printer_name_bytes,
-                info_type,
-                data_buf,
-                byref(data_len)
-            )
+            # 장치별 버퍼를 재사용 (호출은 장치 잠금으로 직렬화됨)
+            with self._lock:
+                ctypes.memset(self._info_buf, 0, buffer_size)
+                self._info_len.value = buffer_size
+                result = self.dll.get_device_info(
+                    printer_name_bytes,
+                    info_type,
+                    self._info_buf,
+                    byref(self._info_len)
+                )
+                data = bytes(self._info_buf[:buffer_size])
             
             if result != 0:
                 raise DeviceError(f"프린터 정보 조회 실패 (유형: {info_type})", result)
@@ -364,12 +519,12 @@ class HiTiDevice:
             # 결과 데이터 파싱
             if info_type in [DeviceInfoType.MFG_SERIAL, DeviceInfoType.MODEL_NAME, DeviceInfoType.FIRMWARE_VERSION]:
                 # 문자열 데이터
-                return ctypes.cast(data_buf, c_char_p).value.decode('utf-8', errors='ignore')
+                return data.split(b'\0', 1)[0].decode('utf-8', errors='ignore')
             
             elif info_type == DeviceInfoType.RIBBON_INFO:
                 # 리본 정보 (2개의 DWORD)
-                ribbon_type = int.from_bytes(data_buf[0:4], byteorder='little')
-                ribbon_count = int.from_bytes(data_buf[4:8], byteorder='little')
+                ribbon_type = int.from_bytes(data[0:4], byteorder='little')
+                ribbon_count = int.from_bytes(data[4:8], byteorder='little')
                 
                 return {
                     "type": ribbon_type,
@@ -379,12 +534,44 @@ class HiTiDevice:
             
             elif info_type in [DeviceInfoType.PRINT_COUNT, DeviceInfoType.CUTTER_COUNT]:
                 # 카운트 정보 (1개의 DWORD)
-                return int.from_bytes(data_buf[0:4], byteorder='little')
+                return int.from_bytes(data[0:4], byteorder='little')
         
         except Exception as e:
             logger.error(f"정보 조회 중 오류 발생: {e}")
             raise DeviceError(f"프린터 정보 조회 중 오류 발생: {e}")
     
+    def print_page(self, job_prop, bitmap):
+        """
+        한 페이지 인쇄를 요청합니다.
+        
+        Args:
+            job_prop (HITI_JOB_PROPERTY_RT): 인쇄 작업 속성
+            bitmap (BITMAP): 인쇄할 비트맵
+            
+        Returns:
+            int: DLL 반환 코드 (0 또는 1801이면 성공)
+        """
+        printer_name_bytes = self.printer_name.encode('utf-8')
+        
+        with self._lock:
+            result = self.dll.print_one_page(printer_name_bytes, byref(job_prop), byref(bitmap))
+            # 리본 잔량, 인쇄 매수가 바뀌므로 캐시된 값을 다시 조회하게 함
+            if self._info is not None:
+                self._info.invalidate()
+            
+            if result == 0 or result == 1801:
+                self.tracker.started(self.history_key(job_prop.dwPaperType, job_prop.dwPrintMode),
+                                     max(1, job_prop.shCopies))
+            return result
+    
+    def history_key(self, paper_type, print_mode):
+        """인쇄 소요 시간 기록 키 (모델 이름, 용지 유형, 인쇄 모드)"""
+        try:
+            model_name = self.info.get(DeviceInfoType.MODEL_NAME)
+        except Exception:
+            model_name = None
+        return DurationHistory.make_key(model_name, paper_type, print_mode)
+    
     def _get_ribbon_type_name(self, ribbon_type):
         """리본 유형 코드에 대한 이름 반환"""
         ribbon_types = {
@@ -418,9 +605,12 @@ class HiTiDevice:
         """
         프린터가 사용 가능할 때까지 대기합니다.
         
+        상태 모니터가 새 상태를 확인할 때마다 깨어나 판단하므로, 인쇄가 끝나면
+        다음 확인 주기 안에 바로 반환합니다.
+        
         Args:
             timeout (float): 최대 대기 시간(초)
-            check_interval (float): 상태 확인 간격(초)
+            check_interval (float): 대기 중 상태 확인 간격(초)
             
         Returns:
             bool: 프린터가 준비되었으면 True, 타임아웃 발생 시 False
@@ -428,44 +618,28 @@ class HiTiDevice:
         Raises:
             DeviceError: 상태 확인 중 오류 발생 시
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                status_code, _ = self.check_status()
-                
-                # 프린터 상태 확인
-                # BUSY, PRINTING, PROCESSING_DATA, SENDING_DATA 상태는 대기
-                if (status_code != DeviceStatus.BUSY and 
-                    status_code != DeviceStatus.PRINTING and 
-                    status_code != DeviceStatus.PROCESSING_DATA and
-                    status_code != DeviceStatus.SENDING_DATA and
-                    status_code != 0x00000002):  # 0x00000002 추가 - 일부 프린터에서 인쇄 중 상태
-                    
-                    # OK 상태면 준비 완료
-                    if status_code == 0:
-                        return True
-                        
-                    # 심각한 오류 상태 확인 - 0x8으로 시작하는 비트는 심각한 오류
-                    if (status_code & 0x00080000) or (status_code & 0x00008000):
-                        logger.warning(f"프린터 오류 상태: 0x{status_code:08X}")
-                        return False
-                        
-                    # 그 외 상태는 일시적인 상태로 간주하고 준비 완료로 판단
-                    logger.debug(f"프린터 상태: 0x{status_code:08X} - 준비된 것으로 간주")
-                    return True
-                
-                # 대기 상태면 계속 대기
-                logger.debug(f"프린터 대기 중: 0x{status_code:08X}")
-                
-            except Exception as e:
-                logger.error(f"프린터 상태 확인 중 오류: {e}")
-                time.sleep(check_interval * 2)  # 오류 발생 시 대기 시간 증가
-            
-            time.sleep(check_interval)
+        status_code = self.monitor.wait_for(
+            tracing.watch(lambda code: not self.decode_status(code).active),
+            timeout,
+            poll_interval=check_interval
+        )
         
-        # 타임아웃
-        logger.warning(f"프린터 준비 대기 타임아웃: {timeout}초")
-        return False
+        if status_code is None:
+            # 타임아웃
+            logger.warning(f"프린터 준비 대기 타임아웃: {timeout}초")
+            return False
+        
+        return self._is_ready_status(status_code)
+    
+    def _is_ready_status(self, status_code):
+        """대기 상태가 끝난 상태 코드가 인쇄 가능한 상태인지 판단"""
+        decoded = self.decode_status(status_code)
+        if decoded.state in (PrinterStatus.ERROR, PrinterStatus.OFFLINE):
+            logger.warning(f"프린터 오류 상태: {decoded.description} (0x{status_code:08X})")
+            return False
+        return True
+
+
 def find_printers():
     """
     연결된 HiTi USB 프린터 목록을 검색합니다.
@@ -477,8 +651,8 @@ def find_printers():
         ConnectionError: 프린터 검색 실패 시
     """
     try:
-        # DLL 로드
-        dll = HiTiDll()
+        # 공유 DLL 사용
+        dll = HiTiDll.shared()
         
         # 필요한 버퍼 크기 확인
         needed = wintypes.DWORD(0)
@@ -44,4 +44,9 @@ class ImageError(PrinterError):
 
 class DLLError(PrinterError):
     """DLL 로드 및 함수 호출 관련 예외"""
-    pass
\ No newline at end of file
+    pass
+
+
+class SpoolError(PrinterError):
+    """인쇄 스풀 파일 관련 예외"""
+    pass
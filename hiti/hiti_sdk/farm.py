@@ -0,0 +1,244 @@
+# hiti_sdk/farm.py
+"""
+여러 프로세스에서 인쇄 페이지를 준비하는 렌더링 팜
+
+prepare_image, create_split_image, PageTemplate.render를 작업 프로세스에서 실행합니다.
+결과 버퍼는 공유 메모리로 돌려받으므로 수십 MB의 바이트열을 피클로 주고받지 않습니다.
+공유 메모리 블록은 렌더링 팜이 소유하고 재사용하며, 렌더링 중이거나 결과가 아직 사용 중인
+블록 수를 제한하므로 요청이 몰리거나 결과를 쓰는 쪽이 느려도 메모리 사용량이 일정 범위를 넘지 않습니다.
+
+    farm = RenderFarm(max_workers=3)
+    printer = HiTiPrinter(page_cache=PageCache(renderer=farm))
+"""
+import os
+import weakref
+import logging
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .constants import PaperType, Orientation
+from .exceptions import ImageError
+from .image import ImageData, prepare_image, create_split_image
+from .layout import get_cells
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 작업 프로세스에 등록된 템플릿 (이름 -> PageTemplate)
+_worker_templates = {}
+
+
+def _init_worker(templates):
+    """작업 프로세스 초기화: 템플릿은 프로세스마다 한 번만 전달받음"""
+    _worker_templates.update(templates or {})
+
+
+def _render(shm_name, kind, args):
+    """작업 프로세스: 페이지를 준비하여 공유 메모리에 기록"""
+    if kind == "image":
+        image_data = prepare_image(*args)
+    elif kind == "split":
+        image_data = create_split_image(*args)
+    else:
+        name, values = args
+        image_data = _worker_templates[name].render(**values)
+
+    # 작업 프로세스는 부모와 같은 resource_tracker를 사용하므로 등록 해제는 부모가 unlink할 때 한 번만 일어남
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        shm.buf[:len(image_data.data_buffer)] = image_data.data_buffer
+    finally:
+        shm.close()
+    return image_data.width, image_data.height, image_data.bits_per_pixel
+
+
+def _buffer_size(width, height):
+    """4바이트 행 정렬 24비트 비트맵 크기"""
+    return ((width * 3 + 3) // 4) * 4 * height
+
+
+def _unlink(block):
+    """공유 메모리 이름 삭제 (이미 지워졌으면 무시)"""
+    try:
+        block.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _destroy(block):
+    """사용 중이 아닌 블록 해제 (참조 중인 버퍼가 없으므로 바로 닫을 수 있음)"""
+    block.close()
+    _unlink(block)
+
+
+class RenderFarm:
+    """
+    프로세스 풀 렌더러
+
+    submit_*()는 Future를 반환하고, prepare_image()/create_split_image()는 결과를
+    기다려 반환합니다 (PageCache의 renderer로 사용). 결과 ImageData의 버퍼는 렌더링 팜이
+    소유한 공유 메모리 블록이며, ImageData가 더 이상 참조되지 않으면 블록이 팜으로
+    돌아와 다음 작업에 재사용됩니다.
+
+    렌더링 중인 작업과 아직 참조 중인 결과를 합쳐 max_in_flight개까지만 허용하고,
+    넘으면 submit이 결과가 해제될 때까지 대기합니다. 결과를 오래 보관하려면 복사하세요
+    (PageCache는 복사본을 보관합니다).
+    """
+    def __init__(self, max_workers=None, max_in_flight=None, templates=None):
+        """
+        렌더링 팜을 초기화합니다. 작업 프로세스는 처음 작업을 받을 때 시작됩니다.
+
+        Args:
+            max_workers (int, optional): 작업 프로세스 수. None이면 CPU 수 - 1 (최소 1)
+            max_in_flight (int, optional): 렌더링 중이거나 참조 중인 최대 결과 수 (공유 메모리 블록 수).
+                넘으면 submit이 대기. None이면 max_workers * 2
+            templates (dict, optional): 이름 -> PageTemplate. 작업 프로세스마다 한 번만 전달됨
+        """
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 1) - 1)
+        self.max_in_flight = max_in_flight or self.max_workers * 2
+        self._templates = dict(templates or {})
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._blocks_lock = threading.Lock()
+        self._blocks = []   # 팜이 소유한 모든 공유 메모리 블록
+        self._free = []     # 사용 중이 아닌 블록
+        self._closed = False
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(self._templates,)
+        )
+        logger.info(f"렌더링 팜 시작: 작업 프로세스 {self.max_workers}개, 최대 동시 결과 {self.max_in_flight}개")
+
+    def _acquire_block(self, size):
+        """
+        슬롯을 확보하고 size 이상인 공유 메모리 블록을 가져옴
+
+        사용 중인 블록 수는 슬롯 수를 넘지 않으므로 블록도 max_in_flight개를 넘지 않습니다.
+        남는 블록이 모두 작으면 가장 작은 블록을 닫고 새로 만듭니다 (사용 중이 아니므로 안전).
+        """
+        # 렌더링 중이거나 참조 중인 결과가 많으면 해제될 때까지 대기 (메모리 상한)
+        self._slots.acquire()
+        try:
+            with self._blocks_lock:
+                if self._closed:
+                    raise ImageError("렌더링 팜이 종료되었습니다.")
+                fits = [block for block in self._free if block.size >= size]
+                if fits:
+                    block = min(fits, key=lambda block: block.size)
+                    self._free.remove(block)
+                    return block
+                if len(self._blocks) >= self.max_in_flight:
+                    smallest = min(self._free, key=lambda block: block.size)
+                    self._free.remove(smallest)
+                    self._blocks.remove(smallest)
+                    _destroy(smallest)
+
+                block = shared_memory.SharedMemory(create=True, size=size)
+                self._blocks.append(block)
+                return block
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _release_block(self, block):
+        """블록을 팜에 돌려주고 슬롯 반환 (결과 ImageData가 사라질 때 또는 렌더링 실패 시)"""
+        with self._blocks_lock:
+            self._free.append(block)
+        self._slots.release()
+
+    def _submit(self, kind, args, width, height):
+        """공유 메모리 블록을 확보하고 작업 프로세스에 작업을 보냄"""
+        block = self._acquire_block(_buffer_size(width, height))
+        try:
+            inner = self._executor.submit(_render, block.name, kind, args)
+        except BaseException:
+            self._release_block(block)
+            raise
+
+        result = Future()
+
+        def on_done(inner):
+            try:
+                width, height, bits_per_pixel = inner.result()
+            except BaseException as e:
+                self._release_block(block)
+                result.set_exception(e if isinstance(e, ImageError) else ImageError(f"렌더링 작업 실패: {e}"))
+                return
+
+            image_data = ImageData(width, height, block.buf[:_buffer_size(width, height)], bits_per_pixel)
+            # 블록은 팜이 계속 소유하므로 닫지 않고 돌려받기만 함 (참조 중인 버퍼를 닫는 일이 없음)
+            weakref.finalize(image_data, self._release_block, block)
+            result.set_result(image_data)
+
+        inner.add_done_callback(on_done)
+        return result
+
+    def submit_image(self, image_path, paper_type=PaperType.PHOTO_4X6, orientation=Orientation.PORTRAIT):
+        """
+        prepare_image를 작업 프로세스에서 실행합니다.
+
+        Returns:
+            Future: ImageData 또는 ImageError를 담는 Future
+        """
+        width, height = PaperType.get_dimensions(paper_type)
+        if orientation == Orientation.LANDSCAPE:
+            width, height = height, width
+        return self._submit("image", (image_path, paper_type, orientation), width, height)
+
+    def submit_split(self, image_paths, paper_type=PaperType.PHOTO_6X9_SPLIT_2UP, orientation=Orientation.PORTRAIT):
+        """
+        create_split_image를 작업 프로세스에서 실행합니다.
+
+        Returns:
+            Future: ImageData 또는 ImageError를 담는 Future
+        """
+        width, height, _ = get_cells(paper_type, orientation)
+        return self._submit("split", (list(image_paths), paper_type, orientation), width, height)
+
+    def submit_template(self, name, **values):
+        """
+        등록된 템플릿을 작업 프로세스에서 렌더링합니다.
+
+        Args:
+            name (str): 생성할 때 templates로 등록한 템플릿 이름
+            **values: PageTemplate.render와 같은 영역 값
+
+        Returns:
+            Future: ImageData 또는 ImageError를 담는 Future
+        """
+        template = self._templates.get(name)
+        if template is None:
+            raise ImageError(f"등록되지 않은 템플릿: {name}")
+        return self._submit("template", (name, values), template.width, template.height)
+
+    def prepare_image(self, image_path, paper_type=PaperType.PHOTO_4X6, orientation=Orientation.PORTRAIT):
+        """prepare_image와 같지만 작업 프로세스에서 실행하고 결과를 기다립니다."""
+        return self.submit_image(image_path, paper_type, orientation).result()
+
+    def create_split_image(self, image_paths, paper_type=PaperType.PHOTO_6X9_SPLIT_2UP,
+                           orientation=Orientation.PORTRAIT):
+        """create_split_image와 같지만 작업 프로세스에서 실행하고 결과를 기다립니다."""
+        return self.submit_split(image_paths, paper_type, orientation).result()
+
+    def shutdown(self, wait=True):
+        """
+        작업 프로세스를 종료하고 사용 중이 아닌 공유 메모리 블록을 해제합니다.
+        아직 참조 중인 결과의 블록은 이름만 지우고, 매핑은 결과가 해제된 뒤 다시
+        shutdown()을 호출하거나 프로세스가 끝날 때 해제됩니다.
+        """
+        self._executor.shutdown(wait=wait)
+        with self._blocks_lock:
+            self._closed = True
+            free, self._free = self._free, []
+            for block in free:
+                self._blocks.remove(block)
+                _destroy(block)
+            for block in self._blocks:
+                _unlink(block)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
@@ -0,0 +1,186 @@
+# hiti_sdk/history.py
+"""
+인쇄 소요 시간 기록과 완료 시각 예측
+"""
+import json
+import time
+import logging
+import threading
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 새 측정값의 반영 비율 (지수 이동 평균)
+DEFAULT_ALPHA = 0.3
+
+
+class DurationHistory:
+    """
+    모델, 용지 유형, 인쇄 모드별 한 장당 인쇄 소요 시간 기록
+
+    인쇄 요청부터 프린터가 다시 준비 상태가 될 때까지 걸린 시간을 장 수로 나누어
+    지수 이동 평균으로 보관합니다. 같은 모델의 프린터는 기록을 공유합니다.
+    """
+    def __init__(self, alpha=DEFAULT_ALPHA):
+        """
+        소요 시간 기록을 초기화합니다.
+
+        Args:
+            alpha (float): 새 측정값의 반영 비율 (0~1)
+        """
+        self.alpha = alpha
+        self._entries = {}  # (model, paper_type, print_mode) -> [평균(초), 측정 횟수]
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model_name, paper_type, print_mode):
+        """기록 키 생성"""
+        return (model_name or "", int(paper_type), int(print_mode))
+
+    def record(self, key, seconds, pages=1):
+        """
+        측정된 소요 시간을 기록합니다.
+
+        Args:
+            key (tuple): make_key()로 만든 키
+            seconds (float): 인쇄 요청부터 완료까지 걸린 시간(초)
+            pages (int): 그동안 인쇄된 장 수
+        """
+        per_page = seconds / max(1, pages)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._entries[key] = [per_page, 1]
+            else:
+                entry[0] += self.alpha * (per_page - entry[0])
+                entry[1] += 1
+        logger.debug(f"인쇄 소요 시간 기록: {key} {per_page:.2f}초/장")
+
+    def estimate(self, key, pages=1):
+        """
+        예상 소요 시간을 반환합니다.
+
+        Args:
+            key (tuple): make_key()로 만든 키
+            pages (int): 인쇄할 장 수
+
+        Returns:
+            float: 예상 소요 시간(초). 기록이 없으면 None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            return entry[0] * max(1, pages)
+
+    def save(self, path):
+        """기록을 JSON 파일로 저장합니다."""
+        with self._lock:
+            rows = [[model, paper_type, print_mode, seconds, count]
+                    for (model, paper_type, print_mode), (seconds, count) in self._entries.items()]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False)
+
+    def load(self, path):
+        """save()로 저장한 기록을 불러옵니다. 같은 키의 기존 기록은 교체됩니다."""
+        with open(path, encoding="utf-8") as f:
+            rows = json.load(f)
+        with self._lock:
+            for model, paper_type, print_mode, seconds, count in rows:
+                self._entries[(model, paper_type, print_mode)] = [seconds, count]
+
+    def stats(self):
+        """키별 (평균 소요 시간(초/장), 측정 횟수) 반환"""
+        with self._lock:
+            return {key: tuple(entry) for key, entry in self._entries.items()}
+
+
+# 프로세스 전체에서 공유하는 기본 기록
+default_history = DurationHistory()
+
+
+class CompletionTracker:
+    """
+    장치 하나의 진행 중인 인쇄를 추적하여 완료 예상 시각을 계산하고,
+    완료되면 소요 시간을 DurationHistory에 기록합니다.
+    """
+    def __init__(self, history=None):
+        """
+        Args:
+            history (DurationHistory, optional): 기록할 곳. None이면 default_history
+        """
+        self.history = history if history is not None else default_history
+        self._key = None
+        self._started = 0.0
+        self._pages = 0
+        self._seen_active = False
+        self._expected_at = None
+        self._lock = threading.Lock()
+
+    def started(self, key, pages):
+        """
+        인쇄 요청을 알립니다. 진행 중인 같은 종류의 인쇄가 있으면 이어서 쌓입니다.
+
+        Args:
+            key (tuple): DurationHistory.make_key()로 만든 키
+            pages (int): 이번 요청의 장 수
+        """
+        now = time.time()
+        with self._lock:
+            if self._key != key:
+                # 다른 종류의 인쇄가 섞이면 측정값이 의미 없으므로 새로 시작
+                self._key = key
+                self._started = now
+                self._pages = 0
+                self._seen_active = False
+            self._pages += pages
+
+            estimate = self.history.estimate(key, pages)
+            if estimate is None:
+                self._expected_at = None
+            else:
+                self._expected_at = max(now, self._expected_at or now) + estimate
+
+    def observe(self, decoded):
+        """
+        확인된 상태를 알립니다. 진행 중인 인쇄가 준비 상태로 끝나면 소요 시간을 기록하고,
+        오류로 끝나면 기록하지 않고 추적을 멈춥니다.
+
+        Args:
+            decoded (DecodedStatus): 해석된 상태
+        """
+        if self._key is None:
+            return
+
+        with self._lock:
+            if self._key is None:
+                return
+            if decoded.active:
+                self._seen_active = True
+                return
+            if decoded.ready and not self._seen_active:
+                # 요청 직후 아직 인쇄가 시작되지 않은 상태
+                return
+            key, elapsed, pages = self._key, time.time() - self._started, self._pages
+            self._key = None
+            self._expected_at = None
+
+        if decoded.ready:
+            self.history.record(key, elapsed, pages)
+
+    @property
+    def expected_at(self):
+        """진행 중인 인쇄의 완료 예상 시각 (time.time() 기준). 모르면 None"""
+        return self._expected_at
+
+    def eta(self):
+        """
+        진행 중인 인쇄가 끝날 때까지 남은 예상 시간(초)을 반환합니다.
+
+        Returns:
+            float: 남은 시간(초, 예상 시각이 지났으면 0). 진행 중인 인쇄가 없거나 기록이 없으면 None
+        """
+        expected_at = self._expected_at
+        if expected_at is None:
+            return None
+        return max(0.0, expected_at - time.time())
@@ -2,19 +2,42 @@
 """
 HiTi 프린터를 위한 이미지 처리 기능
 """
+import io
 import os
 import sys
+import mmap
 import ctypes
+import struct
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PIL import Image
+from collections import namedtuple
+from PIL import Image, ImageFile, ImageOps, ImageDraw, ImageFont
 
 from .constants import PaperType, Orientation
 from .exceptions import ImageError
+from .layout import get_cells
+from . import tracing
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 분할 인쇄 하위 이미지 준비에 사용할 기본 스레드 수
+DEFAULT_SPLIT_WORKERS = 3
+
+# 칸 회전 각도별 변환
+_ROTATIONS = {
+    90: Image.ROTATE_90,
+    180: Image.ROTATE_180,
+    270: Image.ROTATE_270,
+}
+
+# 24비트 BMP/DIB 헤더: BITMAPFILEHEADER, BITMAPINFOHEADER (V4, V5 헤더도 앞부분은 같음)
+_BMP_FILE_HEADER = struct.Struct("<2sIHHI")
+_BMP_INFO_HEADER = struct.Struct("<IiiHHIIiiII")
+_BI_RGB = 0
+_BMP_EXTENSIONS = (".bmp", ".dib")
+
 
 class ImageData:
     """HiTi 프린터에서 사용하는 이미지 데이터 클래스"""
@@ -25,17 +48,37 @@ class ImageData:
         Args:
             width (int): 이미지 너비 (픽셀)
             height (int): 이미지 높이 (픽셀)
-            data_buffer (bytes): BGR 형식의 이미지 데이터
+            data_buffer (bytearray): BGR 형식의 이미지 데이터 (쓰기 가능한 버퍼)
             bits_per_pixel (int): 픽셀당 비트 수 (기본값: 24)
         """
+        # ctypes에서 복사 없이 참조하려면 쓰기 가능한 버퍼가 필요
+        if memoryview(data_buffer).readonly:
+            data_buffer = bytearray(data_buffer)
+        
         self.width = width
         self.height = height
         self.data_buffer = data_buffer
         self.bits_per_pixel = bits_per_pixel
         self.width_bytes = ((width * (bits_per_pixel // 8) + 3) // 4) * 4  # 4바이트 정렬
+        self._bitmap = None
     
+    def copy(self):
+        """
+        버퍼를 복사한 ImageData를 반환합니다.
+        공유 메모리 등 빌린 버퍼의 결과를 오래 보관할 때 사용합니다.
+        """
+        return ImageData(self.width, self.height, bytearray(self.data_buffer), self.bits_per_pixel)
+
     def to_bitmap(self):
-        """이미지 데이터를 BITMAP 구조체로 변환"""
+        """
+        이미지 데이터를 BITMAP 구조체로 변환
+        
+        비트맵은 data_buffer를 복사 없이 직접 가리키며, 한 번 생성된 구조체는
+        재사용됩니다. 반환된 구조체가 사용되는 동안 data_buffer를 수정하지 마세요.
+        """
+        if self._bitmap is not None:
+            return self._bitmap
+        
         from .device import BITMAP
         
         # 비트맵 구조체 설정
@@ -47,25 +90,341 @@ class ImageData:
         bitmap.bmPlanes = 1
         bitmap.bmBitsPixel = self.bits_per_pixel
         
-        # 비트맵 데이터를 C 메모리로 복사
+        # 비트맵 데이터를 복사 없이 C 배열로 참조
         buffer_size = len(self.data_buffer)
-        c_buffer = (ctypes.c_ubyte * buffer_size)()
-        ctypes.memmove(c_buffer, self.data_buffer, buffer_size)
+        c_buffer = (ctypes.c_ubyte * buffer_size).from_buffer(self.data_buffer)
         
-        bitmap.bmBits = ctypes.cast(c_buffer, ctypes.c_void_p)
+        bitmap.bmBits = ctypes.addressof(c_buffer)
         
         # 참조 유지 (GC 방지)
         bitmap._buffer = c_buffer
         
+        self._bitmap = bitmap
         return bitmap
 
 
+def _to_bgr_buffer(img):
+    """
+    RGB 이미지를 HiTi 프린터용 BGR 비트맵 데이터로 변환합니다.
+    
+    Pillow의 raw 인코더 출력을 미리 할당한 버퍼에 바로 기록하므로 전체 크기의
+    중간 사본이 생기지 않습니다. 각 행은 4바이트 경계로 정렬되고 남는 패딩
+    바이트는 0으로 채워집니다.
+    
+    Args:
+        img (PIL.Image.Image): RGB 모드 이미지
+        
+    Returns:
+        tuple: (width, height, rowsize, bitmap_data)
+    """
+    img.load()
+    width, height = img.size
+    rowsize = ((width * 3 + 3) // 4) * 4  # 4바이트 경계로 정렬된 행 크기
+    
+    bitmap_data = bytearray(rowsize * height)
+    view = memoryview(bitmap_data)
+    
+    # RGB -> BGR 변환 및 행 정렬을 인코더에서 일괄 처리
+    encoder = Image._getencoder(img.mode, "raw", ("BGR", rowsize))
+    encoder.setimage(img.im, (0, 0) + img.size)
+    
+    bufsize = max(ImageFile.MAXBLOCK, width * 4)
+    offset = 0
+    while True:
+        _, errcode, chunk = encoder.encode(bufsize)
+        view[offset:offset + len(chunk)] = chunk
+        offset += len(chunk)
+        if errcode:
+            break
+    
+    if errcode < 0:
+        raise ImageError(f"BGR 변환 중 인코더 오류 발생 ({errcode})")
+    
+    return width, height, rowsize, bitmap_data
+
+
+class BGRArray(namedtuple("BGRArray", ["array"])):
+    """
+    BGR 순서 NumPy 배열 (OpenCV 프레임 등)
+    
+    NumPy 배열은 RGB(A) 순서로 해석하므로 BGR 배열은 BGRArray(frame)로 감싸서 전달합니다.
+    용지 크기와 같은 (높이, 너비, 3) uint8 배열은 색 변환 없이 행 정렬만 하여 사용합니다.
+    """
+    __slots__ = ()
+
+
+def _is_path(source):
+    return isinstance(source, (str, os.PathLike))
+
+
+def _is_array(source):
+    # PIL 이미지도 __array_interface__를 제공하므로 먼저 구분
+    return not isinstance(source, Image.Image) and hasattr(source, "__array_interface__")
+
+
+def describe_source(source):
+    """
+    로그, 오류 메시지, PrintTrace에 사용할 이미지 입력 이름
+    
+    Args:
+        source: 이미지 파일 경로 또는 메모리 이미지
+        
+    Returns:
+        str: 파일 경로 또는 "<PIL 이미지 RGB 1240x1844>" 형태의 설명
+    """
+    if _is_path(source):
+        return os.fspath(source)
+    if isinstance(source, BGRArray):
+        return f"<BGR 배열 {tuple(source.array.shape)}>"
+    if isinstance(source, Image.Image):
+        return f"<PIL 이미지 {source.mode} {source.size[0]}x{source.size[1]}>"
+    if _is_array(source):
+        return f"<배열 {tuple(source.shape)}>"
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return f"<이미지 데이터 {memoryview(source).nbytes}B>"
+    return repr(source)
+
+
+def check_image_source(source):
+    """
+    이미지 입력을 확인합니다. 파일 경로이면 파일이 있는지, 그 외에는 지원하는 형식인지 확인합니다.
+    
+    지원하는 입력: 파일 경로, PIL 이미지, NumPy 배열(RGB/RGBA/흑백), BGRArray,
+    인코딩된 이미지 바이트(JPEG, PNG, BMP 등의 bytes, bytearray, memoryview)
+    
+    Raises:
+        ImageError: 파일이 없거나 지원하지 않는 입력인 경우
+    """
+    if _is_path(source):
+        if not os.path.exists(source):
+            raise ImageError(f"이미지 파일을 찾을 수 없습니다: {source}")
+    elif not (isinstance(source, (BGRArray, Image.Image, bytes, bytearray, memoryview)) or _is_array(source)):
+        raise ImageError(f"지원하지 않는 이미지 입력: {type(source).__name__}")
+
+
+def _contiguous(data):
+    """인코딩된 이미지 바이트를 연속된 버퍼로 반환 (연속되지 않은 memoryview만 복사)"""
+    return data if memoryview(data).c_contiguous else bytes(data)
+
+
+def _add_source_bytes(trace, source):
+    """PrintTrace에 원본 크기(파일 또는 인코딩된 데이터) 기록. 크기를 알 수 없는 메모리 이미지는 건너뜀"""
+    if trace is None:
+        return
+    if _is_path(source):
+        trace.add_bytes("source", os.path.getsize(source))
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        trace.add_bytes("source", memoryview(source).nbytes)
+
+
+def _array_to_image(array, bgr):
+    """NumPy 배열을 PIL 이미지로 변환 (bgr이면 BGR(A) 순서로 해석)"""
+    if str(array.dtype) != "uint8":
+        raise ImageError(f"uint8 배열만 지원합니다: {array.dtype}")
+    if not bgr:
+        return Image.fromarray(array)
+    
+    if array.ndim != 3 or array.shape[2] not in (3, 4):
+        raise ImageError(f"BGR 배열은 (높이, 너비, 3) 또는 (높이, 너비, 4) 형태여야 합니다: {array.shape}")
+    if not array.flags["C_CONTIGUOUS"]:
+        array = array.copy()
+    height, width, channels = array.shape
+    mode, rawmode = ("RGB", "BGR") if channels == 3 else ("RGBA", "BGRA")
+    return Image.frombuffer(mode, (width, height), array, "raw", rawmode, 0, 1)
+
+
+def _open_image(source, target_size):
+    """
+    이미지 입력을 PIL 이미지로 열고 목표 크기에 맞는 축소 디코딩을 설정합니다.
+    
+    JPEG은 DCT 단계에서 1/2, 1/4, 1/8 배율로 디코딩할 수 있으므로, 결과가
+    목표 크기 이상으로 유지되는 가장 작은 배율을 선택합니다. 최종 LANCZOS
+    리샘플링은 호출 측에서 그대로 수행합니다. JPEG이 아니면 아무 설정도 하지 않습니다.
+    PIL 이미지는 그대로 반환하므로 호출 측에서 닫지 않아야 합니다.
+    
+    Args:
+        source: 이미지 파일 경로, 인코딩된 이미지 바이트, PIL 이미지, NumPy 배열 또는 BGRArray
+        target_size (tuple): 최종 (너비, 높이)
+        
+    Returns:
+        PIL.Image.Image: 열린 이미지
+    """
+    if isinstance(source, Image.Image):
+        return source
+    if isinstance(source, BGRArray):
+        return _array_to_image(source.array, bgr=True)
+    if _is_array(source):
+        return _array_to_image(source, bgr=False)
+    
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(_contiguous(source))
+    img = Image.open(source)
+    original_size = img.size
+    
+    if img.draft(img.mode, target_size) is not None:
+        logger.debug(f"축소 디코딩 적용: {original_size} -> {img.size}")
+    
+    return img
+
+
+def _read_bmp_layout(head):
+    """
+    비압축 24비트 BMP/DIB 파일의 픽셀 배열 위치를 읽습니다.
+    
+    Args:
+        head (bytes): 파일 앞부분 (BMP_HEADER_SIZE 바이트)
+        
+    Returns:
+        tuple: (width, height, top_down, data_offset). 비압축 24비트 BMP/DIB가 아니면 None
+    """
+    if head[:2] == b"BM":
+        _, _, _, _, data_offset = _BMP_FILE_HEADER.unpack_from(head)
+        info_offset = _BMP_FILE_HEADER.size
+    else:
+        # 파일 헤더 없이 BITMAPINFOHEADER로 시작하는 DIB
+        data_offset = None
+        info_offset = 0
+    
+    if len(head) < info_offset + _BMP_INFO_HEADER.size:
+        return None
+    (info_size, width, height, planes, bit_count, compression,
+     _, _, _, colors_used, _) = _BMP_INFO_HEADER.unpack_from(head, info_offset)
+    if (info_size not in (40, 108, 124) or planes != 1 or bit_count != 24
+            or compression != _BI_RGB or width <= 0 or height == 0):
+        return None
+    
+    if data_offset is None:
+        data_offset = info_size + colors_used * 4
+    
+    # 높이가 음수이면 위에서 아래로 저장된 파일
+    return width, abs(height), height < 0, data_offset
+
+
+def _bmp_pixels_to_image_data(pixels, width, height, top_down, rowsize):
+    """BMP 픽셀 배열을 위에서 아래 순서의 비트맵으로 (위에서 아래로 저장된 배열은 그대로 사용)"""
+    if top_down:
+        return ImageData(width, height, pixels)
+    
+    bitmap_data = bytearray(rowsize * height)
+    view = memoryview(bitmap_data)
+    for row in range(height):
+        source = (height - 1 - row) * rowsize
+        view[row * rowsize:(row + 1) * rowsize] = pixels[source:source + rowsize]
+    return ImageData(width, height, bitmap_data)
+
+
+def _read_bottom_up_bmp(f, width, height, data_offset, rowsize):
+    """아래에서 위로 저장된 BMP 픽셀 배열을 파일에서 행 단위로 읽어 위에서 아래 순서로 배치"""
+    bitmap_data = bytearray(rowsize * height)
+    view = memoryview(bitmap_data)
+    f.seek(data_offset)
+    for row in range(height - 1, -1, -1):
+        if f.readinto(view[row * rowsize:(row + 1) * rowsize]) != rowsize:
+            return None
+    return ImageData(width, height, bitmap_data)
+
+
+def _print_ready_bmp(source, target_size):
+    """
+    목표 크기와 같은 비압축 24비트 BMP/DIB의 픽셀 배열을 그대로 비트맵으로 사용합니다.
+    
+    BMP 픽셀 배열은 이미 BGR 순서이고 행이 4바이트 경계로 정렬되어 있으므로 디코딩,
+    크기 조정, 변환이 모두 필요 없습니다. 위에서 아래로 저장된 파일(높이가 음수)은
+    복사 시 쓰기(ACCESS_COPY)로 매핑하여 비트맵이 파일을 직접 가리키며, 매핑은 반환한
+    ImageData가 해제될 때 함께 닫힙니다 (인쇄가 끝날 때까지 파일을 수정하지 마세요).
+    일반적인 아래에서 위로 저장된 파일은 매핑하지 않고 행 순서를 뒤집어 읽은 뒤 바로 닫습니다.
+    메모리의 BMP 바이트는 한 번 복사합니다.
+    
+    Args:
+        source: 이미지 파일 경로(.bmp, .dib만 확인) 또는 인코딩된 이미지 바이트
+        target_size (tuple): 용지 (너비, 높이)
+        
+    Returns:
+        ImageData: 준비된 이미지 데이터. 조건에 맞지 않으면 None (일반 경로로 처리)
+    """
+    header_size = _BMP_FILE_HEADER.size + _BMP_INFO_HEADER.size
+    
+    if _is_path(source):
+        # BMP가 아닌 파일은 열지 않고 일반 경로로 처리
+        if os.path.splitext(os.fspath(source))[1].lower() not in _BMP_EXTENSIONS:
+            return None
+        with open(source, "rb") as f:
+            layout = _read_bmp_layout(f.read(header_size))
+            if layout is None:
+                return None
+            file_size = os.fstat(f.fileno()).st_size
+            width, height, top_down, data_offset = layout
+            rowsize = ((width * 3 + 3) // 4) * 4
+            if (width, height) != tuple(target_size) or file_size < data_offset + rowsize * height:
+                # 잘린 파일은 Pillow가 오류를 보고하도록 일반 경로로 처리
+                return None
+            
+            with tracing.phase("map"):
+                if not top_down:
+                    return _read_bottom_up_bmp(f, width, height, data_offset, rowsize)
+                # 매핑은 ImageData의 버퍼(memoryview)만 참조하므로 ImageData와 함께 해제됨
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+                pixels = memoryview(mapped)[data_offset:data_offset + rowsize * height]
+                return ImageData(width, height, pixels)
+    
+    if not isinstance(source, (bytes, bytearray, memoryview)):
+        return None
+    # 연속되지 않은 버퍼는 바이트 단위로 볼 수 없으므로 일반 경로에서 복사하여 처리
+    if not memoryview(source).c_contiguous:
+        return None
+    
+    # 호출한 쪽 버퍼를 비트맵이 가리키지 않도록 읽기 전용으로 보고 복사
+    data = memoryview(source).cast("B").toreadonly()
+    layout = _read_bmp_layout(bytes(data[:header_size]))
+    if layout is None:
+        return None
+    width, height, top_down, data_offset = layout
+    rowsize = ((width * 3 + 3) // 4) * 4
+    if (width, height) != tuple(target_size) or len(data) < data_offset + rowsize * height:
+        return None
+    
+    with tracing.phase("map"):
+        return _bmp_pixels_to_image_data(data[data_offset:data_offset + rowsize * height],
+                                         width, height, top_down, rowsize)
+
+
+def _print_ready_bgr_array(source, target_size):
+    """
+    용지 크기와 같은 (높이, 너비, 3) uint8 BGRArray는 색 변환 없이 행 정렬만 하여 복사합니다.
+    
+    Returns:
+        ImageData: 준비된 이미지 데이터. 조건에 맞지 않으면 None (일반 경로로 처리)
+    """
+    if not isinstance(source, BGRArray):
+        return None
+    array = source.array
+    width, height = target_size
+    if str(array.dtype) != "uint8" or tuple(array.shape) != (height, width, 3):
+        return None
+    if not array.flags["C_CONTIGUOUS"]:
+        array = array.copy()
+    
+    with tracing.phase("bgr"):
+        pixels = memoryview(array).cast("B")
+        rowsize = ((width * 3 + 3) // 4) * 4
+        if rowsize == width * 3:
+            return ImageData(width, height, bytearray(pixels))
+        
+        bitmap_data = bytearray(rowsize * height)
+        view = memoryview(bitmap_data)
+        for row in range(height):
+            view[row * rowsize:row * rowsize + width * 3] = pixels[row * width * 3:(row + 1) * width * 3]
+        return ImageData(width, height, bitmap_data)
+
+
 def prepare_image(image_path, paper_type=PaperType.PHOTO_4X6, orientation=Orientation.PORTRAIT):
     """
-    이미지 파일을 HiTi 프린터 인쇄에 적합한 형식으로 준비합니다.
+    이미지를 HiTi 프린터 인쇄에 적합한 형식으로 준비합니다.
     
     Args:
-        image_path (str): 이미지 파일 경로
+        image_path (str | bytes | PIL.Image.Image | numpy.ndarray | BGRArray): 이미지 파일 경로,
+            인코딩된 이미지 바이트, PIL 이미지, RGB(A) NumPy 배열 또는 BGR 배열.
+            메모리 이미지는 디스크를 거치지 않고 바로 변환됩니다.
         paper_type (PaperType): 용지 유형
         orientation (Orientation): 인쇄 방향 (1=세로, 2=가로)
         
@@ -76,10 +435,6 @@ def prepare_image(image_path, paper_type=PaperType.PHOTO_4X6, orientation=Orient
         ImageError: 이미지 처리 실패 시
     """
     try:
-        # 이미지 로드
-        img = Image.open(image_path)
-        logger.info(f"이미지 로드: {image_path} (크기: {img.size}, 모드: {img.mode})")
-        
         # 용지 크기 가져오기
         paper_width, paper_height = PaperType.get_dimensions(paper_type)
         
@@ -87,47 +442,125 @@ def prepare_image(image_path, paper_type=PaperType.PHOTO_4X6, orientation=Orient
         if orientation == Orientation.LANDSCAPE:
             paper_width, paper_height = paper_height, paper_width
         
-        # 이미지 크기 조정
-        img = img.resize((paper_width, paper_height), Image.LANCZOS)
+        name = describe_source(image_path)
+        
+        # 인쇄용으로 미리 변환된 24비트 BMP/DIB나 용지 크기의 BGR 배열은 픽셀을 그대로 사용
+        image_data = (_print_ready_bmp(image_path, (paper_width, paper_height))
+                      or _print_ready_bgr_array(image_path, (paper_width, paper_height)))
+        if image_data is not None:
+            _add_source_bytes(tracing.current(), image_path)
+            logger.info(f"인쇄용 비트맵 사용: {name} ({image_data.width}x{image_data.height})")
+            return image_data
+        
+        # 이미지 로드 (JPEG은 용지 크기 이상인 가장 작은 배율로 디코딩)
+        with tracing.phase("decode"):
+            img = _open_image(image_path, (paper_width, paper_height))
+            img.load()
+        logger.info(f"이미지 로드: {name} (크기: {img.size}, 모드: {img.mode})")
+        
+        # 이미지 크기 조정 (이미 용지 크기이면 건너뜀)
+        if img.size != (paper_width, paper_height):
+            with tracing.phase("resize"):
+                img = img.resize((paper_width, paper_height), Image.LANCZOS)
         
         # RGB 모드로 변환
         if img.mode != 'RGB':
-            img = img.convert('RGB')
+            with tracing.phase("convert"):
+                img = img.convert('RGB')
         
         # 이미지 데이터 추출 (BGR 형식으로 변환, 4바이트 경계로 정렬)
-        width, height = img.size
-        rowsize = ((width * 3 + 3) // 4) * 4  # 4바이트 경계로 정렬된 행 크기
+        with tracing.phase("bgr"):
+            width, height, rowsize, bitmap_data = _to_bgr_buffer(img)
         
-        # 비트맵 데이터 생성
-        bitmap_data = bytearray(rowsize * height)
-        
-        # 이미지 데이터를 BGR 형식으로 변환
-        for y in range(height):
-            for x in range(width):
-                r, g, b = img.getpixel((x, y))
-                idx = y * rowsize + x * 3
-                bitmap_data[idx:idx+3] = bytes([b, g, r])  # RGB -> BGR
+        _add_source_bytes(tracing.current(), image_path)
         
-        # 메모리 누수 방지를 위해 이미지 객체 닫기
-        img.close()
+        # 메모리 누수 방지를 위해 이미지 객체 닫기 (호출한 쪽의 PIL 이미지는 닫지 않음)
+        if img is not image_path:
+            img.close()
         
         logger.info(f"이미지 준비 완료: {width}x{height}, {rowsize} 바이트/행, 24비트/픽셀")
         
-        return ImageData(width, height, bytes(bitmap_data))
+        return ImageData(width, height, bitmap_data)
         
     except Exception as e:
         logger.error(f"이미지 준비 중 오류 발생: {e}")
-        raise ImageError(f"이미지 '{image_path}' 처리 중 오류 발생: {e}")
+        if isinstance(e, ImageError):
+            raise
+        raise ImageError(f"이미지 '{describe_source(image_path)}' 처리 중 오류 발생: {e}")
+
+
+def _load_tile(image_path, cell, trace=None):
+    """
+    분할 인쇄용 하위 이미지를 열어 RGB로 변환하고 칸 크기와 회전에 맞게 조정
+    
+    작업 스레드에서 실행되므로 단계 기록에 사용할 PrintTrace를 trace로 받습니다.
+    """
+    # 90/270도 회전 칸은 회전 전 기준으로 가로세로가 바뀜
+    if cell.rotate in (90, 270):
+        size = (cell.height, cell.width)
+    else:
+        size = (cell.width, cell.height)
+    
+    with tracing.phase("decode", trace):
+        img = _open_image(image_path, size)
+        img.load()
+    
+    # RGB 모드로 변환
+    if img.mode != 'RGB':
+        with tracing.phase("convert", trace):
+            img = img.convert('RGB')
+    
+    # 이미지 크기 조정 (이미 칸 크기이면 건너뜀)
+    if img.size != size:
+        with tracing.phase("resize", trace):
+            img = img.resize(size, Image.LANCZOS)
+    
+    # 칸 방향에 맞게 회전
+    if cell.rotate:
+        with tracing.phase("rotate", trace):
+            img = img.transpose(_ROTATIONS[cell.rotate])
+    
+    _add_source_bytes(trace, image_path)
+    
+    return img
+
+
+def _blit_bgr(bitmap_data, rowsize, img, x, y):
+    """
+    RGB 이미지를 BGR로 변환하여 정렬된 비트맵 버퍼의 (x, y) 위치에 직접 기록합니다.
+    
+    Args:
+        bitmap_data (bytearray): 용지 전체 BGR 비트맵 버퍼
+        rowsize (int): 버퍼의 4바이트 정렬 행 크기
+        img (PIL.Image.Image): 배치할 RGB 이미지
+        x (int): 배치 위치 x (픽셀)
+        y (int): 배치 위치 y (픽셀)
+    """
+    tile_rowsize = img.size[0] * 3
+    tile_data = img.tobytes("raw", "BGR")
+    view = memoryview(bitmap_data)
+    
+    offset = y * rowsize + x * 3
+    for row in range(img.size[1]):
+        start = row * tile_rowsize
+        view[offset:offset + tile_rowsize] = tile_data[start:start + tile_rowsize]
+        offset += rowsize
 
 
-def create_split_image(image_paths, paper_type=PaperType.PHOTO_6X9_SPLIT_2UP, orientation=Orientation.PORTRAIT):
+def create_split_image(image_paths, paper_type=PaperType.PHOTO_6X9_SPLIT_2UP, orientation=Orientation.PORTRAIT,
+                       max_workers=DEFAULT_SPLIT_WORKERS):
     """
     여러 이미지를 하나의 용지에 분할 인쇄하기 위한 이미지를 생성합니다.
     
+    배치는 layout.LAYOUTS 테이블에서 가져오며, 하위 이미지의 디코딩과 크기 조정은
+    Pillow가 GIL을 해제하므로 스레드 풀에서 동시에 처리합니다. 준비된 하위 이미지는
+    중간 합성 이미지 없이 최종 BGR 비트맵 버퍼에 바로 기록됩니다.
+    
     Args:
-        image_paths (list): 이미지 파일 경로 목록
+        image_paths (list): 이미지 파일 경로 또는 메모리 이미지 목록 (prepare_image와 같은 형식)
         paper_type (PaperType): 용지 유형 
         orientation (Orientation): 인쇄 방향
+        max_workers (int): 하위 이미지 준비에 사용할 최대 스레드 수 (1이면 순차 처리)
         
     Returns:
         ImageData: 처리된 이미지 데이터
@@ -136,96 +569,276 @@ def create_split_image(image_paths, paper_type=PaperType.PHOTO_6X9_SPLIT_2UP, or
         ImageError: 이미지 처리 실패 시
     """
     try:
-        # 전체 용지 크기
-        paper_width, paper_height = PaperType.get_dimensions(paper_type)
+        # 용지 크기와 칸 좌표 (배치별로 한 번만 계산됨)
+        paper_width, paper_height, cells = get_cells(paper_type, orientation)
         
-        # 인쇄 방향에 따라 용지 크기 조정
-        if orientation == Orientation.LANDSCAPE:
-            paper_width, paper_height = paper_height, paper_width
-        
-        # 분할 방식 확인
-        if paper_type == PaperType.PHOTO_6X9_SPLIT_2UP:
-            # 6x9 용지에 4x6 사진 2장 배치 (가로 분할)
-            image_count = 2
-            sub_width = paper_width
-            sub_height = paper_height // 2
-            layout = 'horizontal'
-        elif paper_type == PaperType.PHOTO_4X6_SPLIT_2UP:
-            # 4x6 용지에 2x6 사진 2장 배치 (세로 분할)
-            image_count = 2
-            sub_width = paper_width // 2
-            sub_height = paper_height
-            layout = 'vertical'
-        elif paper_type == PaperType.PHOTO_5X7_SPLIT_2UP:
-            # 5x7 용지에 5x3.5 사진 2장 배치 (가로 분할)
-            image_count = 2
-            sub_width = paper_width
-            sub_height = paper_height // 2
-            layout = 'horizontal'
-        elif paper_type == PaperType.PHOTO_4X6_SPLIT_3UP:
-            # 4x6 용지에 1.3x6 사진 3장 배치 (세로 분할)
-            image_count = 3
-            sub_width = paper_width // 3
-            sub_height = paper_height
-            layout = 'vertical'
-        else:
+        image_count = len(cells)
+        if image_count < 2:
             raise ValueError(f"지원하지 않는 분할 용지 유형: {paper_type}")
         
-        # 전체 이미지 생성
-        composite = Image.new('RGB', (paper_width, paper_height))
-        
         # 이미지 개수 확인
         if len(image_paths) < image_count:
             logger.warning(f"이미지가 부족합니다: {len(image_paths)}/{image_count}")
         elif len(image_paths) > image_count:
             logger.warning(f"이미지가 초과됩니다: {len(image_paths)}/{image_count}. 처음 {image_count}개만 사용합니다.")
         
-        # 이미지 배치
-        for i, path in enumerate(image_paths[:image_count]):
-            img = Image.open(path)
-            
-            # RGB 모드로 변환
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # 이미지 크기 조정
-            img = img.resize((sub_width, sub_height), Image.LANCZOS)
-            
-            # 이미지 위치 계산
-            if layout == 'horizontal':
-                # 가로 분할
-                x, y = 0, i * sub_height
-            else:
-                # 세로 분할
-                x, y = i * sub_width, 0
-            
-            # 이미지 배치
-            composite.paste(img, (x, y))
-            
-            # 메모리 누수 방지
-            img.close()
-        
-        # 이미지 데이터 추출 (BGR 형식으로 변환, 4바이트 경계로 정렬)
-        width, height = composite.size
-        rowsize = ((width * 3 + 3) // 4) * 4  # 4바이트 경계로 정렬된 행 크기
-        
-        # 비트맵 데이터 생성
-        bitmap_data = bytearray(rowsize * height)
+        # 하위 이미지 준비 (디코딩, RGB 변환, 크기 조정, 회전)
+        jobs = list(zip(image_paths[:image_count], cells))
+        workers = max(1, min(max_workers, len(jobs)))
+        trace = tracing.current()
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                tiles = list(executor.map(lambda job: _load_tile(*job, trace=trace), jobs))
+        else:
+            tiles = [_load_tile(path, cell, trace) for path, cell in jobs]
         
-        # 이미지 데이터를 BGR 형식으로 변환
-        for y in range(height):
-            for x in range(width):
-                r, g, b = composite.getpixel((x, y))
-                idx = y * rowsize + x * 3
-                bitmap_data[idx:idx+3] = bytes([b, g, r])  # RGB -> BGR
+        # 비트맵 버퍼 생성 (빈 칸과 여백은 검은색)
+        rowsize = ((paper_width * 3 + 3) // 4) * 4  # 4바이트 경계로 정렬된 행 크기
+        bitmap_data = bytearray(rowsize * paper_height)
         
-        # 메모리 누수 방지
-        composite.close()
+        # 이미지 배치 (BGR 변환과 동시에 최종 버퍼에 기록)
+        for img, (source, cell) in zip(tiles, jobs):
+            with tracing.phase("bgr", trace):
+                _blit_bgr(bitmap_data, rowsize, img, cell.x, cell.y)
+            
+            # 메모리 누수 방지 (호출한 쪽의 PIL 이미지는 닫지 않음)
+            if img is not source:
+                img.close()
         
-        logger.info(f"분할 이미지 준비 완료: {width}x{height}, {rowsize} 바이트/행, 24비트/픽셀")
+        logger.info(f"분할 이미지 준비 완료: {paper_width}x{paper_height}, {rowsize} 바이트/행, 24비트/픽셀")
         
-        return ImageData(width, height, bytes(bitmap_data))
+        return ImageData(paper_width, paper_height, bitmap_data)
         
     except Exception as e:
         logger.error(f"분할 이미지 준비 중 오류 발생: {e}")
-        raise ImageError(f"분할 이미지 처리 중 오류 발생: {e}")
\ No newline at end of file
+        raise ImageError(f"분할 이미지 처리 중 오류 발생: {e}")
+
+
+# 템플릿의 동적 영역
+#   kind: "photo" 또는 "text"
+#   x, y, width, height: 용지(인쇄 방향 적용 후) 기준 픽셀 좌표
+#   options: 영역 종류별 옵션 (dict)
+TemplateRegion = namedtuple('TemplateRegion', ['name', 'kind', 'x', 'y', 'width', 'height', 'options'])
+
+
+def _load_layer(source, size, mode):
+    """템플릿 고정 레이어(경로 또는 PIL 이미지)를 용지 크기와 모드에 맞게 준비"""
+    img = source if isinstance(source, Image.Image) else Image.open(source)
+    if img.mode != mode:
+        img = img.convert(mode)
+    if img.size != size:
+        img = img.resize(size, Image.LANCZOS)
+    return img
+
+
+class PageTemplate:
+    """
+    고정 레이어를 미리 변환해 두는 인쇄 페이지 템플릿
+
+    배경과 프레임(알파 채널이 있는 덮개 레이어)은 생성할 때 한 번만 합성하여 BGR
+    비트맵으로 보관합니다. render()는 보관된 비트맵을 복사한 뒤 사진/텍스트 영역만
+    새로 그려 기록하므로, 손님마다 드는 비용은 용지 전체가 아니라 동적 영역 크기에
+    비례합니다. 프레임은 동적 영역 위에 다시 합성됩니다.
+
+    생성 후에는 상태가 바뀌지 않으므로 여러 스레드에서 render()를 동시에 호출할 수 있습니다.
+    """
+    def __init__(self, paper_type=PaperType.PHOTO_4X6, orientation=Orientation.PORTRAIT,
+                 background=None, overlay=None, background_color=(255, 255, 255)):
+        """
+        템플릿을 만들고 고정 레이어를 BGR 비트맵으로 변환합니다.
+
+        Args:
+            paper_type (PaperType): 용지 유형
+            orientation (Orientation): 인쇄 방향
+            background: 배경 이미지 경로 또는 PIL 이미지 (용지 크기로 조정). None이면 background_color
+            overlay: 동적 영역 위에 덮는 프레임 이미지 경로 또는 PIL 이미지 (알파 채널 사용)
+            background_color (tuple): 배경 이미지가 없을 때의 배경색 (R, G, B)
+
+        Raises:
+            ImageError: 레이어 처리 실패 시
+        """
+        width, height = PaperType.get_dimensions(paper_type)
+        if orientation == Orientation.LANDSCAPE:
+            width, height = height, width
+
+        self.paper_type = paper_type
+        self.orientation = orientation
+        self.width = width
+        self.height = height
+        self.regions = []
+
+        try:
+            if background is not None:
+                self._background = _load_layer(background, (width, height), 'RGB')
+            else:
+                self._background = Image.new('RGB', (width, height), background_color)
+            self._overlay = _load_layer(overlay, (width, height), 'RGBA') if overlay is not None else None
+
+            page = self._background
+            if self._overlay is not None:
+                page = page.convert('RGBA')
+                page.alpha_composite(self._overlay)
+                page = page.convert('RGB')
+
+            _, _, self.rowsize, self._base = _to_bgr_buffer(page)
+        except Exception as e:
+            logger.error(f"템플릿 준비 중 오류 발생: {e}")
+            raise ImageError(f"템플릿 레이어 처리 중 오류 발생: {e}")
+
+        # 영역별 고정 레이어 조각 (영역 이름 -> (배경 조각, 프레임 조각 또는 None))
+        self._layers = {}
+
+        logger.info(f"템플릿 준비 완료: {width}x{height}, 배경={'이미지' if background is not None else '단색'}, "
+                    f"프레임={'있음' if overlay is not None else '없음'}")
+
+    def _add_region(self, name, kind, x, y, width, height, options):
+        """동적 영역 등록 및 해당 위치의 고정 레이어 조각 보관"""
+        if name in self._layers:
+            raise ValueError(f"이미 등록된 영역 이름: {name}")
+        if width <= 0 or height <= 0 or x < 0 or y < 0 or x + width > self.width or y + height > self.height:
+            raise ValueError(f"영역 '{name}'이(가) 용지({self.width}x{self.height})를 벗어납니다: "
+                             f"({x}, {y}, {width}, {height})")
+
+        box = (x, y, x + width, y + height)
+        under = self._background.crop(box)
+        over = None
+        if self._overlay is not None:
+            over = self._overlay.crop(box)
+            # 완전히 투명한 부분은 합성하지 않음
+            if over.getextrema()[3][1] == 0:
+                over = None
+
+        self._layers[name] = (under, over)
+        self.regions.append(TemplateRegion(name, kind, x, y, width, height, options))
+
+    def add_photo(self, name, x, y, width, height, fit="cover"):
+        """
+        사진 영역을 추가합니다.
+
+        Args:
+            name (str): 영역 이름 (render()의 인자 이름)
+            x, y, width, height (int): 용지 기준 픽셀 좌표와 크기
+            fit (str): "cover"이면 영역을 가득 채우도록 잘라내고, "contain"이면 잘리지 않게 맞춤
+
+        Returns:
+            PageTemplate: self (연속 호출용)
+        """
+        if fit not in ("cover", "contain"):
+            raise ValueError(f"지원하지 않는 맞춤 방식: {fit}")
+        self._add_region(name, "photo", x, y, width, height, {"fit": fit})
+        return self
+
+    def add_text(self, name, x, y, width, height, font=None, font_size=48, fill=(0, 0, 0), align="center"):
+        """
+        텍스트 영역을 추가합니다. 텍스트는 영역 안에서 세로 가운데에 그려집니다.
+
+        Args:
+            name (str): 영역 이름 (render()의 인자 이름)
+            x, y, width, height (int): 용지 기준 픽셀 좌표와 크기
+            font: TrueType 글꼴 경로 또는 PIL 글꼴. None이면 Pillow 기본 글꼴
+            font_size (int): 글꼴 크기 (글꼴 경로를 준 경우)
+            fill (tuple): 글자색 (R, G, B)
+            align (str): "left", "center", "right"
+
+        Returns:
+            PageTemplate: self (연속 호출용)
+        """
+        if align not in ("left", "center", "right"):
+            raise ValueError(f"지원하지 않는 정렬: {align}")
+        if font is None:
+            font = ImageFont.load_default()
+        elif isinstance(font, (str, os.PathLike)):
+            font = ImageFont.truetype(font, font_size)
+        self._add_region(name, "text", x, y, width, height, {"font": font, "fill": fill, "align": align})
+        return self
+
+    def _render_photo(self, region, source, tile, trace):
+        """사진을 영역 크기에 맞게 조정하여 tile에 배치"""
+        size = (region.width, region.height)
+        with tracing.phase("decode", trace):
+            img = _open_image(source, size)
+            img.load()
+            _add_source_bytes(trace, source)
+
+        if img.mode not in ('RGB', 'RGBA'):
+            with tracing.phase("convert", trace):
+                img = img.convert('RGB')
+
+        if img.size == size:
+            # 영역 크기와 같으면 cover와 contain 모두 그대로 배치
+            position = (0, 0)
+        else:
+            with tracing.phase("resize", trace):
+                if region.options["fit"] == "cover":
+                    img = ImageOps.fit(img, size, Image.LANCZOS)
+                    position = (0, 0)
+                else:
+                    img = ImageOps.contain(img, size, Image.LANCZOS)
+                    position = ((size[0] - img.size[0]) // 2, (size[1] - img.size[1]) // 2)
+
+        with tracing.phase("compose", trace):
+            tile.paste(img, position, img if img.mode == 'RGBA' else None)
+
+    def _render_text(self, region, text, tile, trace):
+        """텍스트를 tile에 그리기"""
+        options = region.options
+        anchor, x = {
+            "left": ("lm", 0),
+            "center": ("mm", region.width // 2),
+            "right": ("rm", region.width),
+        }[options["align"]]
+        with tracing.phase("compose", trace):
+            ImageDraw.Draw(tile).text((x, region.height // 2), str(text), font=options["font"],
+                                      fill=options["fill"], anchor=anchor)
+
+    def render(self, **values):
+        """
+        동적 영역에 값을 채워 인쇄용 이미지 데이터를 만듭니다.
+
+        Args:
+            **values: 영역 이름별 값. 사진 영역은 prepare_image와 같은 이미지 입력(경로, 바이트, PIL 이미지, 배열), 텍스트 영역은 문자열.
+                값이 없는 영역은 고정 레이어만 남습니다.
+
+        Returns:
+            ImageData: 처리된 이미지 데이터
+
+        Raises:
+            ImageError: 이미지 처리 실패 시
+        """
+        unknown = set(values) - set(self._layers)
+        if unknown:
+            raise ImageError(f"템플릿에 없는 영역: {', '.join(sorted(unknown))}")
+
+        trace = tracing.current()
+        try:
+            with tracing.phase("copy_base", trace):
+                buffer = bytearray(self._base)
+
+            for region in self.regions:
+                value = values.get(region.name)
+                if value is None:
+                    continue
+
+                under, over = self._layers[region.name]
+                tile = under.copy()
+                if region.kind == "photo":
+                    self._render_photo(region, value, tile, trace)
+                else:
+                    self._render_text(region, value, tile, trace)
+
+                if over is not None:
+                    with tracing.phase("compose", trace):
+                        tile = tile.convert('RGBA')
+                        tile.alpha_composite(over)
+                        tile = tile.convert('RGB')
+
+                with tracing.phase("bgr", trace):
+                    _blit_bgr(buffer, self.rowsize, tile, region.x, region.y)
+
+            return ImageData(self.width, self.height, buffer)
+
+        except ImageError:
+            raise
+        except Exception as e:
+            logger.error(f"템플릿 렌더링 중 오류 발생: {e}")
+            raise ImageError(f"템플릿 렌더링 중 오류 발생: {e}")
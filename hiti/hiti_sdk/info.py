@@ -0,0 +1,139 @@
+# hiti_sdk/info.py
+"""
+HiTi 프린터 장치 정보 캐시
+"""
+import time
+import logging
+
+from .constants import DeviceInfoType
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 연결되어 있는 동안 바뀌지 않는 정보
+STATIC_INFO_TYPES = (
+    DeviceInfoType.MFG_SERIAL,
+    DeviceInfoType.MODEL_NAME,
+    DeviceInfoType.FIRMWARE_VERSION,
+)
+
+# 인쇄할 때마다 바뀌는 정보
+DYNAMIC_INFO_TYPES = (
+    DeviceInfoType.RIBBON_INFO,
+    DeviceInfoType.PRINT_COUNT,
+    DeviceInfoType.CUTTER_COUNT,
+)
+
+# snapshot()에 포함되는 정보
+SNAPSHOT_INFO_TYPES = STATIC_INFO_TYPES + (DeviceInfoType.RIBBON_INFO, DeviceInfoType.PRINT_COUNT)
+
+# 동적 정보 기본 유효 시간(초)
+DEFAULT_INFO_TTL = 30.0
+
+
+class DeviceInfoCache:
+    """
+    장치 정보 캐시
+
+    일련번호, 모델 이름, 펌웨어 버전은 처음 한 번만 조회하고, 리본 정보와
+    인쇄/절단 매수는 유효 시간(ttl)이 지나거나 인쇄 요청으로 무효화되면 다시 조회합니다.
+    장치 잠금을 함께 사용하므로 조회 도중 다른 DLL 호출이 끼어들지 않습니다.
+    """
+    def __init__(self, device, ttl=DEFAULT_INFO_TTL):
+        """
+        장치 정보 캐시를 초기화합니다.
+
+        Args:
+            device (HiTiDevice): 정보를 조회할 장치
+            ttl (float): 동적 정보 유효 시간(초)
+        """
+        self.device = device
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._values = {}      # info_type -> 값
+        self._fetched_at = {}  # info_type -> 조회 시각
+
+    def _is_fresh(self, info_type, max_age):
+        """캐시된 값을 그대로 사용할 수 있는지 확인"""
+        if info_type not in self._values:
+            return False
+        if info_type in STATIC_INFO_TYPES:
+            return True
+        max_age = self.ttl if max_age is None else max_age
+        return time.time() - self._fetched_at[info_type] <= max_age
+
+    def get(self, info_type, max_age=None):
+        """
+        장치 정보를 반환합니다. 캐시된 값이 유효하면 DLL을 호출하지 않습니다.
+
+        Args:
+            info_type (DeviceInfoType): 요청할 정보 유형
+            max_age (float, optional): 동적 정보의 허용 나이(초). None이면 ttl 사용, 0이면 항상 새로 조회
+
+        Returns:
+            HiTiDevice.get_device_info와 같은 값
+
+        Raises:
+            DeviceError: 정보 조회 실패 시
+        """
+        with self.device._lock:
+            if self._is_fresh(info_type, max_age):
+                self.hits += 1
+                return self._values[info_type]
+
+            self.misses += 1
+            value = self.device.get_device_info(info_type)
+            self._values[info_type] = value
+            self._fetched_at[info_type] = time.time()
+            return value
+
+    def invalidate(self, static=False):
+        """
+        캐시된 정보를 무효화합니다.
+
+        Args:
+            static (bool): True이면 정적 정보(일련번호, 모델, 펌웨어)도 무효화 (재연결 시)
+        """
+        with self.device._lock:
+            for info_type in list(self._values):
+                if static or info_type not in STATIC_INFO_TYPES:
+                    del self._values[info_type]
+                    del self._fetched_at[info_type]
+
+    def snapshot(self, max_age=None):
+        """
+        장치 정보를 한 번의 잠금 안에서 모아 반환합니다.
+        오래된 값만 새로 조회하므로, 모든 값이 유효하면 DLL을 호출하지 않습니다.
+
+        Args:
+            max_age (float, optional): 동적 정보의 허용 나이(초). None이면 ttl 사용
+
+        Returns:
+            dict: HiTiPrinter.get_device_info와 같은 형식의 장치 정보
+
+        Raises:
+            DeviceError: 정보 조회 실패 시
+        """
+        with self.device._lock:
+            values = {info_type: self.get(info_type, max_age) for info_type in SNAPSHOT_INFO_TYPES}
+
+        ribbon_info = values[DeviceInfoType.RIBBON_INFO]
+        return {
+            "serial_number": values[DeviceInfoType.MFG_SERIAL],
+            "model_name": values[DeviceInfoType.MODEL_NAME],
+            "firmware_version": values[DeviceInfoType.FIRMWARE_VERSION],
+            "ribbon_type": ribbon_info["type"],
+            "ribbon_type_name": ribbon_info["type_name"],
+            "ribbon_count": ribbon_info["count"],
+            "print_count": values[DeviceInfoType.PRINT_COUNT]
+        }
+
+    def stats(self):
+        """캐시 통계 반환"""
+        with self.device._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "cached": len(self._values),
+            }
@@ -0,0 +1,231 @@
+# hiti_sdk/jobs.py
+"""
+HiTi 프린터 백그라운드 인쇄 작업 큐
+"""
+import os
+import queue
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .constants import PaperType, Orientation, PrintMode
+from .exceptions import PrinterError, PrintError
+from .spool import SpoolEntry, _clear_frames
+from .image import check_image_source, describe_source
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 인쇄 대기 중 미리 준비해 둘 최대 페이지 수
+DEFAULT_MAX_PREPARED = 2
+
+
+class PrintJob:
+    """인쇄 큐에 등록된 작업"""
+    def __init__(self, job_id, image_paths, split, options):
+        """
+        인쇄 작업을 초기화합니다.
+
+        Args:
+            job_id (int): 작업 번호
+            image_paths (str | list | SpoolEntry): 이미지 입력(파일 경로 또는 메모리 이미지), 분할 인쇄용 목록 또는 스풀 작업
+            split (bool): 분할 인쇄 여부
+            options (dict): 인쇄 옵션 (paper_type, orientation, copies, ...)
+        """
+        self.job_id = job_id
+        self.image_paths = image_paths
+        self.split = split
+        self.options = options
+        self.future = Future()
+        self.prepared = None  # 이미지 준비 Future
+
+    def __repr__(self):
+        return f"PrintJob(id={self.job_id}, split={self.split}, paper_type={self.options['paper_type']})"
+
+
+class PrintQueue:
+    """
+    장치별 인쇄 작업 큐
+
+    DLL 호출은 장치마다 하나의 작업 스레드에서 순서대로 실행됩니다. 이미지 준비는
+    별도 스레드에서 미리 진행되므로, 프린터가 N번째 페이지를 인쇄하는 동안
+    N+1번째 페이지의 변환이 끝나 있게 됩니다.
+    """
+    def __init__(self, printer, max_prepared=DEFAULT_MAX_PREPARED):
+        """
+        인쇄 큐를 초기화하고 작업 스레드를 시작합니다.
+
+        Args:
+            printer (HiTiPrinter): 작업을 실행할 프린터
+            max_prepared (int): 인쇄 대기 중 미리 준비해 둘 최대 페이지 수 (메모리 사용량 제한)
+        """
+        self.printer = printer
+        self._jobs = queue.Queue()
+        self._slots = threading.Semaphore(max(1, max_prepared))
+        self._next_id = 1
+        self._id_lock = threading.Lock()
+        self._closed = False
+
+        name = os.path.basename(printer.device.printer_name) or "hiti"
+        self._preparer = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"hiti-prepare-{name}")
+        self._worker = threading.Thread(target=self._run, name=f"hiti-print-{name}", daemon=True)
+        self._worker.start()
+
+    def submit(self, image_path, paper_type=PaperType.PHOTO_4X6, orientation=Orientation.PORTRAIT,
+               copies=1, print_mode=PrintMode.STANDARD, apply_matte=False,
+               wait_for_completion=False, timeout=120):
+        """
+        이미지 인쇄 작업을 등록합니다. 인자는 HiTiPrinter.print_image와 같습니다.
+
+        Returns:
+            Future: 인쇄가 시작(또는 wait_for_completion이면 완료)되면 True를 결과로 갖는 Future
+        """
+        return self._submit(image_path, False, locals())
+
+    def submit_split(self, image_paths, paper_type=PaperType.PHOTO_6X9_SPLIT_2UP,
+                     orientation=Orientation.PORTRAIT, copies=1, print_mode=PrintMode.STANDARD,
+                     apply_matte=False, wait_for_completion=False, timeout=120):
+        """
+        분할 인쇄 작업을 등록합니다. 인자는 HiTiPrinter.print_split_images와 같습니다.
+
+        Returns:
+            Future: 인쇄가 시작(또는 wait_for_completion이면 완료)되면 True를 결과로 갖는 Future
+        """
+        return self._submit(list(image_paths), True, locals())
+
+    def submit_spooled(self, entry, wait_for_completion=False, timeout=120):
+        """
+        스풀에서 가져온 작업을 등록합니다. 인쇄 옵션은 스풀 파일에 저장된 값을 사용합니다.
+        작업이 끝난 뒤 PrintSpool.complete() 또는 release()는 호출한 쪽에서 처리합니다.
+
+        Args:
+            entry (SpoolEntry): PrintSpool.claim()으로 가져온 작업
+            wait_for_completion (bool): 인쇄 완료까지 대기 여부
+            timeout (float): 최대 대기 시간(초)
+
+        Returns:
+            Future: 인쇄가 시작(또는 wait_for_completion이면 완료)되면 True를 결과로 갖는 Future
+        """
+        return self.submit(entry, entry.paper_type, entry.orientation, entry.copies, entry.print_mode,
+                           entry.apply_matte, wait_for_completion, timeout)
+
+    def _submit(self, image_paths, split, arguments):
+        """작업 생성 후 이미지 준비와 인쇄 대기열에 등록"""
+        if self._closed:
+            raise PrintError("인쇄 큐가 종료되었습니다.")
+
+        options = {key: value for key, value in arguments.items()
+                   if key not in ('self', 'image_path', 'image_paths')}
+
+        with self._id_lock:
+            job = PrintJob(self._next_id, image_paths, split, options)
+            self._next_id += 1
+
+        job.prepared = self._preparer.submit(self._prepare, job)
+        self._jobs.put(job)
+        logger.info(f"인쇄 작업 등록: {job}")
+        return job.future
+
+    def _prepare(self, job):
+        """이미지 준비 스레드: 준비 슬롯을 확보한 뒤 페이지를 변환"""
+        self._slots.acquire()
+
+        options = job.options
+        cache = self.printer.page_cache
+        if isinstance(job.image_paths, SpoolEntry):
+            # 스풀 작업은 이미 준비된 비트맵
+            return job.image_paths.image_data
+        if job.split:
+            for source in job.image_paths:
+                check_image_source(source)
+            return cache.get_or_create_split(job.image_paths, options['paper_type'], options['orientation'])
+
+        check_image_source(job.image_paths)
+        return cache.get_or_prepare(job.image_paths, options['paper_type'], options['orientation'])
+
+    def _run(self):
+        """작업 스레드: 등록 순서대로 준비된 페이지를 인쇄"""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+
+            try:
+                if job.future.set_running_or_notify_cancel():
+                    try:
+                        result = self._print(job)
+                    finally:
+                        # 완료 콜백(스풀 파일 삭제 등)이 실행되기 전에 페이지 참조를 놓음
+                        self._release_prepared(job)
+                    job.future.set_result(result)
+                else:
+                    logger.info(f"취소된 인쇄 작업 건너뜀: {job}")
+            except Exception as e:
+                logger.error(f"인쇄 작업 실패: {job}: {e}")
+                _clear_frames(e)
+                job.future.set_exception(e)
+            finally:
+                self._release_prepared(job)
+
+    def _release_prepared(self, job):
+        """준비가 시작된 작업은 준비 슬롯을 반환하고, 준비된 페이지(비트맵) 참조를 놓음"""
+        prepared, job.prepared = job.prepared, None
+        if prepared is not None and not prepared.cancel():
+            prepared.exception()
+            self._slots.release()
+
+    def _print(self, job):
+        """준비된 페이지를 프린터로 전송"""
+        image_data = job.prepared.result()
+        options = job.options
+        printer = self.printer
+
+        try:
+            # 이전 작업이 인쇄 중이면 끝날 때까지 대기
+            printer._check_ready_to_print(True, options['timeout'])
+
+            if job.split:
+                return printer._print_prepared_sheet(
+                    image_data, len(job.image_paths), options['paper_type'], options['orientation'],
+                    options['copies'], options['print_mode'], options['apply_matte'],
+                    options['wait_for_completion'], options['timeout']
+                )
+            return printer._print_prepared_image(
+                image_data, describe_source(job.image_paths), options['paper_type'], options['orientation'],
+                options['copies'], options['print_mode'], options['apply_matte'],
+                options['wait_for_completion'], options['timeout']
+            )
+        except PrinterError:
+            raise
+        except Exception as e:
+            raise PrintError(f"인쇄 작업 {job.job_id} 실행 중 오류 발생: {e}")
+
+    @property
+    def pending(self):
+        """아직 실행되지 않은 작업 수"""
+        return self._jobs.qsize()
+
+    def shutdown(self, wait=True, cancel_pending=False):
+        """
+        인쇄 큐를 종료합니다.
+
+        Args:
+            wait (bool): 작업 스레드가 끝날 때까지 대기 여부
+            cancel_pending (bool): 아직 시작되지 않은 작업을 취소할지 여부
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if cancel_pending:
+            # 취소된 작업도 큐에 남겨 두어 작업 스레드가 준비 슬롯을 정리하게 함
+            with self._jobs.mutex:
+                pending = list(self._jobs.queue)
+            for job in pending:
+                if job is not None:
+                    job.future.cancel()
+
+        self._jobs.put(None)
+        if wait:
+            self._worker.join()
+        self._preparer.shutdown(wait=wait)
@@ -0,0 +1,154 @@
+# hiti_sdk/layout.py
+"""
+용지 유형별 다중 사진(N-up) 배치 정의
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+from .constants import PaperType, Orientation
+
+# 용지 위의 한 칸 (픽셀 좌표, rotate는 사진을 칸에 넣을 때 시계 반대 방향 회전 각도)
+Cell = namedtuple('Cell', ['x', 'y', 'width', 'height', 'rotate'])
+
+
+class SheetLayout:
+    """
+    한 용지에 사진을 배치하는 방법
+
+    격자(rows x cols)와 바깥 여백, 칸 사이 간격으로 칸을 계산하거나,
+    cells에 용지 비율(0.0~1.0) 기준의 칸 사각형을 직접 지정할 수 있습니다.
+    격자 배치는 인쇄 방향이 반영된 용지 크기를 기준으로 계산됩니다.
+    """
+    def __init__(self, rows=1, cols=1, margin=0, gutter=0, rotate=0, cells=None, description=""):
+        """
+        용지 배치를 초기화합니다.
+
+        Args:
+            rows (int): 격자 행 수
+            cols (int): 격자 열 수
+            margin (int): 바깥 여백 (픽셀)
+            gutter (int): 칸 사이 간격 (픽셀)
+            rotate (int): 모든 칸에 적용할 회전 각도 (0, 90, 180, 270)
+            cells (list, optional): (x, y, width, height[, rotate]) 비율 사각형 목록. 지정하면 격자 설정 무시
+            description (str): 배치 설명
+        """
+        if rotate not in (0, 90, 180, 270):
+            raise ValueError(f"지원하지 않는 회전 각도: {rotate}")
+
+        self.rows = rows
+        self.cols = cols
+        self.margin = margin
+        self.gutter = gutter
+        self.rotate = rotate
+        self.cells = cells
+        self.description = description
+
+    @property
+    def count(self):
+        """배치되는 사진 수"""
+        if self.cells is not None:
+            return len(self.cells)
+        return self.rows * self.cols
+
+    def compute_cells(self, page_width, page_height):
+        """
+        용지 크기에 대한 칸 좌표를 계산합니다.
+
+        Args:
+            page_width (int): 용지 너비 (픽셀)
+            page_height (int): 용지 높이 (픽셀)
+
+        Returns:
+            list: Cell 목록 (행 우선 순서)
+        """
+        if self.cells is not None:
+            result = []
+            for rect in self.cells:
+                fx, fy, fw, fh = rect[:4]
+                rotate = rect[4] if len(rect) > 4 else self.rotate
+                result.append(Cell(
+                    int(fx * page_width), int(fy * page_height),
+                    int(fw * page_width), int(fh * page_height),
+                    rotate
+                ))
+            return result
+
+        cell_width = (page_width - 2 * self.margin - (self.cols - 1) * self.gutter) // self.cols
+        cell_height = (page_height - 2 * self.margin - (self.rows - 1) * self.gutter) // self.rows
+
+        return [
+            Cell(
+                self.margin + col * (cell_width + self.gutter),
+                self.margin + row * (cell_height + self.gutter),
+                cell_width,
+                cell_height,
+                self.rotate
+            )
+            for row in range(self.rows)
+            for col in range(self.cols)
+        ]
+
+
+# 용지 유형별 배치 테이블
+LAYOUTS = {
+    PaperType.PHOTO_4X6: SheetLayout(description="4x6 1장"),
+    PaperType.PHOTO_5X7: SheetLayout(description="5x7 1장"),
+    PaperType.PHOTO_6X8: SheetLayout(rows=2, rotate=90, description="6x8 용지에 6x4 2장 (세로 사진 회전)"),
+    PaperType.PHOTO_6X9: SheetLayout(description="6x9 1장"),
+    PaperType.PHOTO_6X9_SPLIT_2UP: SheetLayout(rows=2, description="6x9 용지에 4x6 2장 (가로 분할)"),
+    PaperType.PHOTO_4X6_SPLIT_2UP: SheetLayout(cols=2, description="4x6 용지에 2x6 2장 (세로 분할)"),
+    PaperType.PHOTO_5X7_SPLIT_2UP: SheetLayout(rows=2, description="5x7 용지에 5x3.5 2장 (가로 분할)"),
+    PaperType.PHOTO_4X6_SPLIT_3UP: SheetLayout(cols=3, description="4x6 용지에 1.3x6 3장 (세로 분할)"),
+    PaperType.PHOTO_8X4: SheetLayout(cols=2, description="8x4 용지에 4x4 2장"),
+    PaperType.PHOTO_8X6: SheetLayout(cols=2, description="8x6 용지에 4x6 2장"),
+    PaperType.PHOTO_8X8: SheetLayout(rows=2, cols=2, description="8x8 용지에 4x4 4장"),
+    PaperType.PHOTO_8X12: SheetLayout(rows=2, cols=2, description="8x12 용지에 4x6 4장"),
+}
+
+
+def get_layout(paper_type):
+    """
+    용지 유형의 배치를 반환합니다.
+
+    Args:
+        paper_type (PaperType): 용지 유형
+
+    Returns:
+        SheetLayout: 배치 정보 (테이블에 없으면 1장 배치)
+    """
+    return LAYOUTS.get(paper_type, SheetLayout())
+
+
+def register_layout(paper_type, layout):
+    """
+    용지 유형의 배치를 등록하거나 교체합니다.
+
+    Args:
+        paper_type (PaperType): 용지 유형
+        layout (SheetLayout): 배치 정보
+    """
+    LAYOUTS[paper_type] = layout
+    get_cells.cache_clear()
+
+
+@lru_cache(maxsize=64)
+def get_cells(paper_type, orientation=Orientation.PORTRAIT):
+    """
+    용지 유형과 인쇄 방향에 대한 용지 크기와 칸 좌표를 계산합니다.
+    배치마다 한 번만 계산되고 이후에는 캐시된 값을 반환합니다.
+
+    Args:
+        paper_type (PaperType): 용지 유형
+        orientation (Orientation): 인쇄 방향
+
+    Returns:
+        tuple: (page_width, page_height, cells)
+    """
+    page_width, page_height = PaperType.get_dimensions(paper_type)
+
+    # 인쇄 방향에 따라 용지 크기 조정
+    if orientation == Orientation.LANDSCAPE:
+        page_width, page_height = page_height, page_width
+
+    cells = tuple(get_layout(paper_type).compute_cells(page_width, page_height))
+    return page_width, page_height, cells
@@ -0,0 +1,53 @@
+# hiti_sdk/models.py
+"""
+HiTi 프린터 모델별 기능 정의
+"""
+from collections import namedtuple
+
+# 모델 기능
+#   native_copies: 펌웨어가 shCopies로 여러 매수를 한 번에 인쇄하는지 여부
+#   max_copies: 한 번의 인쇄 요청으로 보낼 수 있는 최대 매수
+ModelCapabilities = namedtuple('ModelCapabilities', ['native_copies', 'max_copies'])
+
+# 기본적으로 모든 모델은 한 장씩 인쇄 (원래 동작: shCopies=1)
+DEFAULT_CAPABILITIES = ModelCapabilities(native_copies=False, max_copies=1)
+
+# 모델 이름(MODEL_NAME) 접두어별 기능 테이블. 긴 접두어가 먼저 일치합니다.
+# 펌웨어가 shCopies를 무시하는 모델에 native_copies를 켜면 여러 매수 주문이 한 장만
+# 인쇄되므로, 실제 장치에서 확인한 모델만 register_model()로 등록합니다.
+MODEL_CAPABILITIES = {}
+
+
+def get_capabilities(model_name):
+    """
+    모델 이름에 해당하는 기능을 반환합니다.
+
+    Args:
+        model_name (str): 장치 정보의 모델 이름 (예: "P525L")
+
+    Returns:
+        ModelCapabilities: 모델 기능 (테이블에 없으면 DEFAULT_CAPABILITIES)
+    """
+    if not model_name:
+        return DEFAULT_CAPABILITIES
+
+    name = model_name.strip().upper()
+    # HiTi 접두어 제거 (예: "HiTi P525L")
+    if name.startswith("HITI"):
+        name = name[4:].strip()
+
+    for prefix in sorted(MODEL_CAPABILITIES, key=len, reverse=True):
+        if name.startswith(prefix):
+            return MODEL_CAPABILITIES[prefix]
+    return DEFAULT_CAPABILITIES
+
+
+def register_model(prefix, capabilities):
+    """
+    모델 기능을 등록하거나 교체합니다.
+
+    Args:
+        prefix (str): 모델 이름 접두어 (예: "P525")
+        capabilities (ModelCapabilities): 모델 기능
+    """
+    MODEL_CAPABILITIES[prefix.upper()] = capabilities
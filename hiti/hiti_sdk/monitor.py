@@ -0,0 +1,275 @@
+# hiti_sdk/monitor.py
+"""
+HiTi 프린터 장치별 상태 모니터
+"""
+import time
+import asyncio
+import logging
+import threading
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+class StatusMonitor:
+    """
+    장치 상태를 백그라운드에서 확인하고 공유하는 모니터
+
+    장치마다 하나의 스레드가 상태를 확인하여 마지막 상태를 보관합니다.
+    인쇄 중이거나 대기 중인 호출이 있으면 빠른 주기로, 그 외에는 느린 주기로 확인합니다.
+    상태가 바뀌면 구독자에게 알리고, 대기 중인 호출은 조건 변수로 깨웁니다.
+    """
+    def __init__(self, device, fast_interval=0.2, idle_interval=2.0, eta_margin=0.5, max_eta_sleep=5.0):
+        """
+        상태 모니터를 초기화합니다. 스레드는 처음 사용할 때 시작됩니다.
+
+        Args:
+            device (HiTiDevice): 상태를 확인할 장치
+            fast_interval (float): 인쇄 중이거나 대기 호출이 있을 때 확인 주기(초)
+            idle_interval (float): 유휴 상태 확인 주기(초)
+            eta_margin (float): 완료 예상 시각보다 이 시간(초) 먼저 빠른 주기 확인 시작
+            max_eta_sleep (float): 완료 예상 시각까지 한 번에 쉬는 최대 시간(초). 인쇄 중 오류를 늦게 알아채지 않도록 제한
+        """
+        self.device = device
+        self.fast_interval = fast_interval
+        self.idle_interval = idle_interval
+        self.eta_margin = eta_margin
+        self.max_eta_sleep = max_eta_sleep
+
+        self._cond = threading.Condition()
+        self._wakeup = threading.Event()
+        self._status = None
+        self._active = False
+        self._error = None
+        self._updated_at = 0.0
+        self._sequence = 0
+        self._started = 0        # 시작된 확인 횟수 (확인마다 번호를 매김)
+        self._status_ticket = 0  # 현재 상태를 확인한 번호
+        self._subscribers = []
+        self._waiters = []       # wait_for_async 대기자: waiter(ticket, status_code)
+        self._wait_intervals = []
+        self._thread = None
+        self._stopped = False
+
+    def start(self):
+        """모니터 스레드를 시작합니다 (이미 실행 중이면 무시)."""
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"hiti-status-{self.device.printer_name}",
+                daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout=None):
+        """모니터 스레드를 종료합니다."""
+        with self._cond:
+            self._stopped = True
+            thread = self._thread
+            self._thread = None
+        self._wakeup.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _next_interval(self):
+        """
+        다음 확인까지의 대기 시간 계산
+
+        인쇄 중이고 완료 예상 시각을 알면, 예상 시각 직전까지는 느린 주기로 쉬고
+        그 뒤에는 빠른 주기로 확인합니다.
+        """
+        with self._cond:
+            if self._wait_intervals:
+                interval = min(self._wait_intervals)
+            elif self._active:
+                interval = self.fast_interval
+            else:
+                return self.idle_interval
+            active = self._active
+
+        eta = self.device.tracker.eta() if active else None
+        if eta is not None and eta - self.eta_margin > interval:
+            return min(eta - self.eta_margin, self.max_eta_sleep)
+        return interval
+
+    def _run(self):
+        """모니터 스레드: 주기적으로 상태 확인"""
+        while not self._stopped:
+            self.poll()
+            self._wakeup.wait(self._next_interval())
+            self._wakeup.clear()
+
+    def poll(self):
+        """
+        장치 상태를 즉시 확인하고 결과를 공유합니다.
+
+        Returns:
+            tuple: (status_code, status_description). 확인 실패 시 None
+        """
+        # 상태를 읽기 전에 번호를 받아, 대기 호출이 자기보다 먼저 시작된 확인 결과를 쓰지 않게 함
+        with self._cond:
+            self._started += 1
+            ticket = self._started
+
+        try:
+            status = self.device.check_status()
+            active = self.device.decode_status(status[0]).active
+            error = None
+        except Exception as e:
+            status = None
+            error = e
+
+        with self._cond:
+            # 동시에 실행된 확인이 늦게 끝나도 더 최근에 시작된 확인 결과를 덮어쓰지 않음
+            if ticket < self._status_ticket:
+                return status
+            changed = status is not None and (self._status is None or self._status[0] != status[0])
+            if status is not None:
+                self._status = status
+                self._active = active
+                self._updated_at = time.time()
+            self._status_ticket = ticket
+            self._error = error
+            self._sequence += 1
+            subscribers = [callback for callback, changes_only in self._subscribers
+                           if status is not None and (changed or not changes_only)]
+            waiters = list(self._waiters) if status is not None else []
+            self._cond.notify_all()
+
+        if error is not None:
+            logger.warning(f"상태 모니터 확인 실패: {error}")
+
+        for waiter in waiters:
+            try:
+                waiter(ticket, status[0])
+            except Exception as e:
+                logger.error(f"상태 대기 조건 확인 중 오류: {e}")
+
+        for callback in subscribers:
+            try:
+                callback(*status)
+            except Exception as e:
+                logger.error(f"상태 변경 알림 처리 중 오류: {e}")
+
+        return status
+
+    @property
+    def latest(self):
+        """마지막으로 확인된 (status_code, status_description). 아직 없으면 None"""
+        with self._cond:
+            return self._status
+
+    @property
+    def age(self):
+        """마지막 상태 확인 후 경과 시간(초)"""
+        with self._cond:
+            if self._status is None:
+                return float('inf')
+            return time.time() - self._updated_at
+
+    def subscribe(self, callback, changes_only=True):
+        """
+        상태 변경 알림을 구독합니다.
+
+        Args:
+            callback (callable): callback(status_code, status_description) 형태의 함수.
+                모니터 스레드에서 호출되므로 오래 걸리는 작업은 피해야 합니다.
+            changes_only (bool): True이면 상태가 바뀔 때만, False이면 확인할 때마다 호출
+        """
+        with self._cond:
+            self._subscribers.append((callback, changes_only))
+        self.start()
+
+    def unsubscribe(self, callback):
+        """상태 변경 알림 구독을 해제합니다."""
+        with self._cond:
+            self._subscribers = [item for item in self._subscribers if item[0] is not callback]
+
+    def _begin_wait(self, poll_interval=None):
+        """대기 호출 등록: 대기하는 동안 빠른 주기로 확인하고 즉시 한 번 확인"""
+        interval = poll_interval if poll_interval is not None else self.fast_interval
+        with self._cond:
+            self._wait_intervals.append(interval)
+        self._wakeup.set()
+        return interval
+
+    def _end_wait(self, interval):
+        """대기 호출 등록 해제"""
+        with self._cond:
+            self._wait_intervals.remove(interval)
+
+    def wait_for(self, predicate, timeout, poll_interval=None):
+        """
+        상태 코드가 조건을 만족할 때까지 대기합니다.
+
+        호출 이후에 시작된 확인의 결과만 검사하므로, 호출 전에 시작되어 늦게 끝난 확인이
+        읽은 인쇄 요청 직전의 오래된 상태로 판단하지 않습니다.
+
+        Args:
+            predicate (callable): predicate(status_code) -> bool
+            timeout (float): 최대 대기 시간(초)
+            poll_interval (float, optional): 대기 중 확인 주기(초). 기본값은 fast_interval
+
+        Returns:
+            int: 조건을 만족한 상태 코드. 타임아웃 시 None
+        """
+        self.start()
+        deadline = time.time() + timeout
+
+        with self._cond:
+            interval = self._begin_wait(poll_interval)
+            start = self._started
+            seen = self._sequence
+            try:
+                while True:
+                    if self._sequence != seen:
+                        seen = self._sequence
+                        if self._error is None and self._status_ticket > start and predicate(self._status[0]):
+                            return self._status[0]
+
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return None
+                    self._cond.wait(remaining)
+            finally:
+                self._end_wait(interval)
+
+    async def wait_for_async(self, predicate, timeout, poll_interval=None):
+        """
+        wait_for의 asyncio 버전. 상태 알림을 asyncio Future로 받으므로 이벤트 루프를 막지 않습니다.
+        wait_for와 같이 호출 이후에 시작된 확인의 결과만 검사합니다.
+
+        Args:
+            predicate (callable): predicate(status_code) -> bool (모니터 스레드에서 호출됨)
+            timeout (float): 최대 대기 시간(초)
+            poll_interval (float, optional): 대기 중 확인 주기(초). 기본값은 fast_interval
+
+        Returns:
+            int: 조건을 만족한 상태 코드. 타임아웃 시 None
+        """
+        loop = asyncio.get_running_loop()
+        result = loop.create_future()
+
+        def set_result(code):
+            if not result.done():
+                result.set_result(code)
+
+        def on_status(ticket, code):
+            if ticket > start and predicate(code):
+                loop.call_soon_threadsafe(set_result, code)
+
+        self.start()
+        with self._cond:
+            start = self._started
+            self._waiters.append(on_status)
+        interval = self._begin_wait(poll_interval)
+        try:
+            return await asyncio.wait_for(result, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            with self._cond:
+                self._waiters.remove(on_status)
+            self._end_wait(interval)
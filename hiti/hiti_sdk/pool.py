@@ -0,0 +1,407 @@
+# hiti_sdk/pool.py
+"""
+여러 대의 HiTi 프린터에 작업을 분배하는 프린터 풀
+"""
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+
+from .constants import PaperType, Orientation, PrintMode, DeviceInfoType
+from .exceptions import ConnectionError, PrintError, DeviceError, StatusError
+from .device import find_printers
+from .layout import get_layout
+from .cache import PageCache
+from .printer import HiTiPrinter, PrinterStatus
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 리본 잔량을 다시 조회하는 주기(초)
+DEFAULT_RIBBON_TTL = 60.0
+
+# 한 작업을 다른 프린터로 다시 보내는 최대 횟수
+DEFAULT_MAX_ATTEMPTS = 3
+
+# 다른 프린터로 다시 보낼 수 있는 장치 오류 (이미지, 스풀 오류는 어느 프린터에서나 같음)
+RETRYABLE_ERRORS = (PrintError, DeviceError, StatusError, ConnectionError)
+
+
+class _PoolMember:
+    """풀에 속한 프린터와 분배 상태"""
+    def __init__(self, printer):
+        self.printer = printer
+        self.jobs = set()           # 이 프린터에 보낸 미완료 작업
+        self.drained = False        # 오류로 작업 분배 중단
+        self.ribbon_count = None    # 마지막으로 확인한 리본 잔량 (모르면 None)
+
+    @property
+    def name(self):
+        return self.printer.device.printer_name
+
+
+class _PoolJob:
+    """풀에 등록된 작업"""
+    def __init__(self, job_id, image_paths, split, options):
+        self.job_id = job_id
+        self.image_paths = image_paths
+        self.split = split
+        self.options = options
+        self.future = Future()
+        self.member = None   # 현재 작업을 맡은 프린터
+        self.inner = None    # 프린터 인쇄 큐의 Future
+        self.attempts = 0
+
+    def __repr__(self):
+        return f"PoolJob(id={self.job_id}, split={self.split}, paper_type={self.options['paper_type']})"
+
+
+def _complete(future, result=None, error=None):
+    """풀 작업 Future 완료 (호출한 쪽이 이미 취소했으면 무시)"""
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+class HiTiPrinterPool:
+    """
+    여러 대의 HiTi 프린터를 하나처럼 사용하는 프린터 풀
+
+    작업은 상태가 정상이고 리본이 남아 있는 프린터 중 미완료 작업이 가장 적은
+    프린터로 보내집니다 (같으면 리본 잔량이 많은 프린터 우선). 프린터가 오류 상태가
+    되면 새 작업 분배를 멈추고, 아직 시작되지 않은 작업은 다른 프린터로 다시
+    보냅니다. 오류가 해소되면 다시 분배 대상이 됩니다.
+    """
+    def __init__(self, printers=None, page_cache=None, ribbon_ttl=DEFAULT_RIBBON_TTL,
+                 max_attempts=DEFAULT_MAX_ATTEMPTS):
+        """
+        프린터 풀을 초기화합니다.
+
+        Args:
+            printers (list, optional): HiTiPrinter 목록. None인 경우 find_printers()로 찾은 모든 프린터 사용
+            page_cache (PageCache, optional): 프린터들이 공유할 페이지 캐시
+            ribbon_ttl (float): 리본 잔량을 다시 조회하는 주기(초)
+            max_attempts (int): 한 작업을 프린터에 보내는 최대 횟수
+
+        Raises:
+            ConnectionError: 사용할 수 있는 프린터가 없는 경우
+        """
+        self.page_cache = page_cache if page_cache is not None else PageCache()
+        self.ribbon_ttl = ribbon_ttl
+        self.max_attempts = max(1, max_attempts)
+
+        if printers is None:
+            printers = []
+            for device in find_printers():
+                try:
+                    printers.append(HiTiPrinter(page_cache=self.page_cache, device=device))
+                except ConnectionError as e:
+                    logger.warning(f"프린터 풀에서 제외: {device.printer_name}: {e}")
+
+        if not printers:
+            raise ConnectionError("연결된 HiTi 프린터를 찾을 수 없습니다.")
+
+        self._lock = threading.RLock()
+        self._members = [_PoolMember(printer) for printer in printers]
+        self._waiting = deque()   # 분배할 프린터가 없어 대기 중인 작업
+        self._next_id = 1
+        self._closed = False
+
+        for member in self._members:
+            member.printer.device.monitor.subscribe(
+                lambda code, desc, member=member: self._on_status(member, code, desc)
+            )
+            logger.info(f"프린터 풀에 추가: {member.name}")
+
+    @property
+    def printers(self):
+        """풀에 속한 HiTiPrinter 목록"""
+        return [member.printer for member in self._members]
+
+    def submit(self, image_path, paper_type=PaperType.PHOTO_4X6, orientation=Orientation.PORTRAIT,
+               copies=1, print_mode=PrintMode.STANDARD, apply_matte=False,
+               wait_for_completion=False, timeout=120):
+        """
+        이미지 인쇄 작업을 등록합니다. 인자는 HiTiPrinter.print_image와 같습니다.
+
+        Returns:
+            Future: 인쇄 결과(bool) 또는 예외를 담는 Future
+        """
+        return self._submit(image_path, False, locals())
+
+    def submit_split(self, image_paths, paper_type=PaperType.PHOTO_6X9_SPLIT_2UP,
+                     orientation=Orientation.PORTRAIT, copies=1, print_mode=PrintMode.STANDARD,
+                     apply_matte=False, wait_for_completion=False, timeout=120):
+        """
+        분할 인쇄 작업을 등록합니다. 인자는 HiTiPrinter.print_split_images와 같습니다.
+
+        Returns:
+            Future: 인쇄 결과(bool) 또는 예외를 담는 Future
+        """
+        if get_layout(paper_type).count < 2:
+            raise PrintError(f"분할 인쇄에 적합하지 않은 용지 타입: {paper_type}")
+        return self._submit(list(image_paths), True, locals())
+
+    def submit_spooled(self, entry, wait_for_completion=False, timeout=120):
+        """
+        스풀에서 가져온 작업을 등록합니다. 인자는 PrintQueue.submit_spooled와 같습니다.
+
+        Returns:
+            Future: 인쇄 결과(bool) 또는 예외를 담는 Future
+        """
+        return self.submit(entry, entry.paper_type, entry.orientation, entry.copies, entry.print_mode,
+                           entry.apply_matte, wait_for_completion, timeout)
+
+    def _submit(self, image_paths, split, arguments):
+        """작업 생성 후 프린터에 분배"""
+        options = {key: value for key, value in arguments.items()
+                   if key not in ('self', 'image_path', 'image_paths')}
+
+        with self._lock:
+            if self._closed:
+                raise PrintError("프린터 풀이 종료되었습니다.")
+            job = _PoolJob(self._next_id, image_paths, split, options)
+            self._next_id += 1
+
+        job.future.add_done_callback(lambda future: self._on_cancel(job))
+        self._dispatch(job)
+        return job.future
+
+    def _is_healthy(self, member):
+        """작업을 보낼 수 있는 프린터인지 확인"""
+        if member.drained or member.ribbon_count == 0:
+            return False
+        latest = member.printer.device.monitor.latest
+        if latest is None:
+            return True
+        status = member.printer.device.decode_status(latest[0]).state
+        return status not in (PrinterStatus.ERROR, PrinterStatus.OFFLINE)
+
+    def _refresh_ribbon(self, member, force=False):
+        """리본 잔량 갱신 (장치 정보 캐시 사용, force이면 새로 조회)"""
+        try:
+            ribbon_info = member.printer.device.info.get(
+                DeviceInfoType.RIBBON_INFO, max_age=0 if force else self.ribbon_ttl
+            )
+            member.ribbon_count = ribbon_info["count"]
+        except Exception as e:
+            # 조회에 실패하면 잔량을 모르는 것으로 보고 분배 대상에서 빼지 않음
+            logger.warning(f"리본 잔량 조회 실패: {member.name}: {e}")
+            member.ribbon_count = None
+
+    def _select(self):
+        """미완료 작업이 가장 적은 정상 프린터 선택 (풀 잠금 안에서 호출). 없으면 None"""
+        candidates = [member for member in self._members if self._is_healthy(member)]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda member: (len(member.jobs), -(member.ribbon_count or 0)))
+
+    def _dispatch(self, job):
+        """작업을 프린터의 인쇄 큐에 보냄. 보낼 프린터가 없으면 대기열에 보관"""
+        if job.future.done():
+            return
+
+        # 리본 잔량 조회는 DLL을 호출하므로 (다른 프린터의 인쇄 요청 뒤에 막힐 수 있음) 풀 잠금 밖에서 실행
+        with self._lock:
+            members = list(self._members)
+        for member in members:
+            self._refresh_ribbon(member)
+
+        with self._lock:
+            if job.future.done():
+                return
+
+            member = self._select()
+            if member is None:
+                logger.warning(f"사용 가능한 프린터가 없어 작업 대기: {job}")
+                self._waiting.append(job)
+                return
+
+            job.member = member
+            job.attempts += 1
+            member.jobs.add(job)
+
+            if job.split:
+                inner = member.printer.submit_split(job.image_paths, **job.options)
+            else:
+                inner = member.printer.submit(job.image_paths, **job.options)
+            job.inner = inner
+            logger.info(f"작업 {job.job_id} -> {member.name} (시도 {job.attempts}/{self.max_attempts})")
+
+        inner.add_done_callback(lambda future: self._on_done(member, job, future))
+
+    def _dispatch_waiting(self):
+        """대기 중인 작업을 다시 분배 (보낼 프린터가 없으면 다시 대기열로)"""
+        with self._lock:
+            waiting = list(self._waiting)
+            self._waiting.clear()
+
+        for job in waiting:
+            self._dispatch(job)
+
+    def _on_done(self, member, job, inner):
+        """프린터 인쇄 큐의 작업 종료 처리"""
+        # 풀 잠금 안에서는 작업 목록만 갱신하고, 상태 확인과 Future 완료(완료 콜백 실행)는 잠금 밖에서 처리
+        with self._lock:
+            member.jobs.discard(job)
+            current = inner is job.inner and not job.future.done()
+
+        if current and self._finish(member, job, inner):
+            logger.warning(f"{member.name} 오류로 작업 {job.job_id}을(를) 다른 프린터로 다시 보냄")
+            self._dispatch(job)
+
+        # 프린터가 비었으므로 대기 중인 작업 분배 (상태 변경 알림이 없어도)
+        self._recover(member)
+        self._dispatch_waiting()
+
+    def _finish(self, member, job, inner):
+        """
+        작업 결과를 풀 작업에 반영 (풀 잠금 밖에서 호출)
+
+        Returns:
+            bool: 다른 프린터로 다시 보내야 하면 True
+        """
+        if inner.cancelled():
+            # 오류로 분배가 중단된 프린터에서 취소된 작업은 다른 프린터로 다시 보냄
+            retry = True
+            error = PrintError(f"인쇄 작업 {job.job_id}이(가) 취소되었습니다.")
+        else:
+            error = inner.exception()
+            if error is None:
+                _complete(job.future, result=inner.result())
+                return False
+            # 프린터 오류로 실패한 작업만 다른 프린터로 다시 보냄 (실패 직후 상태를 새로 확인).
+            # 이미지 오류 등은 어느 프린터에서나 같으므로 바로 실패 처리
+            retry = False
+            if isinstance(error, RETRYABLE_ERRORS):
+                member.printer.device.monitor.poll()
+                with self._lock:
+                    retry = not self._is_healthy(member)
+                if retry:
+                    self._drain(member)
+
+        with self._lock:
+            give_up = not retry or job.attempts >= self.max_attempts or self._closed
+        if give_up:
+            logger.error(f"인쇄 작업 실패: {job}: {error}")
+            _complete(job.future, error=error)
+            return False
+        return True
+
+    def _on_cancel(self, job):
+        """풀 작업이 취소되면 프린터 인쇄 큐의 작업도 취소"""
+        if not job.future.cancelled():
+            return
+        with self._lock:
+            if job in self._waiting:
+                self._waiting.remove(job)
+            inner = job.inner
+        if inner is not None:
+            inner.cancel()
+
+    def _drain(self, member):
+        """프린터를 분배 대상에서 빼고, 시작되지 않은 작업을 취소 (다른 프린터로 다시 보내짐)"""
+        with self._lock:
+            if member.drained:
+                return
+            member.drained = True
+            inners = [job.inner for job in member.jobs]
+        logger.warning(f"프린터 오류로 작업 분배 중단: {member.name}")
+
+        # 이미 다른 프린터로 다시 보내진 작업은 건드리지 않도록 이 프린터의 Future만 취소
+        for inner in inners:
+            inner.cancel()
+
+    def _recover(self, member):
+        """오류로 분배가 중단된 프린터가 준비 상태이면 분배 재개"""
+        with self._lock:
+            if not member.drained:
+                return
+            latest = member.printer.device.monitor.latest
+            if latest is None or member.printer.device.decode_status(latest[0]).state != PrinterStatus.READY:
+                return
+            member.drained = False
+        logger.info(f"프린터 복구, 작업 분배 재개: {member.name}")
+        # 리본 교체 등으로 복구되었을 수 있으므로 잔량 다시 조회 (풀 잠금 밖에서)
+        self._refresh_ribbon(member, force=True)
+
+    def _on_status(self, member, status_code, status_desc):
+        """상태 모니터 알림: 오류 시 분배 중단, 복구 시 대기 작업 분배"""
+        status = member.printer.device.decode_status(status_code).state
+        if status in (PrinterStatus.ERROR, PrinterStatus.OFFLINE):
+            self._drain(member)
+            return
+
+        if status != PrinterStatus.READY:
+            return
+
+        self._recover(member)
+        self._dispatch_waiting()
+
+    def status(self):
+        """
+        풀에 속한 프린터별 분배 상태를 반환합니다.
+
+        Returns:
+            list: 프린터별 {'printer_name', 'status', 'pending', 'ribbon_count', 'drained'} 목록
+        """
+        result = []
+        with self._lock:
+            for member in self._members:
+                latest = member.printer.device.monitor.latest
+                result.append({
+                    "printer_name": member.name,
+                    "status": latest[1] if latest is not None else None,
+                    "pending": len(member.jobs),
+                    "ribbon_count": member.ribbon_count,
+                    "drained": member.drained,
+                })
+        return result
+
+    def assigned_printer(self, future):
+        """
+        작업을 맡고 있는 프린터를 반환합니다.
+
+        Args:
+            future (Future): submit*()이 반환한 Future
+
+        Returns:
+            HiTiPrinter: 작업을 맡은 프린터. 대기 중이거나 끝난 작업이면 None
+        """
+        with self._lock:
+            for member in self._members:
+                if any(job.future is future for job in member.jobs):
+                    return member.printer
+        return None
+
+    @property
+    def pending(self):
+        """완료되지 않은 작업 수 (대기 중인 작업 포함)"""
+        with self._lock:
+            return len(self._waiting) + sum(len(member.jobs) for member in self._members)
+
+    def close(self, wait=True, cancel_pending=False):
+        """
+        모든 프린터의 인쇄 큐와 상태 모니터를 종료합니다.
+
+        Args:
+            wait (bool): 진행 중인 작업이 끝날 때까지 대기 여부
+            cancel_pending (bool): 아직 시작되지 않은 작업을 취소할지 여부
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            waiting = list(self._waiting)
+            self._waiting.clear()
+
+        for job in waiting:
+            job.future.cancel()
+
+        for member in self._members:
+            member.printer.close(wait=wait, cancel_pending=cancel_pending)
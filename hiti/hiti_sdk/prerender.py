@@ -0,0 +1,393 @@
+# hiti_sdk/prerender.py
+"""
+디자인 에셋 일괄 사전 렌더링
+
+행사 전에 프레임, 배경 디자인 디렉터리를 용지 유형과 인쇄 방향별 인쇄용 비트맵으로
+미리 변환하여 데이터 파일 하나(pages.bin)와 목록(manifest.json)으로 저장합니다.
+실행 중에는 AssetPack이 데이터 파일을 한 번만 메모리 매핑하여 각 페이지를 복사 없이
+ImageData로 제공하므로, 인쇄할 때 디코딩, 크기 조정, BGR 변환을 반복하지 않습니다.
+SmartComm/R600 카드 프린터용으로는 카드 크기로 맞춘 24비트 BMP 파일을 만듭니다
+(두 SDK의 DLL은 이미지 파일 경로를 받으므로).
+
+    python -m hiti_sdk.prerender designs/ prerendered/ --paper PHOTO_4X6 PHOTO_6X8 --card smartcomm
+
+    pack = AssetPack("prerendered/")
+    printer.page_cache.add_pack(pack)       # print_image("designs/frame01.png")가 미리 렌더링된 페이지 사용
+    image_data = pack.get("frame01.png", PaperType.PHOTO_4X6)
+"""
+import os
+import sys
+import json
+import mmap
+import time
+import hashlib
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from PIL import Image
+
+from .constants import PaperType, Orientation
+from .exceptions import ImageError
+from .image import ImageData, prepare_image, _contiguous
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+DATA_NAME = "pages.bin"
+MANIFEST_VERSION = 1
+
+# 페이지 시작 위치 정렬 (메모리 페이지 경계)
+PAGE_ALIGN = 4096
+
+# 디자인으로 인식할 확장자
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".dib", ".tif", ".tiff", ".webp", ".gif")
+
+# 카드 프린터별 세로 방향 인쇄 크기 (CR80 카드, 300dpi)
+CARD_SIZES = {
+    "smartcomm": (638, 1011),
+    "r600": (638, 1011),
+}
+
+
+def _aligned(offset):
+    return (offset + PAGE_ALIGN - 1) // PAGE_ALIGN * PAGE_ALIGN
+
+
+def _page_size(paper_type, orientation):
+    """용지와 방향에 따른 (너비, 높이, 4바이트 정렬 행 크기)"""
+    width, height = PaperType.get_dimensions(paper_type)
+    if orientation == Orientation.LANDSCAPE:
+        width, height = height, width
+    return width, height, ((width * 3 + 3) // 4) * 4
+
+
+def _file_digest(path):
+    """파일 내용 SHA-1"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_designs(source_dir):
+    """
+    디렉터리(하위 디렉터리 포함)의 디자인 이미지 목록
+
+    Returns:
+        list: (이름, 경로) 목록. 이름은 source_dir 기준 상대 경로 ('/' 구분)
+    """
+    designs = []
+    for root, _, files in os.walk(source_dir):
+        for filename in files:
+            if filename.lower().endswith(IMAGE_EXTENSIONS):
+                path = os.path.join(root, filename)
+                designs.append((os.path.relpath(path, source_dir).replace(os.sep, "/"), path))
+    return sorted(designs)
+
+
+def _design_orientation(path):
+    """디자인의 가로세로 비율에 맞는 인쇄 방향"""
+    with Image.open(path) as img:
+        width, height = img.size
+    return Orientation.LANDSCAPE if width > height else Orientation.PORTRAIT
+
+
+def _render_page(source, paper_type, orientation, data_path, offset):
+    """작업 프로세스: 페이지를 준비하여 데이터 파일의 정해진 위치에 기록"""
+    image_data = prepare_image(source, paper_type, orientation)
+    with open(data_path, "r+b") as f:
+        f.seek(offset)
+        f.write(image_data.data_buffer)
+
+
+def _render_card(source, size, output_path):
+    """작업 프로세스: 카드 크기 24비트 BMP 저장"""
+    with Image.open(source) as img:
+        img = img.convert("RGB")
+        if img.size != size:
+            img = img.resize(size, Image.LANCZOS)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        img.save(output_path, format="BMP")
+
+
+def build_pack(source_dir, output_dir, paper_types=None, orientations=None, cards=(), max_workers=None):
+    """
+    디자인 디렉터리를 미리 렌더링하여 output_dir에 저장합니다.
+
+    모든 페이지의 크기는 용지로 정해지므로 데이터 파일 안의 위치를 먼저 정하고,
+    작업 프로세스가 각자 자기 위치에 직접 기록합니다 (비트맵을 프로세스 간에 주고받지 않음).
+    데이터 파일과 목록은 임시 이름으로 만든 뒤 마지막에 교체합니다.
+
+    Args:
+        source_dir (str): 디자인 디렉터리
+        output_dir (str): 결과 디렉터리
+        paper_types (list, optional): 렌더링할 용지 유형. None이면 모든 PaperType
+        orientations (list, optional): 렌더링할 인쇄 방향. None이면 디자인 비율에 맞는 방향
+        cards (list): 카드 BMP를 만들 카드 프린터 (CARD_SIZES의 키)
+        max_workers (int, optional): 작업 프로세스 수. None이면 CPU 수
+
+    Returns:
+        dict: 저장한 목록 (manifest.json 내용)
+
+    Raises:
+        ImageError: 디자인이 없거나 렌더링에 실패한 디자인이 있는 경우 (성공한 페이지는 저장됨)
+    """
+    paper_types = list(paper_types) if paper_types else list(PaperType)
+    for card in cards:
+        if card not in CARD_SIZES:
+            raise ImageError(f"알 수 없는 카드 프린터: {card} (지원: {', '.join(CARD_SIZES)})")
+
+    designs = find_designs(source_dir)
+    if not designs:
+        raise ImageError(f"디자인 이미지가 없습니다: {source_dir}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    data_path = os.path.join(output_dir, DATA_NAME)
+    temp_data_path = data_path + ".tmp"
+
+    # 페이지 배치 (위치를 미리 정해 작업 프로세스가 바로 기록)
+    pages = []
+    card_entries = []
+    failed = set()
+    offset = 0
+    for name, path in designs:
+        try:
+            source = {"source_size": os.path.getsize(path), "source_sha1": _file_digest(path)}
+            design_orientation = _design_orientation(path)
+        except (OSError, Image.DecompressionBombError) as e:
+            logger.error(f"디자인을 읽을 수 없습니다: {name}: {e}")
+            failed.add(name)
+            continue
+        for paper_type in paper_types:
+            for orientation in (orientations or [design_orientation]):
+                width, height, width_bytes = _page_size(paper_type, orientation)
+                pages.append(dict(source, name=name, paper_type=int(paper_type), orientation=int(orientation),
+                                  width=width, height=height, width_bytes=width_bytes, bits_per_pixel=24,
+                                  offset=offset, size=width_bytes * height))
+                offset = _aligned(offset + width_bytes * height)
+        for card in cards:
+            width, height = CARD_SIZES[card]
+            if design_orientation == Orientation.LANDSCAPE:
+                width, height = height, width
+            card_entries.append(dict(source, name=name, target=card, width=width, height=height,
+                                     path=f"cards/{card}/{name}.bmp"))
+
+    logger.info(f"사전 렌더링 시작: 디자인 {len(designs)}개, 페이지 {len(pages)}개 "
+                f"({offset / (1024 * 1024):.0f}MB), 카드 {len(card_entries)}개")
+
+    with open(temp_data_path, "wb") as f:
+        f.truncate(offset)
+
+    sources = dict(designs)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for page in pages:
+            future = executor.submit(_render_page, sources[page["name"]], PaperType(page["paper_type"]),
+                                     Orientation(page["orientation"]), temp_data_path, page["offset"])
+            futures[future] = page["name"]
+        for card in card_entries:
+            future = executor.submit(_render_card, sources[card["name"]], (card["width"], card["height"]),
+                                     os.path.join(output_dir, card["path"]))
+            futures[future] = card["name"]
+
+        for done, future in enumerate(as_completed(futures), 1):
+            name = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                if name not in failed:
+                    logger.error(f"디자인 렌더링 실패: {name}: {e}")
+                failed.add(name)
+            if done % 50 == 0 or done == len(futures):
+                logger.info(f"진행: {done}/{len(futures)}")
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "created": time.time(),
+        "data": DATA_NAME,
+        "data_size": offset,
+        "pages": [page for page in pages if page["name"] not in failed],
+        "cards": [card for card in card_entries if card["name"] not in failed],
+    }
+
+    # 데이터 파일을 먼저 교체해야 목록이 가리키는 페이지가 항상 존재
+    os.replace(temp_data_path, data_path)
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+    logger.info(f"사전 렌더링 완료: 페이지 {len(manifest['pages'])}개, 카드 {len(manifest['cards'])}개, "
+                f"{time.perf_counter() - start:.1f}초")
+    if failed:
+        raise ImageError(f"렌더링에 실패한 디자인 {len(failed)}개: {', '.join(sorted(failed))}")
+    return manifest
+
+
+class AssetPack:
+    """
+    build_pack()으로 만든 사전 렌더링 결과
+
+    데이터 파일 전체를 복사 시 쓰기(ACCESS_COPY)로 한 번 매핑하고, 각 페이지는 매핑의
+    일부를 가리키는 ImageData로 제공합니다. 사용 중에는 데이터 파일을 다시 만들지 마세요
+    (Windows에서는 매핑된 파일을 교체할 수 없으므로 새 디렉터리에 만든 뒤 바꿔 여세요).
+    """
+    def __init__(self, directory):
+        """
+        사전 렌더링 결과를 엽니다.
+
+        Args:
+            directory (str): build_pack()의 output_dir
+
+        Raises:
+            ImageError: 목록이나 데이터 파일이 없거나 손상된 경우
+        """
+        self.directory = directory
+        try:
+            with open(os.path.join(directory, MANIFEST_NAME), encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ImageError(f"사전 렌더링 목록을 읽을 수 없습니다: {directory} ({e})")
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ImageError(f"지원하지 않는 사전 렌더링 목록 버전: {manifest.get('version')}")
+
+        self._pages = {}       # (이름, 용지, 방향) -> 항목
+        self._by_digest = {}   # (SHA-1, 용지, 방향) -> 항목
+        self._source_sizes = set()
+        self._digests = {}     # (경로, 수정 시각, 크기) -> SHA-1 (같은 파일을 다시 해시하지 않음)
+        self._images = {}      # 항목 위치 -> ImageData (비트맵 구조체 재사용)
+        self._cards = {(card["name"], card["target"]): card for card in manifest.get("cards", [])}
+
+        self._mmap = None
+        data_path = os.path.join(directory, manifest["data"])
+        with open(data_path, "rb") as f:
+            data_size = os.fstat(f.fileno()).st_size
+            if data_size:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        for page in manifest.get("pages", []):
+            if page["offset"] + page["size"] > data_size:
+                raise ImageError(f"사전 렌더링 데이터 파일이 잘렸습니다: {data_path}")
+            key = (page["paper_type"], page["orientation"])
+            self._pages[(page["name"],) + key] = page
+            self._by_digest[(page["source_sha1"],) + key] = page
+            self._source_sizes.add(page["source_size"])
+
+        logger.info(f"사전 렌더링 결과 열기: {directory} (페이지 {len(self._pages)}개)")
+
+    def _image_data(self, page):
+        image_data = self._images.get(page["offset"])
+        if image_data is None:
+            view = memoryview(self._mmap)[page["offset"]:page["offset"] + page["size"]]
+            image_data = ImageData(page["width"], page["height"], view, page["bits_per_pixel"])
+            self._images[page["offset"]] = image_data
+        return image_data
+
+    def get(self, name, paper_type=PaperType.PHOTO_4X6, orientation=Orientation.PORTRAIT):
+        """
+        디자인 이름으로 미리 렌더링된 페이지를 가져옵니다.
+
+        Args:
+            name (str): 디자인 디렉터리 기준 상대 경로 (예: "frames/frame01.png")
+            paper_type (PaperType): 용지 유형
+            orientation (Orientation): 인쇄 방향
+
+        Returns:
+            ImageData: 미리 렌더링된 페이지. 없으면 None
+        """
+        page = self._pages.get((name, int(paper_type), int(orientation)))
+        return self._image_data(page) if page is not None else None
+
+    def find(self, image_path, paper_type=PaperType.PHOTO_4X6, orientation=Orientation.PORTRAIT):
+        """
+        이미지 파일(또는 인코딩된 바이트) 내용으로 미리 렌더링된 페이지를 찾습니다 (PageCache가 사용).
+        크기가 같은 디자인이 있을 때만 해시를 계산하며, 파일의 해시는 경로+수정 시각+크기로 기억합니다.
+
+        Returns:
+            ImageData: 미리 렌더링된 페이지. 없거나 PIL 이미지, 배열이면 None
+        """
+        if isinstance(image_path, (bytes, bytearray, memoryview)):
+            if memoryview(image_path).nbytes not in self._source_sizes:
+                return None
+            page = self._by_digest.get((hashlib.sha1(_contiguous(image_path)).hexdigest(), int(paper_type), int(orientation)))
+            return self._image_data(page) if page is not None else None
+        if not isinstance(image_path, (str, os.PathLike)):
+            return None
+        try:
+            stat = os.stat(image_path)
+            if stat.st_size not in self._source_sizes:
+                return None
+            file_key = (os.path.realpath(image_path), stat.st_mtime_ns, stat.st_size)
+            digest = self._digests.get(file_key)
+            if digest is None:
+                digest = self._digests[file_key] = _file_digest(image_path)
+            page = self._by_digest.get((digest, int(paper_type), int(orientation)))
+        except OSError:
+            return None
+        return self._image_data(page) if page is not None else None
+
+    def card_path(self, name, target):
+        """
+        카드 프린터용 BMP 경로
+
+        Args:
+            name (str): 디자인 이름
+            target (str): 카드 프린터 ("smartcomm" 또는 "r600")
+
+        Returns:
+            str: BMP 파일 경로. 없으면 None
+        """
+        card = self._cards.get((name, target))
+        return os.path.join(self.directory, card["path"]) if card is not None else None
+
+    @property
+    def names(self):
+        """미리 렌더링된 디자인 이름 목록"""
+        return sorted({name for name, _, _ in self._pages})
+
+    def __len__(self):
+        return len(self._pages)
+
+    def close(self):
+        """매핑 해제 (페이지가 아직 참조 중이면 가비지 수집 때 해제됨)"""
+        self._images.clear()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                logger.debug("사전 렌더링 매핑이 아직 사용 중입니다.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='HiTi 디자인 에셋 사전 렌더링')
+    parser.add_argument('source', help='디자인 디렉터리')
+    parser.add_argument('output', help='결과 디렉터리 (manifest.json, pages.bin, cards/)')
+    parser.add_argument('--paper', nargs='+', choices=[paper.name for paper in PaperType],
+                        help='렌더링할 용지 유형 (기본: 전체)')
+    parser.add_argument('--orientation', nargs='+', choices=['portrait', 'landscape'],
+                        help='렌더링할 인쇄 방향 (기본: 디자인 비율에 맞는 방향)')
+    parser.add_argument('--card', nargs='+', default=[], choices=sorted(CARD_SIZES),
+                        help='카드 크기 BMP를 만들 카드 프린터')
+    parser.add_argument('--workers', type=int, help='작업 프로세스 수 (기본: CPU 수)')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    orientations = None
+    if args.orientation:
+        orientations = [Orientation[name.upper()] for name in args.orientation]
+    paper_types = [PaperType[name] for name in args.paper] if args.paper else None
+
+    try:
+        build_pack(args.source, args.output, paper_types, orientations, args.card, args.workers)
+    except ImageError as e:
+        logger.error(str(e))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,48 +2,51 @@
 """
 HiTi 프린터 제어를 위한 고수준 인터페이스
 """
-import os
 import sys
 import logging
 import time
 import ctypes
-from enum import IntEnum, auto
+import threading
 from pathlib import Path
 
 from .constants import PaperType, Orientation, PrintMode, PrintFlag, DeviceStatus
 from .exceptions import PrinterError, ConnectionError, PrintError, StatusError, ImageError
 from .device import HiTiDevice, find_printers, HITI_JOB_PROPERTY_RT
-from .image import prepare_image, create_split_image, ImageData
+from .image import prepare_image, create_split_image, ImageData, check_image_source, describe_source
+from .cache import PageCache
+from .layout import get_layout
+from .jobs import PrintQueue
+from .status import PrinterStatus
+from . import tracing
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
 
-class PrinterStatus(IntEnum):
-    """프린터 상태"""
-    READY = auto()           # 인쇄 준비 완료
-    BUSY = auto()            # 사용 중
-    PRINTING = auto()        # 인쇄 중
-    ERROR = auto()           # 오류 상태
-    OFFLINE = auto()         # 오프라인
-    UNKNOWN = auto()         # 알 수 없는 상태
-
-
 class HiTiPrinter:
     """HiTi 프린터 제어 클래스"""
-    def __init__(self, printer_name=None):
+    def __init__(self, printer_name=None, page_cache=None, device=None):
         """
         HiTi 프린터를 초기화합니다.
         
         Args:
             printer_name (str, optional): 프린터 이름. None인 경우 첫 번째 발견된 프린터 사용
+            page_cache (PageCache, optional): 준비된 페이지 캐시. None인 경우 기본 용량으로 생성
+            device (HiTiDevice, optional): find_printers()로 찾은 장치. 지정하면 printer_name 무시
             
         Raises:
             ConnectionError: 프린터에 연결할 수 없는 경우
         """
         self.device = None
+        self.page_cache = page_cache if page_cache is not None else PageCache()
+        self._queue = None
+        self._queue_lock = threading.Lock()
         
-        if printer_name is None:
+        if device is not None:
+            # 이미 검색된 장치 사용
+            self.device = device
+            logger.info(f"지정된 장치 사용: {device.printer_name}")
+        elif printer_name is None:
             # 자동으로 프린터 검색
             printers = find_printers()
             if not printers:
@@ -67,10 +70,45 @@ class HiTiPrinter:
         except Exception as e:
             raise ConnectionError(f"프린터 연결 확인 중 오류 발생: {e}")
     
-    def get_status(self):
+    def _to_printer_status(self, status_code, status_desc=None):
+        """장치 상태 코드를 (PrinterStatus, 설명)으로 변환"""
+        decoded = self.device.decode_status(status_code)
+        return decoded.state, status_desc or decoded.description
+    
+    def _wait_for_completion(self, timeout):
+        """
+        상태 모니터를 통해 인쇄가 끝날 때까지 대기합니다.
+        
+        Returns:
+            bool: 준비 상태가 되면 True, 타임아웃 시 False
+            
+        Raises:
+            PrintError: 오류 상태가 확인된 경우
+        """
+        status_code = self.device.monitor.wait_for(
+            tracing.watch(lambda code: self.device.decode_status(code).state in (PrinterStatus.READY, PrinterStatus.ERROR)),
+            timeout
+        )
+        
+        if status_code is None:
+            return False
+        
+        if status_code != 0:
+            _, status_desc = self.device.monitor.latest
+            raise PrintError(f"인쇄 중 오류 발생: {status_desc}", status_code)
+        
+        # 인쇄 중에 조회된 리본 잔량/인쇄 매수는 오래된 값이므로 무효화
+        self.device.info.invalidate()
+        return True
+    
+    def get_status(self, max_age=None):
         """
         프린터 상태를 확인합니다.
         
+        Args:
+            max_age (float, optional): 상태 모니터가 이 시간(초) 안에 확인한 상태가 있으면
+                DLL을 호출하지 않고 그 값을 사용. None이면 항상 새로 확인
+        
         Returns:
             tuple: (PrinterStatus, str) - 상태 코드와 설명
             
@@ -78,23 +116,41 @@ class HiTiPrinter:
             StatusError: 상태 확인 실패 시
         """
         try:
-            status_code, status_desc = self.device.check_status()
+            if max_age is not None and self.device.monitor.age <= max_age:
+                status_code, status_desc = self.device.monitor.latest
+                return self._to_printer_status(status_code, status_desc)
             
-            if status_code == 0:
-                return PrinterStatus.READY, "준비 완료"
-            elif status_code == DeviceStatus.BUSY:
-                return PrinterStatus.BUSY, "사용 중"
-            elif status_code == DeviceStatus.PRINTING:
-                return PrinterStatus.PRINTING, "인쇄 중"
-            elif status_code == DeviceStatus.OFFLINE:
-                return PrinterStatus.OFFLINE, "오프라인"
-            else:
-                return PrinterStatus.ERROR, status_desc
+            status_code, status_desc = self.device.check_status()
+            return self._to_printer_status(status_code, status_desc)
                 
         except Exception as e:
             logger.error(f"프린터 상태 확인 중 오류 발생: {e}")
             raise StatusError(f"프린터 상태 확인 실패: {e}")
     
+    def estimate_duration(self, paper_type=PaperType.PHOTO_4X6, print_mode=PrintMode.STANDARD, copies=1):
+        """
+        이 프린터에서 인쇄하는 데 걸릴 예상 시간을 반환합니다 (같은 모델의 이전 인쇄 기록 기준).
+        
+        Args:
+            paper_type (PaperType): 용지 유형
+            print_mode (PrintMode): 인쇄 품질 모드
+            copies (int): 인쇄 매수
+        
+        Returns:
+            float: 예상 소요 시간(초). 기록이 없으면 None
+        """
+        key = self.device.history_key(paper_type, print_mode)
+        return self.device.tracker.history.estimate(key, copies)
+    
+    def eta(self):
+        """
+        진행 중인 인쇄가 끝날 때까지 남은 예상 시간을 반환합니다.
+        
+        Returns:
+            float: 남은 시간(초). 진행 중인 인쇄가 없거나 기록이 없으면 None
+        """
+        return self.device.tracker.eta()
+    
     def wait_until_ready(self, timeout=60):
         """
         프린터가 준비될 때까지 대기합니다.
@@ -114,6 +170,192 @@ class HiTiPrinter:
             logger.error(f"프린터 대기 중 오류 발생: {e}")
             raise StatusError(f"프린터 대기 실패: {e}")
     
+    def _check_ready_to_print(self, wait_for_completion, timeout):
+        """
+        인쇄를 시작할 수 있는 상태인지 확인합니다.
+        
+        인쇄 중인 경우 wait_for_completion이 True이면 준비될 때까지 대기합니다.
+        
+        Raises:
+            PrintError: 인쇄를 시작할 수 없는 상태인 경우
+        """
+        status, status_desc = self.get_status()
+        if status not in [PrinterStatus.READY, PrinterStatus.BUSY]:
+            if status == PrinterStatus.ERROR:
+                raise PrintError(f"프린터 오류 상태: {status_desc}")
+            elif status == PrinterStatus.OFFLINE:
+                raise PrintError("프린터가 오프라인 상태입니다.")
+            elif status == PrinterStatus.PRINTING:
+                if not wait_for_completion:
+                    raise PrintError("프린터가 이미 인쇄 중입니다.")
+                # 인쇄 중이면 완료될 때까지 대기
+                if not self.wait_until_ready(timeout):
+                    raise PrintError("인쇄 중인 작업이 완료될 때까지 기다리는 동안 타임아웃 발생")
+    
+    def _print_prepared_image(self, image_data, image_path, paper_type, orientation, copies,
+                              print_mode, apply_matte, wait_for_completion, timeout):
+        """
+        준비된 이미지 데이터를 매수만큼 인쇄합니다. 비트맵은 한 번만 만들어 모든 매수에 사용합니다.
+        
+        Args:
+            image_data (ImageData): 준비된 이미지 데이터
+            image_path (str): 원본 이미지 이름 (로그용, describe_source 결과)
+        
+        나머지 인자는 print_image와 같습니다.
+        
+        Returns:
+            bool: 성공 여부
+            
+        Raises:
+            PrintError: 인쇄 실패 시
+        """
+        # 모델이 여러 매수를 한 번에 인쇄하면 shCopies로 묶어서 요청하고,
+        # 그렇지 않으면 같은 비트맵을 한 장씩 다시 보냄
+        capabilities = self.device.capabilities
+        batch_size = max(1, capabilities.max_copies) if capabilities.native_copies else 1
+        batches = [min(batch_size, copies - sent) for sent in range(0, copies, batch_size)]
+        
+        # 인쇄 작업 속성 설정 (모든 요청에 공통)
+        job_prop = HITI_JOB_PROPERTY_RT()
+        job_prop.dwSize = ctypes.sizeof(HITI_JOB_PROPERTY_RT)
+        job_prop.hParentWnd = None
+        job_prop.dwPaperType = paper_type
+        job_prop.dwPrintMode = print_mode
+        job_prop.shOrientation = orientation
+        job_prop.dwFlags = PrintFlag.NOT_SHOW_ERROR_MSG_DLG
+        job_prop.dwApplyMatte = 1 if apply_matte else 0
+        
+        # 비트맵 생성 (이미지 버퍼를 복사 없이 참조, 모든 요청에 재사용)
+        with tracing.phase("to_bitmap"):
+            bitmap = image_data.to_bitmap()
+        
+        trace = tracing.current()
+        if trace is not None:
+            trace.add_bytes("bitmap", len(image_data.data_buffer))
+        
+        logger.info(f"이미지 인쇄 시작: {image_path}, 용지: {paper_type}, 방향: {orientation}, 매수: {copies} "
+                    f"(요청 {len(batches)}회)")
+        
+        printed = 0
+        for i, batch in enumerate(batches):
+            # 앞 요청의 데이터 전송이 끝나면 바로 다음 요청 (인쇄 완료까지 기다리지 않음)
+            if i > 0:
+                with tracing.phase("wait_data"):
+                    self._wait_for_data_accepted(30, printed, copies)
+            
+            job_prop.shCopies = batch
+            with tracing.phase("print_page"):
+                result = self.device.print_page(job_prop, bitmap)
+            
+            if result != 0 and result != 1801:  # 1801은 일부 프린터에서 성공 코드
+                raise PrintError(f"인쇄 작업 시작 실패 (매수 {printed+1}/{copies})", result)
+            
+            printed += batch
+            logger.info(f"인쇄 요청 {printed}/{copies}이(가) 성공적으로 시작되었습니다.")
+        
+        # 마지막 인쇄 완료 대기 (wait_for_completion이 True인 경우)
+        if wait_for_completion:
+            logger.info(f"마지막 인쇄 완료까지 최대 {timeout//2}초 대기 중...")
+            
+            with tracing.phase("wait_completion"):
+                completed = self._wait_for_completion(timeout // 2)
+            if completed:
+                logger.info("모든 인쇄가 완료되었습니다.")
+                return True
+            
+            # 타임아웃
+            logger.warning(f"마지막 인쇄 완료 대기 중 타임아웃 발생 ({timeout//2}초)")
+        
+        return True
+    
+    def _wait_for_data_accepted(self, timeout, printed, copies):
+        """
+        프린터가 앞 요청의 데이터를 모두 받을 때까지 대기합니다
+        (프린터가 인쇄 중 또는 준비 상태를 알릴 때까지). 사용 중(BUSY)이나
+        표에 없는 상태 코드는 드라이버가 아직 데이터를 보내는 중일 수 있으므로 계속 기다립니다.
+        
+        Raises:
+            PrintError: 오류 상태가 되거나 타임아웃된 경우
+        """
+        decoder = self.device.status_decoder
+        
+        def accepted(code):
+            if code not in decoder:
+                return False
+            state = decoder.decode(code).state
+            return (code == DeviceStatus.PRINTING
+                    or state in (PrinterStatus.READY, PrinterStatus.ERROR, PrinterStatus.OFFLINE))
+        
+        status_code = self.device.monitor.wait_for(tracing.watch(accepted), timeout)
+        
+        if status_code is None:
+            raise PrintError(f"데이터 전송 대기 중 타임아웃 발생. 매수 {printed+1}/{copies} 인쇄 중단")
+        
+        status, status_desc = self._to_printer_status(status_code, self.device.monitor.latest[1])
+        if status in (PrinterStatus.ERROR, PrinterStatus.OFFLINE):
+            raise PrintError(f"인쇄 중 오류 발생: {status_desc}. 매수 {printed+1}/{copies} 인쇄 중단", status_code)
+    
+    def _print_prepared_sheet(self, image_data, image_count, paper_type, orientation, copies,
+                              print_mode, apply_matte, wait_for_completion, timeout):
+        """
+        준비된 분할 이미지 데이터를 인쇄합니다.
+        
+        Args:
+            image_data (ImageData): 준비된 분할 이미지 데이터
+            image_count (int): 배치된 이미지 수 (로그용)
+        
+        나머지 인자는 print_split_images와 같습니다.
+        
+        Returns:
+            bool: 성공 여부
+            
+        Raises:
+            PrintError: 인쇄 실패 시
+        """
+        # 인쇄 작업 속성 설정
+        job_prop = HITI_JOB_PROPERTY_RT()
+        job_prop.dwSize = ctypes.sizeof(HITI_JOB_PROPERTY_RT)
+        job_prop.hParentWnd = None
+        job_prop.dwPaperType = paper_type
+        job_prop.dwPrintMode = print_mode
+        job_prop.shOrientation = orientation
+        job_prop.shCopies = copies
+        job_prop.dwFlags = PrintFlag.NOT_SHOW_ERROR_MSG_DLG
+        job_prop.dwApplyMatte = 1 if apply_matte else 0
+        
+        # 비트맵 생성
+        with tracing.phase("to_bitmap"):
+            bitmap = image_data.to_bitmap()
+        
+        trace = tracing.current()
+        if trace is not None:
+            trace.add_bytes("bitmap", len(image_data.data_buffer))
+        
+        # 인쇄 실행
+        logger.info(f"분할 이미지 인쇄 시작: {image_count}개 이미지, 용지: {paper_type}, 방향: {orientation}, 매수: {copies}")
+        with tracing.phase("print_page"):
+            result = self.device.print_page(job_prop, bitmap)
+        
+        if result != 0 and result != 1801:
+            raise PrintError(f"인쇄 작업 시작 실패", result)
+        
+        logger.info("인쇄 작업이 성공적으로 시작되었습니다.")
+        
+        # 인쇄 완료까지 대기
+        if wait_for_completion:
+            logger.info(f"인쇄 완료까지 최대 {timeout}초 대기 중...")
+            
+            with tracing.phase("wait_completion"):
+                completed = self._wait_for_completion(timeout)
+            if completed:
+                logger.info("인쇄가 완료되었습니다.")
+                return True
+            
+            # 타임아웃
+            raise PrintError(f"인쇄 완료 대기 중 타임아웃 발생 ({timeout}초)")
+        
+        return True
+    
     def print_image(self, image_path, paper_type=PaperType.PHOTO_4X6, 
                 orientation=Orientation.PORTRAIT, copies=1, print_mode=PrintMode.STANDARD,
                 apply_matte=False, wait_for_completion=False, timeout=120):
@@ -121,7 +363,8 @@ class HiTiPrinter:
         이미지를 인쇄합니다.
         
         Args:
-            image_path (str): 인쇄할 이미지 파일 경로
+            image_path (str | bytes | PIL.Image.Image | numpy.ndarray | BGRArray): 인쇄할 이미지 파일 경로
+                또는 메모리 이미지 (인코딩된 바이트, PIL 이미지, RGB(A) NumPy 배열, BGR 배열)
             paper_type (PaperType): 용지 유형
             orientation (Orientation): 인쇄 방향
             copies (int): 인쇄 매수
@@ -138,128 +381,23 @@ class HiTiPrinter:
             ImageError: 이미지 처리 실패 시
         """
         try:
-            # 이미지 경로 확인
-            if not os.path.exists(image_path):
-                raise ImageError(f"이미지 파일을 찾을 수 없습니다: {image_path}")
-            
-            # 프린터 상태 확인
-            status, status_desc = self.get_status()
-            if status not in [PrinterStatus.READY, PrinterStatus.BUSY]:
-                if status == PrinterStatus.ERROR:
-                    raise PrintError(f"프린터 오류 상태: {status_desc}")
-                elif status == PrinterStatus.OFFLINE:
-                    raise PrintError("프린터가 오프라인 상태입니다.")
-                elif status == PrinterStatus.PRINTING:
-                    if not wait_for_completion:
-                        raise PrintError("프린터가 이미 인쇄 중입니다.")
-                    # 인쇄 중이면 완료될 때까지 대기
-                    if not self.wait_until_ready(timeout):
-                        raise PrintError("인쇄 중인 작업이 완료될 때까지 기다리는 동안 타임아웃 발생")
-            
-            # 이미지 준비
-            image_data = prepare_image(image_path, paper_type, orientation)
-            
-            # 복수 매수 처리 방식 변경 - 한 장씩 개별 인쇄
-            actual_copies = 1  # 항상 1로 설정
-            success = True
-            
-            for i in range(copies):
-                # 반복 인쇄 시 프린터 상태 확인
-                if i > 0:
-                    # 프린터가 준비될 때까지 대기
-                    logger.info(f"다음 인쇄({i+1}/{copies})를 위해 프린터가 준비될 때까지 대기...")
-                    if not self.wait_until_ready(30):  # 30초 타임아웃
-                        raise PrintError(f"프린터가 준비 상태가 아닙니다. 매수 {i+1}/{copies} 인쇄 중단")
-                
-                # 인쇄 작업 속성 설정
-                job_prop = HITI_JOB_PROPERTY_RT()
-                job_prop.dwSize = ctypes.sizeof(HITI_JOB_PROPERTY_RT)
-                job_prop.hParentWnd = None
-                job_prop.dwPaperType = paper_type
-                job_prop.dwPrintMode = print_mode
-                job_prop.shOrientation = orientation
-                job_prop.shCopies = actual_copies  # 항상 1장씩만 인쇄
-                job_prop.dwFlags = PrintFlag.NOT_SHOW_ERROR_MSG_DLG
-                job_prop.dwApplyMatte = 1 if apply_matte else 0
-                
-                # 비트맵 생성
-                bitmap = image_data.to_bitmap()
+            # 이미지 입력 확인 (파일 경로이면 파일이 있는지 확인)
+            check_image_source(image_path)
+            name = describe_source(image_path)
+            
+            with tracing.job("image", [name], paper_type, orientation, copies):
+                # 프린터 상태 확인
+                with tracing.phase("check_ready"):
+                    self._check_ready_to_print(wait_for_completion, timeout)
                 
-                # 인쇄 실행
-                if i == 0:
-                    logger.info(f"이미지 인쇄 시작: {image_path}, 용지: {paper_type}, 방향: {orientation}, 매수: {copies} (1/{copies})")
-                else:
-                    logger.info(f"이미지 인쇄 계속: {i+1}/{copies}")
-                    
-                printer_name_bytes = self.device.printer_name.encode('utf-8')
+                # 이미지 준비
+                with tracing.phase("prepare"):
+                    image_data = self.page_cache.get_or_prepare(image_path, paper_type, orientation)
                 
-                result = self.device.dll.print_one_page(
-                    printer_name_bytes, 
-                    ctypes.byref(job_prop), 
-                    ctypes.byref(bitmap)
+                return self._print_prepared_image(
+                    image_data, name, paper_type, orientation, copies,
+                    print_mode, apply_matte, wait_for_completion, timeout
                 )
-                
-                if result != 0 and result != 1801:  # 1801은 일부 프린터에서 성공 코드
-                    raise PrintError(f"인쇄 작업 시작 실패 (매수 {i+1}/{copies})", result)
-                
-                logger.info(f"인쇄 작업 {i+1}/{copies}이(가) 성공적으로 시작되었습니다.")
-                
-                # 인쇄 완료까지 대기 (마지막 인쇄가 아닌 경우)
-                if wait_for_completion and i < copies - 1:
-                    logger.info(f"인쇄 완료까지 대기 중 ({i+1}/{copies})...")
-                    start_time = time.time()
-                    
-                    while time.time() - start_time < (timeout // copies):
-                        try:
-                            status_code, status_desc = self.device.check_status()
-                            
-                            # 0x00000002는 인쇄 진행 중 상태 - 정상적인 상태이므로 계속 대기
-                            if status_code == 0x00000002:
-                                logger.debug(f"인쇄 진행 중... (0x{status_code:08X})")
-                                time.sleep(1)
-                                continue
-                                
-                            # 준비 완료 상태 확인
-                            if status_code == 0:
-                                logger.info(f"인쇄 {i+1}/{copies}이(가) 완료되었습니다.")
-                                break
-                                
-                            # 심각한 오류 상태 확인
-                            if (status_code & 0x00080000) or (status_code & 0x00008000):
-                                raise PrintError(f"인쇄 중 오류 발생: {status_desc}", status_code)
-                                
-                            # 그 외 상태는 계속 대기
-                            logger.debug(f"프린터 상태: {status_desc} (0x{status_code:08X})")
-                            
-                        except Exception as e:
-                            if isinstance(e, PrintError):
-                                raise
-                            logger.warning(f"상태 확인 중 오류: {e}")
-                        
-                        time.sleep(1)  # 1초마다 확인
-            
-            # 마지막 인쇄 완료 대기 (wait_for_completion이 True인 경우)
-            if wait_for_completion:
-                logger.info(f"마지막 인쇄 완료까지 최대 {timeout//2}초 대기 중...")
-                start_time = time.time()
-                
-                while time.time() - start_time < (timeout // 2):
-                    status, _ = self.get_status()
-                    
-                    if status == PrinterStatus.READY:
-                        logger.info("모든 인쇄가 완료되었습니다.")
-                        return True
-                    
-                    if status == PrinterStatus.ERROR:
-                        status_code, status_desc = self.device.check_status()
-                        raise PrintError(f"인쇄 중 오류 발생: {status_desc}", status_code)
-                    
-                    time.sleep(1)  # 1초마다 확인
-                
-                # 타임아웃
-                logger.warning(f"마지막 인쇄 완료 대기 중 타임아웃 발생 ({timeout//2}초)")
-            
-            return True
             
         except ImageError as e:
             # 이미지 오류는 그대로 전달
@@ -277,8 +415,8 @@ class HiTiPrinter:
         여러 이미지를 하나의 용지에 분할 인쇄합니다.
         
         Args:
-            image_paths (list): 인쇄할 이미지 파일 경로 목록
-            paper_type (PaperType): 용지 유형 (분할 타입이어야 함)
+            image_paths (list): 인쇄할 이미지 파일 경로 또는 메모리 이미지 목록 (print_image와 같은 형식)
+            paper_type (PaperType): 용지 유형 (여러 장 배치가 정의된 타입이어야 함)
             orientation (Orientation): 인쇄 방향
             copies (int): 인쇄 매수
             print_mode (PrintMode): 인쇄 품질 모드
@@ -294,102 +432,183 @@ class HiTiPrinter:
             ImageError: 이미지 처리 실패 시
         """
         try:
-            # 용지 타입 확인
-            if paper_type not in [
-                PaperType.PHOTO_6X9_SPLIT_2UP, 
-                PaperType.PHOTO_4X6_SPLIT_2UP, 
-                PaperType.PHOTO_5X7_SPLIT_2UP, 
-                PaperType.PHOTO_4X6_SPLIT_3UP
-            ]:
+            # 용지 타입 확인 (여러 장 배치가 정의된 용지만 가능)
+            if get_layout(paper_type).count < 2:
                 raise ValueError(f"분할 인쇄에 적합하지 않은 용지 타입: {paper_type}")
             
-            # 이미지 경로 확인
-            for path in image_paths:
-                if not os.path.exists(path):
-                    raise ImageError(f"이미지 파일을 찾을 수 없습니다: {path}")
-            
-            # 프린터 상태 확인
-            status, status_desc = self.get_status()
-            if status not in [PrinterStatus.READY, PrinterStatus.BUSY]:
-                if status == PrinterStatus.ERROR:
-                    raise PrintError(f"프린터 오류 상태: {status_desc}")
-                elif status == PrinterStatus.OFFLINE:
-                    raise PrintError("프린터가 오프라인 상태입니다.")
-                elif status == PrinterStatus.PRINTING:
-                    if not wait_for_completion:
-                        raise PrintError("프린터가 이미 인쇄 중입니다.")
-                    # 인쇄 중이면 완료될 때까지 대기
-                    if not self.wait_until_ready(timeout):
-                        raise PrintError("인쇄 중인 작업이 완료될 때까지 기다리는 동안 타임아웃 발생")
-            
-            # 분할 이미지 생성
-            image_data = create_split_image(image_paths, paper_type, orientation)
-            
-            # 인쇄 작업 속성 설정
-            job_prop = HITI_JOB_PROPERTY_RT()
-            job_prop.dwSize = ctypes.sizeof(HITI_JOB_PROPERTY_RT)
-            job_prop.hParentWnd = None
-            job_prop.dwPaperType = paper_type
-            job_prop.dwPrintMode = print_mode
-            job_prop.shOrientation = orientation
-            job_prop.shCopies = copies
-            job_prop.dwFlags = PrintFlag.NOT_SHOW_ERROR_MSG_DLG
-            job_prop.dwApplyMatte = 1 if apply_matte else 0
-            
-            # 비트맵 생성
-            bitmap = image_data.to_bitmap()
+            # 이미지 입력 확인
+            for source in image_paths:
+                check_image_source(source)
             
-            # 인쇄 실행
-            logger.info(f"분할 이미지 인쇄 시작: {len(image_paths)}개 이미지, 용지: {paper_type}, 방향: {orientation}, 매수: {copies}")
-            printer_name_bytes = self.device.printer_name.encode('utf-8')
+            with tracing.job("split", [describe_source(source) for source in image_paths],
+                             paper_type, orientation, copies):
+                # 프린터 상태 확인
+                with tracing.phase("check_ready"):
+                    self._check_ready_to_print(wait_for_completion, timeout)
+                
+                # 분할 이미지 생성
+                with tracing.phase("prepare"):
+                    image_data = self.page_cache.get_or_create_split(image_paths, paper_type, orientation)
+                
+                return self._print_prepared_sheet(
+                    image_data, len(image_paths), paper_type, orientation, copies,
+                    print_mode, apply_matte, wait_for_completion, timeout
+                )
             
-            result = self.device.dll.print_one_page(
-                printer_name_bytes, 
-                ctypes.byref(job_prop), 
-                ctypes.byref(bitmap)
-            )
+        except ImageError as e:
+            # 이미지 오류는 그대로 전달
+            raise
+        except Exception as e:
+            logger.error(f"분할 인쇄 중 오류 발생: {e}")
+            if isinstance(e, PrintError):
+                raise
+            raise PrintError(f"분할 이미지 인쇄 중 오류 발생: {e}")
+    
+    def print_template(self, template, copies=1, print_mode=PrintMode.STANDARD,
+                       apply_matte=False, wait_for_completion=False, timeout=120, **values):
+        """
+        템플릿에 값을 채워 인쇄합니다. 용지 유형과 인쇄 방향은 템플릿을 따릅니다.
+        
+        Args:
+            template (PageTemplate): 인쇄할 템플릿
+            copies (int): 인쇄 매수
+            print_mode (PrintMode): 인쇄 품질 모드
+            apply_matte (bool): 무광택 코팅 적용 여부
+            wait_for_completion (bool): 인쇄 완료까지 대기 여부
+            timeout (float): 최대 대기 시간(초)
+            **values: 템플릿 영역 이름별 값 (PageTemplate.render와 같음)
             
-            if result != 0 and result != 1801:
-                raise PrintError(f"인쇄 작업 시작 실패", result)
+        Returns:
+            bool: 성공 여부
             
-            logger.info("인쇄 작업이 성공적으로 시작되었습니다.")
+        Raises:
+            PrintError: 인쇄 실패 시
+            ImageError: 이미지 처리 실패 시
+        """
+        try:
+            # 사진 영역 입력 확인 (텍스트 영역 값은 원본이 아님)
+            photos = [values[region.name] for region in template.regions
+                      if region.kind == "photo" and values.get(region.name) is not None]
+            for source in photos:
+                check_image_source(source)
+            sources = [describe_source(source) for source in photos]
             
-            # 인쇄 완료까지 대기
-            if wait_for_completion:
-                logger.info(f"인쇄 완료까지 최대 {timeout}초 대기 중...")
-                start_time = time.time()
+            with tracing.job("template", sources, template.paper_type, template.orientation, copies):
+                # 프린터 상태 확인
+                with tracing.phase("check_ready"):
+                    self._check_ready_to_print(wait_for_completion, timeout)
                 
-                while time.time() - start_time < timeout:
-                    status, _ = self.get_status()
-                    
-                    if status == PrinterStatus.READY:
-                        logger.info("인쇄가 완료되었습니다.")
-                        return True
-                    
-                    if status == PrinterStatus.ERROR:
-                        status_code, status_desc = self.device.check_status()
-                        raise PrintError(f"인쇄 중 오류 발생: {status_desc}", status_code)
-                    
-                    time.sleep(1)  # 1초마다 확인
+                # 동적 영역만 새로 그림 (페이지 캐시 사용 안 함)
+                with tracing.phase("prepare"):
+                    image_data = template.render(**values)
                 
-                # 타임아웃
-                raise PrintError(f"인쇄 완료 대기 중 타임아웃 발생 ({timeout}초)")
-            
-            return True
+                return self._print_prepared_image(
+                    image_data, "템플릿", template.paper_type, template.orientation, copies,
+                    print_mode, apply_matte, wait_for_completion, timeout
+                )
             
-        except ImageError as e:
+        except ImageError:
             # 이미지 오류는 그대로 전달
             raise
         except Exception as e:
-            logger.error(f"분할 인쇄 중 오류 발생: {e}")
+            logger.error(f"템플릿 인쇄 중 오류 발생: {e}")
             if isinstance(e, PrintError):
                 raise
-            raise PrintError(f"분할 이미지 인쇄 중 오류 발생: {e}")
+            raise PrintError(f"템플릿 인쇄 중 오류 발생: {e}")
+    
+    def print_spooled(self, entry, wait_for_completion=False, timeout=120):
+        """
+        스풀에서 가져온 작업을 인쇄합니다. 비트맵은 스풀 파일 매핑을 그대로 사용합니다.
+        
+        Args:
+            entry (SpoolEntry): PrintSpool.claim()으로 가져온 작업
+            wait_for_completion (bool): 인쇄 완료까지 대기 여부
+            timeout (float): 최대 대기 시간(초)
+            
+        Returns:
+            bool: 성공 여부
+            
+        Raises:
+            PrintError: 인쇄 실패 시
+        """
+        try:
+            with tracing.job("spool", [str(entry.path)], entry.paper_type, entry.orientation, entry.copies):
+                # 프린터 상태 확인
+                with tracing.phase("check_ready"):
+                    self._check_ready_to_print(wait_for_completion, timeout)
+                
+                return self._print_prepared_image(
+                    entry.image_data, f"스풀 {entry.job_id}", entry.paper_type, entry.orientation,
+                    entry.copies, entry.print_mode, entry.apply_matte, wait_for_completion, timeout
+                )
+            
+        except Exception as e:
+            logger.error(f"스풀 작업 인쇄 중 오류 발생: {e}")
+            if isinstance(e, PrintError):
+                raise
+            raise PrintError(f"스풀 작업 인쇄 중 오류 발생: {e}")
+    
+    @property
+    def queue(self):
+        """백그라운드 인쇄 큐 (처음 사용할 때 생성)"""
+        with self._queue_lock:
+            if self._queue is None:
+                self._queue = PrintQueue(self)
+            return self._queue
     
-    def get_device_info(self):
+    def submit(self, image_path, **options):
+        """
+        이미지 인쇄 작업을 백그라운드 큐에 등록하고 바로 반환합니다.
+        
+        Args:
+            image_path: 인쇄할 이미지 파일 경로 또는 메모리 이미지 (print_image와 같은 형식)
+            **options: print_image와 같은 인쇄 옵션
+            
+        Returns:
+            Future: 인쇄 결과(bool) 또는 예외를 담는 Future
+        """
+        return self.queue.submit(image_path, **options)
+    
+    def submit_split(self, image_paths, **options):
+        """
+        분할 인쇄 작업을 백그라운드 큐에 등록하고 바로 반환합니다.
+        
+        Args:
+            image_paths (list): 인쇄할 이미지 파일 경로 또는 메모리 이미지 목록
+            **options: print_split_images와 같은 인쇄 옵션
+            
+        Returns:
+            Future: 인쇄 결과(bool) 또는 예외를 담는 Future
+        """
+        if get_layout(options.get('paper_type', PaperType.PHOTO_6X9_SPLIT_2UP)).count < 2:
+            raise PrintError(f"분할 인쇄에 적합하지 않은 용지 타입: {options.get('paper_type')}")
+        return self.queue.submit_split(image_paths, **options)
+    
+    def close(self, wait=True, cancel_pending=False):
+        """
+        백그라운드 인쇄 큐와 상태 모니터를 종료합니다.
+        
+        Args:
+            wait (bool): 진행 중인 작업이 끝날 때까지 대기 여부
+            cancel_pending (bool): 아직 시작되지 않은 작업을 취소할지 여부
+        """
+        with self._queue_lock:
+            if self._queue is not None:
+                self._queue.shutdown(wait=wait, cancel_pending=cancel_pending)
+                self._queue = None
+        self.device.close()
+    
+    def get_device_info(self, max_age=None):
         """
         프린터 장치 정보를 가져옵니다.
         
+        일련번호, 모델 이름, 펌웨어 버전은 처음 한 번만 조회하고, 리본 정보와 인쇄 매수는
+        캐시 유효 시간이 지났거나 인쇄 후에만 다시 조회합니다.
+        
+        Args:
+            max_age (float, optional): 리본 정보/인쇄 매수의 허용 나이(초).
+                None이면 캐시 기본값, 0이면 항상 새로 조회
+        
         Returns:
             dict: 프린터 정보
             
@@ -397,23 +616,7 @@ class HiTiPrinter:
             PrinterError: 정보 조회 실패 시
         """
         try:
-            from .constants import DeviceInfoType
-            
-            serial = self.device.get_device_info(DeviceInfoType.MFG_SERIAL)
-            model = self.device.get_device_info(DeviceInfoType.MODEL_NAME)
-            firmware = self.device.get_device_info(DeviceInfoType.FIRMWARE_VERSION)
-            ribbon_info = self.device.get_device_info(DeviceInfoType.RIBBON_INFO)
-            print_count = self.device.get_device_info(DeviceInfoType.PRINT_COUNT)
-            
-            return {
-                "serial_number": serial,
-                "model_name": model,
-                "firmware_version": firmware,
-                "ribbon_type": ribbon_info["type"],
-                "ribbon_type_name": ribbon_info["type_name"],
-                "ribbon_count": ribbon_info["count"],
-                "print_count": print_count
-            }
+            return self.device.info.snapshot(max_age)
         except Exception as e:
             logger.error(f"장치 정보 조회 중 오류 발생: {e}")
             raise PrinterError(f"프린터 정보 조회 실패: {e}")
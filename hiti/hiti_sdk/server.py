@@ -0,0 +1,765 @@
+# hiti_sdk/server.py
+"""
+로컬 인쇄 서버
+
+한 PC에서 여러 키오스크 앱이 각자 HTRTApi.dll을 불러와 같은 프린터를 제어하면 서로
+충돌하고, 앱마다 DLL 로드와 프린터 검색 시간을 들여야 합니다. PrintServer는 장치,
+인쇄 큐, 상태 모니터를 한 프로세스에서 소유하고 로컬 소켓(유닉스 소켓 또는
+localhost TCP)으로 작업을 받습니다. 앱은 PrintClient로 이미지 바이트나 스풀 작업
+ID를 보내고 작업 번호와 진행 이벤트를 돌려받습니다.
+
+    # 서버 (한 번만 실행)
+    python -m hiti_sdk.server --spool C:\\kiosk\\spool
+
+    # 앱
+    client = PrintClient()
+    job_id = client.submit("photo.jpg", paper_type=PaperType.PHOTO_4X6)
+    for event in client.watch(job_id):
+        print(event)
+
+프로토콜: 메시지마다 JSON 헤더 한 줄(UTF-8, 줄바꿈으로 끝남)을 보내고, 헤더에
+size가 있으면 그 크기만큼의 바이트가 이어집니다. 요청 헤더의 op가 작업 종류이며
+응답은 {"ok": true, ...} 또는 {"ok": false, "error": ..., "type": 예외 이름}입니다.
+"""
+import os
+import json
+import time
+import socket
+import logging
+import argparse
+import tempfile
+import threading
+import socketserver
+from collections import deque
+
+from .constants import PaperType, Orientation, PrintMode
+from .exceptions import (PrinterError, ConnectionError, PrintError, DeviceError, StatusError,
+                         ImageError, DLLError, SpoolError)
+from .cache import PageCache
+from .pool import HiTiPrinterPool
+from .spool import PrintSpool
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 유닉스 소켓을 사용할 수 없을 때(Windows) 기본 포트
+DEFAULT_PORT = 52720
+
+# 헤더 한 줄의 최대 크기
+MAX_HEADER_BYTES = 64 * 1024
+
+# 요청 하나에 담을 수 있는 최대 이미지 크기 합계
+MAX_PAYLOAD_BYTES = 256 * 1024 * 1024
+
+# 끝난 작업 기록을 보관하는 최대 개수
+DEFAULT_MAX_FINISHED = 1000
+
+# 작업이 끝났음을 나타내는 이벤트
+FINAL_EVENTS = ("done", "failed", "cancelled")
+
+# 응답의 예외 이름 -> 예외 클래스
+_ERROR_TYPES = {cls.__name__: cls for cls in (PrinterError, ConnectionError, PrintError, DeviceError,
+                                               StatusError, ImageError, DLLError, SpoolError)}
+
+# 클라이언트가 지정할 수 있는 인쇄 옵션과 변환 함수
+_OPTION_TYPES = {
+    "paper_type": PaperType,
+    "orientation": Orientation,
+    "copies": int,
+    "print_mode": PrintMode,
+    "apply_matte": bool,
+    "wait_for_completion": bool,
+    "timeout": float,
+}
+
+
+def default_address():
+    """
+    기본 서버 주소
+
+    Returns:
+        str | tuple: 유닉스 소켓을 지원하면 임시 디렉터리의 소켓 경로, 아니면 ("127.0.0.1", DEFAULT_PORT)
+    """
+    if hasattr(socket, "AF_UNIX"):
+        return os.path.join(tempfile.gettempdir(), "hiti-print.sock")
+    return ("127.0.0.1", DEFAULT_PORT)
+
+
+def parse_address(value):
+    """
+    명령줄 주소 문자열 변환
+
+    Args:
+        value (str): 소켓 경로 또는 "host:port". None이면 기본 주소
+
+    Returns:
+        str | tuple: 소켓 경로 또는 (host, port)
+    """
+    if not value:
+        return default_address()
+    host, sep, port = value.rpartition(":")
+    if sep and port.isdigit() and "/" not in value and os.sep not in value:
+        return (host or "127.0.0.1", int(port))
+    return value
+
+
+def _read_message(rfile):
+    """
+    메시지 하나를 읽습니다.
+
+    Returns:
+        tuple: (헤더 dict, 이어지는 바이트). 연결이 끊겼으면 (None, b"")
+    """
+    line = rfile.readline(MAX_HEADER_BYTES + 1)
+    if not line:
+        return None, b""
+    if len(line) > MAX_HEADER_BYTES or not line.endswith(b"\n"):
+        raise ValueError("메시지 헤더가 너무 깁니다.")
+
+    header = json.loads(line)
+    if not isinstance(header, dict):
+        raise ValueError("메시지 헤더는 JSON 객체여야 합니다.")
+
+    size = header.get("size", 0)
+    if not isinstance(size, int) or size < 0 or size > MAX_PAYLOAD_BYTES:
+        raise ValueError(f"잘못된 데이터 크기: {size}")
+
+    payload = rfile.read(size) if size else b""
+    if len(payload) != size:
+        raise ValueError("데이터를 받는 중 연결이 끊겼습니다.")
+    return header, payload
+
+
+def _write_message(wfile, header, payload=b""):
+    """메시지 하나를 보냅니다."""
+    if payload:
+        header = dict(header, size=len(payload))
+    wfile.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n")
+    if payload:
+        wfile.write(payload)
+    wfile.flush()
+
+
+def _error_reply(error):
+    """예외를 오류 응답으로 변환"""
+    if isinstance(error, PrinterError):
+        return {"ok": False, "error": error.message, "error_code": error.error_code,
+                "type": type(error).__name__}
+    return {"ok": False, "error": str(error), "error_code": None, "type": PrintError.__name__}
+
+
+def _raise_error(reply):
+    """오류 응답을 예외로 변환하여 발생"""
+    error_type = _ERROR_TYPES.get(reply.get("type"), PrintError)
+    raise error_type(reply.get("error") or "알 수 없는 서버 오류", reply.get("error_code"))
+
+
+class _ServerJob:
+    """서버에 등록된 작업과 진행 이벤트"""
+    def __init__(self, job_id, kind, future):
+        self.job_id = job_id
+        self.kind = kind
+        self.future = future
+        self.state = "queued"
+        self.submitted = time.time()
+        self.finished = None
+        self.error = None
+        self.events = []
+        self.cond = threading.Condition()
+        self.add_event("queued")
+
+    def add_event(self, event, **fields):
+        """진행 이벤트 추가 후 대기 중인 watch 깨우기"""
+        with self.cond:
+            if self.finished is not None:
+                return
+            self.events.append(dict(fields, event=event, job_id=self.job_id, time=time.time()))
+            if event in FINAL_EVENTS:
+                self.state = event
+                self.finished = time.time()
+            self.cond.notify_all()
+
+    def to_dict(self):
+        """상태 조회 응답"""
+        with self.cond:
+            return {
+                "job_id": self.job_id,
+                "kind": self.kind,
+                "state": self.state,
+                "submitted": self.submitted,
+                "finished": self.finished,
+                "error": self.error,
+            }
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """연결 하나의 요청 처리 (연결마다 스레드 하나)"""
+    def handle(self):
+        server = self.server.print_server
+        while True:
+            try:
+                header, payload = _read_message(self.rfile)
+            except (ValueError, OSError) as e:
+                logger.warning(f"잘못된 요청: {e}")
+                try:
+                    _write_message(self.wfile, _error_reply(e))
+                except OSError:
+                    pass
+                return
+
+            if header is None:
+                return
+
+            try:
+                if header.get("op") == "watch":
+                    server._watch(header, self.wfile)
+                else:
+                    _write_message(self.wfile, server._handle(header, payload))
+            except OSError:
+                # 클라이언트가 먼저 연결을 끊음
+                return
+
+
+if hasattr(socket, "AF_UNIX"):
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class PrintServer:
+    """
+    장치, 인쇄 큐, 상태 모니터를 소유하는 로컬 인쇄 서버
+
+    작업은 HiTiPrinterPool로 분배되므로 여러 앱이 보낸 작업이 프린터마다 한 줄로
+    안전하게 인쇄됩니다. 올려 받은 이미지 바이트는 디스크에 쓰지 않고 바로 준비합니다.
+    """
+    def __init__(self, address=None, pool=None, spool=None, max_finished=DEFAULT_MAX_FINISHED):
+        """
+        인쇄 서버를 초기화하고 주소에 바인딩합니다.
+
+        Args:
+            address (str | tuple, optional): 유닉스 소켓 경로 또는 (host, port). None이면 default_address()
+            pool (HiTiPrinterPool, optional): 사용할 프린터 풀. None이면 연결된 모든 프린터로 생성
+            spool (str | PrintSpool, optional): 스풀 작업 ID로 인쇄할 스풀 (디렉터리 경로 또는 PrintSpool)
+            max_finished (int): 상태를 조회할 수 있도록 보관하는 끝난 작업 수
+
+        Raises:
+            ConnectionError: 사용할 수 있는 프린터가 없거나 주소를 사용할 수 없는 경우
+        """
+        self.address = address if address is not None else default_address()
+        self._owns_pool = pool is None
+        # 같은 사진이 다시 올라오면 캐시에서 찾도록 내용 해시 사용 (올려 받은 바이트는 항상 내용 해시)
+        self.pool = pool if pool is not None else HiTiPrinterPool(page_cache=PageCache(use_content_hash=True))
+
+        if spool is not None and not isinstance(spool, PrintSpool):
+            spool = PrintSpool(spool)
+        self.spool = spool
+        if self.spool is not None:
+            # 서버가 스풀을 비우는 유일한 프로세스이므로 이전 실행에서 남은 작업 복구
+            self.spool.recover()
+
+        self.max_finished = max(1, max_finished)
+        self._jobs = {}
+        self._finished = deque()
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._closed = False
+        self._serving = False
+        self._thread = None
+
+        self._ops = {
+            "submit": self._op_submit,
+            "submit_spool": self._op_submit_spool,
+            "status": self._op_status,
+            "cancel": self._op_cancel,
+            "printers": self._op_printers,
+        }
+
+        self._subscriptions = []
+        for printer in self.pool.printers:
+            callback = (lambda code, desc, printer=printer: self._on_status(printer, code, desc))
+            printer.device.monitor.subscribe(callback)
+            self._subscriptions.append((printer, callback))
+
+        try:
+            self._server = self._bind(self.address)
+        except OSError as e:
+            self._release()
+            if self._owns_pool:
+                self.pool.close()
+            raise ConnectionError(f"인쇄 서버 주소를 사용할 수 없습니다: {self.address} ({e})")
+        self._server.print_server = self
+        logger.info(f"인쇄 서버 준비: {self.address}")
+
+    @staticmethod
+    def _bind(address):
+        """주소 종류에 맞는 소켓 서버 생성"""
+        if isinstance(address, tuple):
+            return _TCPServer(address, _Handler)
+
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("이 플랫폼은 유닉스 소켓을 지원하지 않습니다.")
+        if os.path.exists(address):
+            # 이전 서버가 비정상 종료되어 남은 소켓 파일이면 지우고, 실행 중인 서버가 있으면 실패
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(address)
+            except OSError:
+                os.remove(address)
+            else:
+                raise OSError("다른 인쇄 서버가 실행 중입니다.")
+            finally:
+                probe.close()
+        return _UnixServer(address, _Handler)
+
+    def serve_forever(self):
+        """close()가 호출될 때까지 요청을 처리합니다."""
+        self._serving = True
+        logger.info(f"인쇄 서버 시작: {self.address}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._serving = False
+
+    def start(self):
+        """
+        백그라운드 스레드에서 요청 처리를 시작합니다.
+
+        Returns:
+            PrintServer: self
+        """
+        self._thread = threading.Thread(target=self.serve_forever, name="hiti-print-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def _new_job(self, kind, future):
+        """작업 번호를 붙여 등록하고 종료 처리를 연결"""
+        with self._lock:
+            job = _ServerJob(self._next_id, kind, future)
+            self._jobs[job.job_id] = job
+            self._next_id += 1
+        future.add_done_callback(lambda future: self._on_done(job, future))
+        return job
+
+    def _get_job(self, header):
+        job_id = header.get("job_id")
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise PrintError(f"작업을 찾을 수 없습니다: {job_id}")
+        return job
+
+    def _on_done(self, job, future):
+        """작업 종료 이벤트 기록 후 오래된 작업 기록 정리"""
+        if future.cancelled():
+            job.add_event("cancelled")
+        elif future.exception() is not None:
+            reply = _error_reply(future.exception())
+            job.error = reply["error"]
+            job.add_event("failed", error=reply["error"], error_code=reply["error_code"], type=reply["type"])
+        else:
+            job.add_event("done", result=future.result())
+        logger.info(f"서버 작업 {job.job_id} 종료: {job.state}")
+
+        with self._lock:
+            self._finished.append(job.job_id)
+            while len(self._finished) > self.max_finished:
+                self._jobs.pop(self._finished.popleft(), None)
+
+    def _on_status(self, printer, status_code, status_desc):
+        """상태 모니터 알림을 그 프린터가 맡은 진행 중인 작업의 이벤트로 전달"""
+        with self._lock:
+            active = [job for job in self._jobs.values() if job.finished is None]
+        active = [job for job in active if self.pool.assigned_printer(job.future) is printer]
+        if not active:
+            return
+
+        eta = printer.eta()
+        for job in active:
+            job.add_event("status", printer=printer.device.printer_name, code=status_code,
+                          description=status_desc, eta=eta)
+
+    def _handle(self, header, payload):
+        """요청 하나를 처리하고 응답 헤더 반환"""
+        handler = self._ops.get(header.get("op"))
+        if handler is None:
+            return _error_reply(PrintError(f"알 수 없는 요청: {header.get('op')}"))
+        try:
+            if self._closed:
+                raise PrintError("인쇄 서버가 종료 중입니다.")
+            return dict(handler(header, payload), ok=True)
+        except Exception as e:
+            if not isinstance(e, PrinterError):
+                logger.error(f"요청 처리 중 오류 발생: {e}")
+            return _error_reply(e)
+
+    @staticmethod
+    def _parse_options(options):
+        """클라이언트 인쇄 옵션 검사 및 변환"""
+        if not isinstance(options, dict):
+            raise PrintError("인쇄 옵션은 JSON 객체여야 합니다.")
+        result = {}
+        for key, value in options.items():
+            convert = _OPTION_TYPES.get(key)
+            if convert is None:
+                raise PrintError(f"알 수 없는 인쇄 옵션: {key}")
+            try:
+                result[key] = convert(value)
+            except (TypeError, ValueError):
+                raise PrintError(f"잘못된 인쇄 옵션 값: {key}={value!r}")
+        return result
+
+    def _op_submit(self, header, payload):
+        """이미지 바이트 인쇄: 받은 바이트를 그대로 프린터 풀에 등록"""
+        kind = header.get("kind", "image")
+        sizes = header.get("sizes") or [len(payload)]
+        if kind not in ("image", "split"):
+            raise PrintError(f"알 수 없는 작업 종류: {kind}")
+        if sum(sizes) != len(payload) or not all(isinstance(size, int) and size > 0 for size in sizes):
+            raise ImageError("이미지 크기 목록이 받은 데이터와 맞지 않습니다.")
+        if kind == "image" and len(sizes) != 1:
+            raise ImageError("이미지 인쇄는 이미지 하나만 받습니다.")
+        options = self._parse_options(header.get("options", {}))
+
+        # 인코딩된 이미지 바이트를 그대로 전달 (디스크를 거치지 않음)
+        images = []
+        offset = 0
+        for size in sizes:
+            images.append(payload[offset:offset + size])
+            offset += size
+
+        if kind == "split":
+            future = self.pool.submit_split(images, **options)
+        else:
+            future = self.pool.submit(images[0], **options)
+
+        job = self._new_job(kind, future)
+        logger.info(f"서버 작업 {job.job_id} 등록: {kind}, 이미지 {len(images)}개, {len(payload)}B")
+        return {"job_id": job.job_id}
+
+    def _op_submit_spool(self, header, payload):
+        """스풀 작업 인쇄: 스풀에서 가져와 프린터 풀에 등록"""
+        if self.spool is None:
+            raise SpoolError("이 인쇄 서버는 스풀을 사용하지 않습니다.")
+        options = self._parse_options(header.get("options", {}))
+        unknown = set(options) - {"wait_for_completion", "timeout"}
+        if unknown:
+            raise PrintError(f"스풀 작업에 지정할 수 없는 옵션: {', '.join(sorted(unknown))}")
+
+        spool_id = header.get("spool_id")
+        entry = self.spool.claim(spool_id)
+        if entry is None:
+            raise SpoolError(f"대기 중인 스풀 작업이 없습니다: {spool_id or '(가장 오래된 작업)'}")
+
+        try:
+            future = self.pool.submit_spooled(entry, **options)
+        except BaseException:
+            self.spool.release(entry)
+            raise
+
+        job = self._new_job("spool", future)
+        future.add_done_callback(lambda future: self._finish_spooled(entry, future))
+        logger.info(f"서버 작업 {job.job_id} 등록: 스풀 {entry.job_id}")
+        return {"job_id": job.job_id, "spool_id": entry.job_id}
+
+    def _finish_spooled(self, entry, future):
+        """인쇄된 스풀 작업은 삭제하고, 실패하거나 취소된 작업은 대기 상태로 되돌림"""
+        try:
+            if not future.cancelled() and future.exception() is None:
+                self.spool.complete(entry)
+            else:
+                self.spool.release(entry)
+        except (SpoolError, OSError) as e:
+            logger.error(f"스풀 작업 정리 실패: {entry.job_id} ({e})")
+
+    def _op_status(self, header, payload):
+        return self._get_job(header).to_dict()
+
+    def _op_cancel(self, header, payload):
+        return {"cancelled": self._get_job(header).future.cancel()}
+
+    def _op_printers(self, header, payload):
+        printers = self.pool.status()
+        for info, printer in zip(printers, self.pool.printers):
+            info["eta"] = printer.eta()
+        return {"printers": printers}
+
+    def _watch(self, header, wfile):
+        """작업이 끝날 때까지 진행 이벤트를 보냄 (이미 기록된 이벤트부터)"""
+        try:
+            job = self._get_job(header)
+        except PrinterError as e:
+            _write_message(wfile, _error_reply(e))
+            return
+
+        _write_message(wfile, {"ok": True, "job_id": job.job_id})
+        index = 0
+        while True:
+            with job.cond:
+                while len(job.events) <= index and not self._closed:
+                    job.cond.wait(1.0)
+                events = job.events[index:]
+                index = len(job.events)
+
+            for event in events:
+                _write_message(wfile, event)
+            if (events and events[-1]["event"] in FINAL_EVENTS) or self._closed:
+                return
+
+    def _release(self):
+        """상태 모니터 구독 해제"""
+        for printer, callback in self._subscriptions:
+            printer.device.monitor.unsubscribe(callback)
+        self._subscriptions = []
+
+    def close(self, wait=True, cancel_pending=False):
+        """
+        인쇄 서버를 종료합니다.
+
+        Args:
+            wait (bool): 진행 중인 작업이 끝날 때까지 대기 여부
+            cancel_pending (bool): 아직 시작되지 않은 작업을 취소할지 여부
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._serving:
+            self._server.shutdown()
+        self._server.server_close()
+        if not isinstance(self.address, tuple):
+            try:
+                os.remove(self.address)
+            except OSError:
+                pass
+        if self._thread is not None:
+            self._thread.join()
+
+        if self._owns_pool:
+            self.pool.close(wait=wait, cancel_pending=cancel_pending)
+        self._release()
+        logger.info("인쇄 서버 종료")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class PrintClient:
+    """
+    로컬 인쇄 서버 클라이언트
+
+    DLL을 불러오지 않으므로 바로 사용할 수 있습니다. 요청마다 새로 연결하므로
+    여러 스레드에서 함께 사용해도 됩니다.
+    """
+    def __init__(self, address=None, timeout=10.0):
+        """
+        Args:
+            address (str | tuple, optional): 서버 주소. None이면 default_address()
+            timeout (float): 요청 응답을 기다리는 최대 시간(초)
+        """
+        self.address = address if address is not None else default_address()
+        self.timeout = timeout
+
+    def _connect(self, timeout):
+        """서버에 연결"""
+        try:
+            if isinstance(self.address, tuple):
+                sock = socket.create_connection(self.address, timeout=timeout)
+            else:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.settimeout(timeout)
+                sock.connect(self.address)
+        except OSError as e:
+            raise ConnectionError(f"인쇄 서버에 연결할 수 없습니다: {self.address} ({e})")
+        return sock
+
+    def _request(self, header, payload=b""):
+        """요청 하나를 보내고 응답 헤더 반환 (오류 응답이면 예외 발생)"""
+        with self._connect(self.timeout) as sock:
+            with sock.makefile("rwb") as stream:
+                try:
+                    _write_message(stream, header, payload)
+                    reply, _ = _read_message(stream)
+                except (OSError, ValueError) as e:
+                    raise ConnectionError(f"인쇄 서버 통신 오류: {e}")
+
+        if reply is None:
+            raise ConnectionError("인쇄 서버가 연결을 끊었습니다.")
+        if not reply.get("ok"):
+            _raise_error(reply)
+        return reply
+
+    @staticmethod
+    def _read_image(image):
+        """이미지 파일 경로 또는 바이트를 바이트로 변환"""
+        if isinstance(image, (bytes, bytearray, memoryview)):
+            return bytes(image)
+        try:
+            with open(image, "rb") as f:
+                return f.read()
+        except OSError as e:
+            raise ImageError(f"이미지 파일을 읽을 수 없습니다: {image} ({e})")
+
+    def submit(self, image, paper_type=PaperType.PHOTO_4X6, orientation=Orientation.PORTRAIT,
+               copies=1, print_mode=PrintMode.STANDARD, apply_matte=False,
+               wait_for_completion=False, timeout=120):
+        """
+        이미지 인쇄 작업을 등록합니다. 나머지 인자는 HiTiPrinter.print_image와 같습니다.
+
+        Args:
+            image (str | bytes): 이미지 파일 경로 또는 인코딩된 이미지 바이트 (JPEG, PNG 등)
+
+        Returns:
+            int: 서버 작업 번호
+        """
+        data = self._read_image(image)
+        options = {key: value for key, value in locals().items() if key in _OPTION_TYPES}
+        return self._request({"op": "submit", "kind": "image", "sizes": [len(data)], "options": options},
+                             data)["job_id"]
+
+    def submit_split(self, images, paper_type=PaperType.PHOTO_6X9_SPLIT_2UP,
+                     orientation=Orientation.PORTRAIT, copies=1, print_mode=PrintMode.STANDARD,
+                     apply_matte=False, wait_for_completion=False, timeout=120):
+        """
+        분할 인쇄 작업을 등록합니다. 나머지 인자는 HiTiPrinter.print_split_images와 같습니다.
+
+        Args:
+            images (list): 이미지 파일 경로 또는 인코딩된 이미지 바이트 목록
+
+        Returns:
+            int: 서버 작업 번호
+        """
+        data = [self._read_image(image) for image in images]
+        options = {key: value for key, value in locals().items() if key in _OPTION_TYPES}
+        return self._request({"op": "submit", "kind": "split", "sizes": [len(item) for item in data],
+                              "options": options}, b"".join(data))["job_id"]
+
+    def submit_spooled(self, spool_id=None, wait_for_completion=False, timeout=120):
+        """
+        서버 스풀에 있는 작업을 인쇄하도록 등록합니다.
+
+        Args:
+            spool_id (str, optional): PrintSpool.put()이 반환한 작업 ID. None이면 가장 오래된 작업
+            wait_for_completion (bool): 인쇄 완료까지 대기 여부
+            timeout (float): 최대 대기 시간(초)
+
+        Returns:
+            int: 서버 작업 번호
+        """
+        return self._request({"op": "submit_spool", "spool_id": spool_id,
+                              "options": {"wait_for_completion": wait_for_completion,
+                                          "timeout": timeout}})["job_id"]
+
+    def status(self, job_id):
+        """
+        작업 상태를 조회합니다.
+
+        Returns:
+            dict: {'job_id', 'kind', 'state', 'submitted', 'finished', 'error'}.
+                state는 queued, done, failed, cancelled 중 하나
+        """
+        reply = self._request({"op": "status", "job_id": job_id})
+        reply.pop("ok", None)
+        return reply
+
+    def cancel(self, job_id):
+        """
+        아직 시작되지 않은 작업을 취소합니다.
+
+        Returns:
+            bool: 취소 여부
+        """
+        return self._request({"op": "cancel", "job_id": job_id})["cancelled"]
+
+    def printers(self):
+        """
+        서버 프린터별 상태를 조회합니다.
+
+        Returns:
+            list: HiTiPrinterPool.status()의 항목에 완료 예상 시간 'eta'를 더한 목록
+        """
+        return self._request({"op": "printers"})["printers"]
+
+    def watch(self, job_id, timeout=None):
+        """
+        작업이 끝날 때까지 진행 이벤트를 차례로 반환합니다.
+
+        이벤트는 {'event', 'job_id', 'time', ...} 형태의 dict이며, event는 queued,
+        status(printer, code, description, eta 포함), done(result), failed(error, type),
+        cancelled 중 하나입니다. 마지막 이벤트는 done, failed, cancelled 중 하나입니다.
+
+        Args:
+            job_id (int): 서버 작업 번호
+            timeout (float, optional): 다음 이벤트를 기다리는 최대 시간(초). None이면 무제한
+
+        Raises:
+            ConnectionError: 서버 연결이 끊기거나 시간이 초과된 경우
+        """
+        with self._connect(self.timeout) as sock:
+            with sock.makefile("rwb") as stream:
+                try:
+                    _write_message(stream, {"op": "watch", "job_id": job_id})
+                    reply, _ = _read_message(stream)
+                    if reply is not None and not reply.get("ok"):
+                        _raise_error(reply)
+
+                    sock.settimeout(timeout)
+                    while reply is not None:
+                        event, _ = _read_message(stream)
+                        if event is None:
+                            break
+                        yield event
+                        if event["event"] in FINAL_EVENTS:
+                            return
+                except (OSError, ValueError) as e:
+                    raise ConnectionError(f"인쇄 서버 통신 오류: {e}")
+        raise ConnectionError("작업이 끝나기 전에 인쇄 서버가 연결을 끊었습니다.")
+
+    def wait(self, job_id, timeout=None):
+        """
+        작업이 끝날 때까지 기다립니다.
+
+        Args:
+            job_id (int): 서버 작업 번호
+            timeout (float, optional): 다음 이벤트를 기다리는 최대 시간(초). None이면 무제한
+
+        Returns:
+            bool: 인쇄 결과
+
+        Raises:
+            PrintError: 작업이 실패하거나 취소된 경우 (서버에서 발생한 예외 종류 유지)
+        """
+        for event in self.watch(job_id, timeout):
+            if event["event"] == "done":
+                return event.get("result")
+            if event["event"] == "failed":
+                _raise_error(event)
+            if event["event"] == "cancelled":
+                raise PrintError(f"인쇄 작업 {job_id}이(가) 취소되었습니다.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='HiTi 로컬 인쇄 서버')
+    parser.add_argument('--address', help=f'유닉스 소켓 경로 또는 host:port (기본: {default_address()})')
+    parser.add_argument('--spool', help='스풀 작업 ID로 인쇄할 스풀 디렉터리')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(levelname)s %(message)s')
+    server = PrintServer(parse_address(args.address), spool=args.spool)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+# hiti_sdk/simulator.py
+"""
+HiTi 프린터 없이 SDK를 실행하기 위한 HTRTApi 시뮬레이터
+
+HiTiDll과 같은 함수(enum_usb_printers, check_printer_status, print_one_page,
+get_device_info, do_command, apply_job_setting)를 제공하므로, install_simulator()로
+공유 DLL을 교체하면 find_printers(), HiTiPrinter, 인쇄 큐, 프린터 풀을 그대로
+사용할 수 있습니다. 환경 변수 HITI_SDK_SIMULATOR=1을 설정해도 시뮬레이터가 사용됩니다.
+"""
+import time
+import ctypes
+import logging
+import threading
+from collections import namedtuple
+
+from .constants import PaperType, DeviceStatus, PrintCommand, DeviceInfoType, RibbonType
+from .device import HiTiDll, HITI_USB_PRINTER
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 용지 유형별 기본 인쇄 시간(초, 1매 기준)
+DEFAULT_PRINT_DURATIONS = {
+    PaperType.PHOTO_4X6: 8.0,
+    PaperType.PHOTO_5X7: 11.0,
+    PaperType.PHOTO_6X8: 13.0,
+    PaperType.PHOTO_6X9: 15.0,
+    PaperType.PHOTO_6X9_SPLIT_2UP: 15.0,
+    PaperType.PHOTO_4X6_SPLIT_2UP: 8.0,
+    PaperType.PHOTO_5X7_SPLIT_2UP: 11.0,
+    PaperType.PHOTO_4X6_SPLIT_3UP: 8.0,
+    PaperType.PHOTO_8X4: 9.0,
+    PaperType.PHOTO_8X6: 12.0,
+    PaperType.PHOTO_8X8: 15.0,
+    PaperType.PHOTO_8X12: 20.0,
+}
+
+# 인쇄 중 상태 순서: (상태 코드, 인쇄 시간 중 비율). 마지막 단계가 끝나면 OK
+DEFAULT_STATUS_SEQUENCE = (
+    (0x00000002, 0.1),           # 인쇄 진행 중 (드라이버 처리)
+    (DeviceStatus.PRINTING, 0.9),
+)
+
+# 오류 상태에서 인쇄 요청 시 반환 코드 (ERROR_NOT_READY)
+ERROR_NOT_READY = 21
+
+# 시뮬레이터가 받은 인쇄 페이지
+SimulatedPage = namedtuple('SimulatedPage', [
+    'printer_name', 'time', 'paper_type', 'print_mode', 'orientation', 'copies',
+    'apply_matte', 'width', 'height', 'width_bytes', 'bits_per_pixel', 'data'
+])
+
+
+def _deref(arg):
+    """byref()/pointer()로 전달된 ctypes 인자의 실제 객체 반환"""
+    if arg is None:
+        return None
+    obj = getattr(arg, '_obj', None)  # byref()
+    if obj is not None:
+        return obj
+    if isinstance(arg, ctypes._Pointer):
+        return arg.contents
+    return arg
+
+
+class SimulatedPrinter:
+    """시뮬레이터에 연결된 가상 프린터 한 대"""
+    def __init__(self, name="HiTi P525L (Simulated)", model_no=1, index_no=0,
+                 ribbon_type=RibbonType.RIBBON_6X9, ribbon_count=500,
+                 durations=None, status_sequence=DEFAULT_STATUS_SEQUENCE,
+                 serial="SIM0000001", model_name="P525L", firmware="1.00.0.S",
+                 record_pages=True):
+        """
+        가상 프린터를 초기화합니다.
+
+        Args:
+            name (str): 프린터 이름
+            model_no (int): 모델 번호 (bModelNo)
+            index_no (int): 인덱스 번호 (bIndexNo)
+            ribbon_type (RibbonType): 리본 유형
+            ribbon_count (int): 남은 리본 매수. 0이 되면 리본 부족 오류 상태
+            durations (dict, optional): 용지 유형별 1매 인쇄 시간(초). 없는 유형은 기본값 사용
+            status_sequence (tuple): 인쇄 중 (상태 코드, 비율) 순서
+            serial (str): 제조 일련번호
+            model_name (str): 모델 이름
+            firmware (str): 펌웨어 버전
+            record_pages (bool): 받은 비트맵 데이터를 pages에 보관할지 여부
+        """
+        self.name = name
+        self.model_no = model_no
+        self.index_no = index_no
+        self.ribbon_type = ribbon_type
+        self.ribbon_count = ribbon_count
+        self.durations = dict(DEFAULT_PRINT_DURATIONS)
+        if durations:
+            self.durations.update(durations)
+        self.status_sequence = status_sequence
+        self.serial = serial
+        self.model_name = model_name
+        self.firmware = firmware
+        self.record_pages = record_pages
+
+        self.pages = []
+        self.commands = []
+        self.print_count = 0
+        self.cutter_count = 0
+        self.locked = False
+
+        self._jobs = []          # (시작 시각, 종료 시각, 매수) - 인쇄 중이거나 대기 중인 작업
+        self._error = None       # 현재 오류 상태 코드
+        self._pending_errors = []  # (남은 매수, 상태 코드)
+
+
+class SimulatedHiTiDll:
+    """
+    HTRTApi DLL 시뮬레이터
+
+    인쇄 시간은 time_scale을 곱해 적용되므로, 테스트에서는 time_scale을 작게 하여
+    실제 프린터보다 빠르게 실행할 수 있습니다.
+    """
+    def __init__(self, printers=None, time_scale=1.0):
+        """
+        시뮬레이터를 초기화합니다.
+
+        Args:
+            printers (list, optional): SimulatedPrinter 목록. None인 경우 기본 프린터 1대
+            time_scale (float): 인쇄 시간 배율
+        """
+        self.dll_path = None
+        self.time_scale = time_scale
+        self.printers = printers if printers is not None else [SimulatedPrinter()]
+        self._lock = threading.RLock()
+
+    def printer(self, name):
+        """이름(bytes 또는 str)으로 가상 프린터 찾기. 없으면 None"""
+        if isinstance(name, bytes):
+            name = name.decode('utf-8', errors='ignore')
+        for printer in self.printers:
+            if printer.name == name:
+                return printer
+        return None
+
+    @property
+    def pages(self):
+        """모든 가상 프린터가 받은 페이지 (시간 순)"""
+        with self._lock:
+            return sorted((page for printer in self.printers for page in printer.pages),
+                          key=lambda page: page.time)
+
+    def inject_error(self, name, status_code, after_pages=0):
+        """
+        가상 프린터에 오류를 발생시킵니다.
+
+        Args:
+            name (str): 프린터 이름
+            status_code (int): 오류 상태 코드 (예: DeviceStatus.PAPER_JAM)
+            after_pages (int): 0이면 즉시, 그 외에는 이 매수를 더 인쇄한 뒤 오류 발생.
+                오류가 발생하면 인쇄 중이거나 대기 중인 작업은 취소됩니다.
+
+        Raises:
+            ValueError: 없는 프린터 이름인 경우
+        """
+        with self._lock:
+            printer = self._require_printer(name)
+            self._advance(printer)
+            if after_pages <= 0:
+                self._raise_error(printer, status_code)
+            else:
+                printer._pending_errors.append((after_pages, status_code))
+
+    def clear_error(self, name):
+        """
+        가상 프린터의 오류 상태를 해제합니다 (리셋 명령과 같음).
+
+        Raises:
+            ValueError: 없는 프린터 이름인 경우
+        """
+        with self._lock:
+            printer = self._require_printer(name)
+            printer._error = None
+            printer._pending_errors = []
+
+    def _require_printer(self, name):
+        """이름으로 가상 프린터 찾기. 없으면 ValueError"""
+        printer = self.printer(name)
+        if printer is None:
+            names = ", ".join(registered.name for registered in self.printers)
+            raise ValueError(f"알 수 없는 가상 프린터: {name} (등록된 프린터: {names})")
+        return printer
+
+    def _raise_error(self, printer, status_code):
+        """오류 상태로 전환하고 진행 중인 작업 취소"""
+        printer._error = status_code
+        printer._jobs = []
+        logger.info(f"시뮬레이터 오류 발생: {printer.name} (0x{status_code:08X})")
+
+    def _advance(self, printer, now=None):
+        """현재 시각까지 끝난 인쇄를 반영 (리본 차감, 예약된 오류 발생)"""
+        now = time.time() if now is None else now
+        while printer._jobs and printer._error is None:
+            start, end, copies = printer._jobs[0]
+            if end > now:
+                break
+            printer._jobs.pop(0)
+
+            for _ in range(copies):
+                printer.print_count += 1
+                printer.cutter_count += 1
+                if printer.ribbon_count > 0:
+                    printer.ribbon_count -= 1
+
+                # 예약된 오류
+                if printer._pending_errors:
+                    remaining, status_code = printer._pending_errors[0]
+                    if remaining <= 1:
+                        printer._pending_errors.pop(0)
+                        self._raise_error(printer, status_code)
+                        return
+                    printer._pending_errors[0] = (remaining - 1, status_code)
+
+            if printer.ribbon_count == 0:
+                self._raise_error(printer, DeviceStatus.OUT_OF_RIBBON)
+                return
+
+    def _status(self, printer, now=None):
+        """현재 상태 코드 계산"""
+        now = time.time() if now is None else now
+        self._advance(printer, now)
+        if printer._error is not None:
+            return printer._error
+        if not printer._jobs:
+            return DeviceStatus.OK
+
+        start, end, copies = printer._jobs[0]
+        if now < start:
+            return DeviceStatus.BUSY
+        elapsed = (now - start) / max(end - start, 1e-9)
+        position = 0.0
+        for status_code, fraction in printer.status_sequence:
+            position += fraction
+            if elapsed < position:
+                return status_code
+        return printer.status_sequence[-1][0] if printer.status_sequence else DeviceStatus.PRINTING
+
+    # HTRTApi 함수 --------------------------------------------------------
+
+    def enum_usb_printers(self, printer_enum, buffer_size, needed, returned):
+        """HITI_EnumUsbPrinters"""
+        needed = _deref(needed)
+        returned = _deref(returned)
+        needed.value = ctypes.sizeof(HITI_USB_PRINTER) * len(self.printers)
+
+        if printer_enum is None or buffer_size < needed.value:
+            returned.value = 0
+            return 0 if printer_enum is None else 122  # ERROR_INSUFFICIENT_BUFFER
+
+        for i, printer in enumerate(self.printers):
+            printer_enum[i].PrinterName = printer.name.encode('utf-8')
+            printer_enum[i].bModelNo = printer.model_no
+            printer_enum[i].bIndexNo = printer.index_no
+        returned.value = len(self.printers)
+        return 0
+
+    def check_printer_status(self, printer_name, status):
+        """HITI_CheckPrinterStatusA"""
+        with self._lock:
+            printer = self.printer(printer_name)
+            if printer is None:
+                _deref(status).value = DeviceStatus.OFFLINE
+                return 0
+            _deref(status).value = self._status(printer)
+            return 0
+
+    def do_command(self, printer_name, command):
+        """HITI_DoCommandA"""
+        with self._lock:
+            printer = self.printer(printer_name)
+            if printer is None:
+                return ERROR_NOT_READY
+            printer.commands.append(command)
+
+            if command == PrintCommand.RESET_PRINTER:
+                printer._error = None
+                printer._jobs = []
+            elif command == PrintCommand.LOCK_PRINTER:
+                printer.locked = True
+            elif command == PrintCommand.UNLOCK_PRINTER:
+                printer.locked = False
+            elif command == PrintCommand.CUT_PAPER:
+                printer.cutter_count += 1
+            return 0
+
+    def get_device_info(self, printer_name, info_type, data_buf, data_len):
+        """HITI_GetDeviceInfoA"""
+        with self._lock:
+            printer = self.printer(printer_name)
+            if printer is None:
+                return ERROR_NOT_READY
+            self._advance(printer)
+
+            if info_type == DeviceInfoType.MFG_SERIAL:
+                data = printer.serial.encode('utf-8') + b'\0'
+            elif info_type == DeviceInfoType.MODEL_NAME:
+                data = printer.model_name.encode('utf-8') + b'\0'
+            elif info_type == DeviceInfoType.FIRMWARE_VERSION:
+                data = printer.firmware.encode('utf-8') + b'\0'
+            elif info_type == DeviceInfoType.RIBBON_INFO:
+                data = (int(printer.ribbon_type).to_bytes(4, 'little')
+                        + int(printer.ribbon_count).to_bytes(4, 'little'))
+            elif info_type == DeviceInfoType.PRINT_COUNT:
+                data = printer.print_count.to_bytes(4, 'little')
+            elif info_type == DeviceInfoType.CUTTER_COUNT:
+                data = printer.cutter_count.to_bytes(4, 'little')
+            else:
+                return 87  # ERROR_INVALID_PARAMETER
+
+            data_len = _deref(data_len)
+            if len(data) > data_len.value:
+                data_len.value = len(data)
+                return 122  # ERROR_INSUFFICIENT_BUFFER
+            ctypes.memmove(data_buf, data, len(data))
+            data_len.value = len(data)
+            return 0
+
+    def print_one_page(self, printer_name, job_prop, bitmap):
+        """HITI_PrintOnePageA"""
+        job_prop = _deref(job_prop)
+        bitmap = _deref(bitmap)
+
+        with self._lock:
+            printer = self.printer(printer_name)
+            if printer is None:
+                return ERROR_NOT_READY
+
+            now = time.time()
+            self._advance(printer, now)
+            if printer._error is not None:
+                return ERROR_NOT_READY
+
+            copies = max(1, job_prop.shCopies)
+            paper_type = job_prop.dwPaperType
+            duration = printer.durations.get(paper_type, DEFAULT_PRINT_DURATIONS[PaperType.PHOTO_4X6])
+            duration *= copies * self.time_scale
+
+            # 앞 작업이 끝난 뒤 시작
+            start = printer._jobs[-1][1] if printer._jobs else now
+            printer._jobs.append((start, start + duration, copies))
+
+            data = None
+            if printer.record_pages:
+                data = ctypes.string_at(bitmap.bmBits, bitmap.bmWidthBytes * bitmap.bmHeight)
+            printer.pages.append(SimulatedPage(
+                printer.name, now, paper_type, job_prop.dwPrintMode, job_prop.shOrientation, copies,
+                job_prop.dwApplyMatte, bitmap.bmWidth, bitmap.bmHeight, bitmap.bmWidthBytes,
+                bitmap.bmBitsPixel, data
+            ))
+            logger.debug(f"시뮬레이터 인쇄 요청: {printer.name}, 용지: {paper_type}, 매수: {copies}, "
+                         f"{duration:.2f}초")
+            return 0
+
+    def apply_job_setting(self, printer_name, hdc, dev_mode, job_prop):
+        """HITI_ApplyJobSettingA"""
+        return 0
+
+
+def install_simulator(printers=None, time_scale=1.0):
+    """
+    공유 DLL을 시뮬레이터로 교체합니다. 이후 생성되는 HiTiDevice와 find_printers()는
+    시뮬레이터를 사용합니다.
+
+    Args:
+        printers (list, optional): SimulatedPrinter 목록. None인 경우 기본 프린터 1대
+        time_scale (float): 인쇄 시간 배율
+
+    Returns:
+        SimulatedHiTiDll: 설치된 시뮬레이터
+    """
+    simulator = SimulatedHiTiDll(printers, time_scale)
+    HiTiDll.set_shared(simulator)
+    return simulator
@@ -0,0 +1,304 @@
+# hiti_sdk/spool.py
+"""
+준비된 인쇄 페이지를 디스크에 보관하는 스풀
+
+작업마다 고정 형식 파일 하나(헤더 + 4바이트 행 정렬 BGR 비트맵)를 만듭니다.
+인쇄하는 쪽은 파일을 메모리 매핑하여 그대로 HITI_PrintOnePageA에 넘기므로 파이썬으로
+읽어 들이지 않습니다. 프로세스가 재시작되어도 다시 렌더링할 필요가 없고, 별도의
+렌더링 프로세스가 스풀을 채우고 인쇄 프로세스는 비우기만 할 수 있습니다.
+
+파일 상태는 확장자로 구분합니다.
+    .tmp      작성 중 (목록에 나타나지 않음)
+    .spool    인쇄 대기
+    .claimed  인쇄 중 (한 프로세스만 가져갈 수 있음)
+"""
+import os
+import mmap
+import time
+import struct
+import logging
+import threading
+import traceback
+from pathlib import Path
+
+from .constants import PaperType, Orientation, PrintMode
+from .exceptions import SpoolError
+from .image import ImageData
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+SPOOL_MAGIC = b"HTSP"
+SPOOL_VERSION = 1
+
+# 비트맵 데이터 시작 위치 (메모리 페이지 경계)
+DATA_OFFSET = 4096
+
+# 헤더: magic, version, bits_per_pixel, width, height, width_bytes, data_offset,
+#       paper_type, orientation, print_mode, copies, apply_matte, created
+_HEADER = struct.Struct("<4sHHIIIIIHHHB3xd")
+
+PENDING_SUFFIX = ".spool"
+CLAIMED_SUFFIX = ".claimed"
+TEMP_SUFFIX = ".tmp"
+
+
+def _clear_frames(error):
+    """
+    예외 추적 정보가 붙잡고 있는 지역 변수(image_data, 비트맵 등)를 정리합니다.
+    실패한 인쇄의 예외가 남아 있어도 스풀 파일 매핑을 해제할 수 있게 합니다.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        traceback.clear_frames(error.__traceback__)
+        error = error.__cause__ or error.__context__
+
+
+class SpoolEntry:
+    """
+    인쇄 중으로 가져간 스풀 작업
+
+    image_data는 스풀 파일을 복사 시 쓰기(ACCESS_COPY)로 매핑한 버퍼를 가리키므로
+    파일 내용은 바뀌지 않습니다. 사용이 끝나면 image_data(와 그 비트맵) 참조를 모두
+    놓은 뒤 PrintSpool.complete() 또는 PrintSpool.release()를 호출하세요.
+    """
+    def __init__(self, job_id, path):
+        self.job_id = job_id
+        self.path = path
+
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise SpoolError(f"스풀 파일 헤더가 잘렸습니다: {path}")
+
+            (magic, version, bits_per_pixel, width, height, width_bytes, data_offset,
+             paper_type, orientation, print_mode, copies, apply_matte, created) = _HEADER.unpack(header)
+
+            if magic != SPOOL_MAGIC or version != SPOOL_VERSION:
+                raise SpoolError(f"스풀 파일 형식이 아닙니다: {path}")
+
+            size = width_bytes * height
+            if os.fstat(f.fileno()).st_size < data_offset + size:
+                raise SpoolError(f"스풀 파일 데이터가 잘렸습니다: {path}")
+
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        self.paper_type = PaperType(paper_type)
+        self.orientation = Orientation(orientation)
+        self.print_mode = PrintMode(print_mode)
+        self.copies = copies
+        self.apply_matte = bool(apply_matte)
+        self.created = created
+        self.image_data = ImageData(width, height, memoryview(self._mmap)[data_offset:data_offset + size],
+                                    bits_per_pixel)
+
+    def close(self):
+        """
+        매핑 해제
+
+        Raises:
+            SpoolError: image_data나 비트맵이 아직 참조 중이어서 매핑을 해제할 수 없는 경우
+        """
+        self.image_data = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            raise SpoolError(f"스풀 매핑이 아직 사용 중입니다: {self.job_id}")
+
+    def __repr__(self):
+        return f"SpoolEntry({self.job_id!r}, {self.paper_type.name}, copies={self.copies})"
+
+
+class PrintSpool:
+    """
+    디스크 인쇄 스풀
+
+    put()은 렌더링한 페이지를 원자적으로 추가하고, claim()은 대기 중인 작업 하나를
+    인쇄 중 상태로 가져옵니다. 같은 디렉터리를 여러 프로세스가 함께 사용할 수 있습니다.
+    """
+    def __init__(self, directory):
+        """
+        스풀 디렉터리를 엽니다 (없으면 생성).
+
+        Args:
+            directory (str): 스풀 디렉터리 경로
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def _path(self, job_id, suffix):
+        return self.directory / f"{job_id}{suffix}"
+
+    def _new_job_id(self):
+        """생성 순서대로 정렬되는 작업 ID"""
+        with self._lock:
+            self._counter += 1
+            counter = self._counter
+        return f"{time.time_ns():020d}-{os.getpid()}-{counter:06d}"
+
+    def put(self, image_data, paper_type=PaperType.PHOTO_4X6, orientation=Orientation.PORTRAIT,
+            copies=1, print_mode=PrintMode.STANDARD, apply_matte=False):
+        """
+        준비된 페이지를 스풀에 추가합니다.
+
+        Args:
+            image_data (ImageData): 준비된 이미지 데이터
+            paper_type, orientation, copies, print_mode, apply_matte: 인쇄 옵션 (print_image와 같음)
+
+        Returns:
+            str: 작업 ID
+        """
+        job_id = self._new_job_id()
+        temp_path = self._path(job_id, TEMP_SUFFIX)
+        header = _HEADER.pack(
+            SPOOL_MAGIC, SPOOL_VERSION, image_data.bits_per_pixel,
+            image_data.width, image_data.height, image_data.width_bytes, DATA_OFFSET,
+            int(paper_type), int(orientation), int(print_mode), copies, 1 if apply_matte else 0,
+            time.time()
+        )
+
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(header.ljust(DATA_OFFSET, b"\0"))
+                f.write(image_data.data_buffer)
+                f.flush()
+                os.fsync(f.fileno())
+            # 다 쓴 뒤에 이름을 바꿔야 인쇄하는 쪽이 반쯤 쓴 파일을 보지 않음
+            os.replace(temp_path, self._path(job_id, PENDING_SUFFIX))
+        except OSError as e:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise SpoolError(f"스풀 파일 저장 실패: {e}")
+
+        logger.info(f"스풀에 추가: {job_id} ({image_data.width}x{image_data.height}, 매수: {copies})")
+        return job_id
+
+    def pending(self):
+        """
+        인쇄 대기 중인 작업 ID 목록 (추가된 순서)
+
+        Returns:
+            list: 작업 ID 목록
+        """
+        return sorted(name[:-len(PENDING_SUFFIX)] for name in os.listdir(self.directory)
+                      if name.endswith(PENDING_SUFFIX))
+
+    def claim(self, job_id=None):
+        """
+        대기 중인 작업을 인쇄 중 상태로 가져옵니다.
+
+        Args:
+            job_id (str, optional): 가져올 작업 ID. None이면 가장 오래된 작업
+
+        Returns:
+            SpoolEntry: 가져온 작업. 대기 중인 작업이 없거나 다른 프로세스가 먼저 가져갔으면 None
+
+        Raises:
+            SpoolError: 파일이 손상된 경우 (파일은 .bad로 이름이 바뀜)
+        """
+        candidates = [job_id] if job_id is not None else self.pending()
+        for candidate in candidates:
+            claimed_path = self._path(candidate, CLAIMED_SUFFIX)
+            try:
+                # 이름 바꾸기는 원자적이므로 한 프로세스만 성공
+                os.rename(self._path(candidate, PENDING_SUFFIX), claimed_path)
+            except FileNotFoundError:
+                continue
+
+            try:
+                return SpoolEntry(candidate, claimed_path)
+            except (SpoolError, OSError, ValueError) as e:
+                os.replace(claimed_path, self._path(candidate, ".bad"))
+                raise SpoolError(f"손상된 스풀 파일: {candidate} ({e})")
+        return None
+
+    def complete(self, entry):
+        """
+        인쇄가 끝난 작업을 스풀에서 삭제합니다.
+
+        Raises:
+            SpoolError: 매핑을 해제할 수 없는 경우 (파일은 인쇄 중 상태로 남음)
+        """
+        entry.close()
+        try:
+            os.remove(entry.path)
+        except OSError as e:
+            logger.warning(f"스풀 파일 삭제 실패: {entry.path} ({e})")
+
+    def release(self, entry):
+        """
+        인쇄하지 못한 작업을 다시 대기 상태로 돌려놓습니다.
+
+        Raises:
+            SpoolError: 매핑을 해제할 수 없는 경우 (파일은 인쇄 중 상태로 남음)
+        """
+        entry.close()
+        os.replace(entry.path, self._path(entry.job_id, PENDING_SUFFIX))
+
+    def recover(self, stale_temp_age=3600):
+        """
+        이전 프로세스가 인쇄 중에 종료되어 남은 작업을 대기 상태로 되돌리고,
+        오래된 임시 파일을 삭제합니다. 인쇄 프로세스가 시작할 때 한 번 호출합니다
+        (다른 인쇄 프로세스가 같은 스풀을 비우는 중에는 호출하지 마세요).
+
+        인쇄 요청 직후 종료된 작업은 다시 인쇄될 수 있습니다 (최소 한 번 인쇄).
+
+        Args:
+            stale_temp_age (float): 이 시간(초)보다 오래된 임시 파일만 삭제 (렌더링 프로세스가 작성 중인 파일 보호)
+
+        Returns:
+            int: 대기 상태로 되돌린 작업 수
+        """
+        recovered = 0
+        now = time.time()
+        for name in os.listdir(self.directory):
+            path = self.directory / name
+            if name.endswith(CLAIMED_SUFFIX):
+                os.replace(path, self._path(name[:-len(CLAIMED_SUFFIX)], PENDING_SUFFIX))
+                recovered += 1
+            elif name.endswith(TEMP_SUFFIX):
+                try:
+                    if now - os.stat(path).st_mtime > stale_temp_age:
+                        os.remove(path)
+                except OSError:
+                    pass
+        if recovered:
+            logger.info(f"스풀 작업 {recovered}건 복구")
+        return recovered
+
+    def print_next(self, printer, wait_for_completion=False, timeout=120):
+        """
+        가장 오래된 대기 작업 하나를 인쇄합니다. 실패하면 작업을 대기 상태로 되돌립니다.
+
+        Args:
+            printer (HiTiPrinter): 인쇄할 프린터
+            wait_for_completion (bool): 인쇄 완료까지 대기 여부
+            timeout (float): 최대 대기 시간(초)
+
+        Returns:
+            str: 인쇄한 작업 ID. 대기 작업이 없으면 None
+
+        Raises:
+            PrintError: 인쇄 실패 시
+        """
+        entry = self.claim()
+        if entry is None:
+            return None
+
+        try:
+            printer.print_spooled(entry, wait_for_completion=wait_for_completion, timeout=timeout)
+        except Exception as e:
+            _clear_frames(e)
+            self.release(entry)
+            raise
+
+        self.complete(entry)
+        return entry.job_id
+
+    def __len__(self):
+        return len(self.pending())
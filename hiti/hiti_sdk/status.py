@@ -0,0 +1,230 @@
+# hiti_sdk/status.py
+"""
+HiTi 프린터 상태 코드 해석
+
+상태 코드(DWORD)를 상태, 심각도, 복구 가능 여부, 분류로 해석하는 표를 모델별로
+미리 만들어 두고, 상태를 확인할 때마다 사전 조회 한 번으로 해석합니다.
+"""
+from collections import namedtuple
+from enum import IntEnum, auto
+
+from .constants import DeviceStatus, DeviceStatusP7xx
+
+
+class PrinterStatus(IntEnum):
+    """프린터 상태"""
+    READY = auto()           # 인쇄 준비 완료
+    BUSY = auto()            # 사용 중
+    PRINTING = auto()        # 인쇄 중
+    ERROR = auto()           # 오류 상태
+    OFFLINE = auto()         # 오프라인
+    UNKNOWN = auto()         # 알 수 없는 상태
+
+
+class StatusSeverity(IntEnum):
+    """상태 심각도"""
+    OK = 0          # 정상
+    INFO = 1        # 인쇄/데이터 처리 중 (일시적)
+    WARNING = 2     # 사용자가 조치하면 되는 상태 (커버 열림, 용지/리본 없음 등)
+    ERROR = 3       # 인쇄 실패 (용지 걸림, 유형 불일치, 통신 오류 등)
+    FATAL = 4       # 하드웨어 오류 (서비스 필요)
+
+
+class StatusCategory(IntEnum):
+    """상태 분류"""
+    NONE = auto()            # 정상
+    ACTIVITY = auto()        # 인쇄/데이터 처리 중
+    CONNECTION = auto()      # 오프라인
+    COVER = auto()           # 커버
+    PAPER = auto()           # 용지
+    RIBBON = auto()          # 리본
+    HARDWARE = auto()        # 하드웨어
+    COMMUNICATION = auto()   # 데이터 송수신
+    UNKNOWN = auto()         # 표에 없는 코드
+
+
+class DecodedStatus(namedtuple('DecodedStatus', [
+        'code', 'state', 'severity', 'recoverable', 'category', 'description'])):
+    """해석된 상태 코드"""
+    __slots__ = ()
+
+    @property
+    def active(self):
+        """인쇄가 진행 중인 상태인지 여부 (빠른 주기로 확인)"""
+        return self.state in (PrinterStatus.BUSY, PrinterStatus.PRINTING)
+
+    @property
+    def ready(self):
+        """인쇄 요청을 보낼 수 있는 상태인지 여부"""
+        return self.state == PrinterStatus.READY
+
+
+# 공통 상태 코드 표: (코드, 상태, 심각도, 복구 가능, 분류, 설명)
+_S, _V, _C = PrinterStatus, StatusSeverity, StatusCategory
+COMMON_STATUS_ROWS = (
+    (DeviceStatus.OK, _S.READY, _V.OK, True, _C.NONE, "정상"),
+    (DeviceStatus.BUSY, _S.BUSY, _V.INFO, True, _C.ACTIVITY, "프린터가 사용 중입니다"),
+    (DeviceStatus.PRINTING, _S.PRINTING, _V.INFO, True, _C.ACTIVITY, "프린터가 인쇄 중입니다"),
+    (DeviceStatus.PROCESSING_DATA, _S.PRINTING, _V.INFO, True, _C.ACTIVITY, "드라이버가 인쇄 데이터를 처리 중입니다"),
+    (DeviceStatus.SENDING_DATA, _S.PRINTING, _V.INFO, True, _C.ACTIVITY, "드라이버가 데이터를 프린터로 전송 중입니다"),
+    (0x00000002, _S.PRINTING, _V.INFO, True, _C.ACTIVITY, "인쇄 진행 중"),  # 일부 프린터의 인쇄 중 상태
+    (DeviceStatus.OFFLINE, _S.OFFLINE, _V.WARNING, True, _C.CONNECTION, "프린터가 오프라인 상태입니다"),
+    (DeviceStatus.COVER_OPEN, _S.ERROR, _V.WARNING, True, _C.COVER, "커버가 열려 있습니다"),
+    (DeviceStatus.COVER_OPEN2, _S.ERROR, _V.WARNING, True, _C.COVER, "커버가 열려 있습니다"),
+    (DeviceStatus.PAPER_OUT, _S.ERROR, _V.WARNING, True, _C.PAPER, "용지가 없습니다"),
+    (DeviceStatus.PAPER_JAM, _S.ERROR, _V.ERROR, True, _C.PAPER, "용지 걸림이 발생했습니다"),
+    (DeviceStatus.PAPER_TYPE_MISMATCH, _S.ERROR, _V.ERROR, True, _C.PAPER, "용지 유형이 일치하지 않습니다"),
+    (DeviceStatus.PAPER_TRAY_MISMATCH, _S.ERROR, _V.ERROR, True, _C.PAPER, "용지 트레이가 일치하지 않습니다"),
+    (DeviceStatus.TRAY_MISSING, _S.ERROR, _V.WARNING, True, _C.PAPER, "용지 트레이가 없습니다"),
+    (DeviceStatus.RIBBON_MISSING, _S.ERROR, _V.WARNING, True, _C.RIBBON, "리본이 없습니다"),
+    (DeviceStatus.OUT_OF_RIBBON, _S.ERROR, _V.WARNING, True, _C.RIBBON, "리본이 부족합니다"),
+    (DeviceStatus.RIBBON_TYPE_MISMATCH, _S.ERROR, _V.ERROR, True, _C.RIBBON, "리본 유형이 일치하지 않습니다"),
+    (DeviceStatus.RIBBON_ERROR, _S.ERROR, _V.ERROR, True, _C.RIBBON, "리본 오류가 발생했습니다"),
+    (DeviceStatus.SRAM_ERROR, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "SRAM 오류가 발생했습니다"),
+    (DeviceStatus.SDRAM_ERROR, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "SDRAM 오류가 발생했습니다"),
+    (DeviceStatus.ADC_ERROR, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "ADC 오류가 발생했습니다"),
+    (DeviceStatus.NVRAM_ERROR, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "NVRAM 읽기/쓰기 오류가 발생했습니다"),
+    (DeviceStatus.FW_CHECKSUM_ERROR, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "펌웨어 체크섬 오류가 발생했습니다"),
+    (DeviceStatus.DSP_CHECKSUM_ERROR, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "DSP 코드 체크섬 오류가 발생했습니다"),
+    (DeviceStatus.HEAT_PARAMETER_INCOMPATIBLE, _S.ERROR, _V.FATAL, False, _C.HARDWARE,
+     "가열 매개변수 테이블이 호환되지 않습니다"),
+    (DeviceStatus.CAM_PLATEN_ERROR, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "Cam Platen 오류가 발생했습니다"),
+    (DeviceStatus.ADF_ERROR, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "ADF Cam 오류가 발생했습니다"),
+    (DeviceStatus.WRITE_FAIL, _S.ERROR, _V.ERROR, True, _C.COMMUNICATION, "프린터로 데이터 전송이 실패했습니다"),
+    (DeviceStatus.READ_FAIL, _S.ERROR, _V.ERROR, True, _C.COMMUNICATION, "프린터에서 데이터 수신이 실패했습니다"),
+)
+
+# P720L/P728L/P520L/P750L 전용 상태 코드 표 (공통 표에 없는 코드만 추가)
+# PAPER_OUT_01(0x400)은 공통 PRINTING과 같은 값이므로 공통 표의 해석을 유지
+P7XX_STATUS_ROWS = (
+    (DeviceStatusP7xx.COVER_OPEN, _S.ERROR, _V.WARNING, True, _C.COVER, "커버가 열려 있습니다"),
+    (DeviceStatusP7xx.COVER_OPEN_FAIL, _S.ERROR, _V.WARNING, True, _C.COVER, "커버 열림 오류가 발생했습니다"),
+    (DeviceStatusP7xx.IC_CHIP_MISSING, _S.ERROR, _V.WARNING, True, _C.RIBBON, "리본 IC 칩이 없습니다"),
+    (DeviceStatusP7xx.RIBBON_MISSING, _S.ERROR, _V.WARNING, True, _C.RIBBON, "리본이 없습니다"),
+    (DeviceStatusP7xx.RIBBON_MISMATCH_01, _S.ERROR, _V.ERROR, True, _C.RIBBON, "리본 유형이 일치하지 않습니다"),
+    (DeviceStatusP7xx.SECURITY_CHECK_FAIL, _S.ERROR, _V.ERROR, True, _C.RIBBON, "리본 보안 확인에 실패했습니다"),
+    (DeviceStatusP7xx.RIBBON_MISMATCH_02, _S.ERROR, _V.ERROR, True, _C.RIBBON, "리본 유형이 일치하지 않습니다"),
+    (DeviceStatusP7xx.RIBBON_MISMATCH_03, _S.ERROR, _V.ERROR, True, _C.RIBBON, "리본 유형이 일치하지 않습니다"),
+    (DeviceStatusP7xx.RIBBON_OUT_01, _S.ERROR, _V.WARNING, True, _C.RIBBON, "리본을 모두 사용했습니다"),
+    (DeviceStatusP7xx.RIBBON_OUT_02, _S.ERROR, _V.WARNING, True, _C.RIBBON, "리본을 모두 사용했습니다"),
+    (DeviceStatusP7xx.PRINTING_FAIL, _S.ERROR, _V.ERROR, True, _C.RIBBON, "인쇄에 실패했습니다"),
+    (DeviceStatusP7xx.PAPER_OUT_01, _S.ERROR, _V.WARNING, True, _C.PAPER, "용지가 없습니다"),
+    (DeviceStatusP7xx.PAPER_OUT_02, _S.ERROR, _V.WARNING, True, _C.PAPER, "용지가 없습니다"),
+    (DeviceStatusP7xx.PAPER_NOT_READY, _S.ERROR, _V.WARNING, True, _C.PAPER, "용지가 준비되지 않았습니다"),
+    (DeviceStatusP7xx.PAPER_JAM_01, _S.ERROR, _V.ERROR, True, _C.PAPER, "용지 걸림이 발생했습니다"),
+    (DeviceStatusP7xx.PAPER_JAM_02, _S.ERROR, _V.ERROR, True, _C.PAPER, "용지 걸림이 발생했습니다"),
+    (DeviceStatusP7xx.PAPER_JAM_03, _S.ERROR, _V.ERROR, True, _C.PAPER, "용지 걸림이 발생했습니다"),
+    (DeviceStatusP7xx.PAPER_JAM_04, _S.ERROR, _V.ERROR, True, _C.PAPER, "용지 걸림이 발생했습니다"),
+    (DeviceStatusP7xx.PAPER_JAM_05, _S.ERROR, _V.ERROR, True, _C.PAPER, "용지 걸림이 발생했습니다"),
+    (DeviceStatusP7xx.PAPER_MISMATCH, _S.ERROR, _V.ERROR, True, _C.PAPER, "용지 유형이 일치하지 않습니다"),
+    (DeviceStatusP7xx.CAM_ERROR_01, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "Cam 오류가 발생했습니다"),
+    (DeviceStatusP7xx.CAM_ERROR_02, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "Cam 오류가 발생했습니다"),
+    (DeviceStatusP7xx.NVRAM_ERROR, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "NVRAM 오류가 발생했습니다"),
+    (DeviceStatusP7xx.IC_CHIP_ERROR, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "IC 칩 오류가 발생했습니다"),
+    (DeviceStatusP7xx.ADC_ERROR, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "ADC 오류가 발생했습니다"),
+    (DeviceStatusP7xx.FW_CHECK_ERROR, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "펌웨어 확인 오류가 발생했습니다"),
+    (DeviceStatusP7xx.CUTTER_ERROR, _S.ERROR, _V.FATAL, False, _C.HARDWARE, "커터 오류가 발생했습니다"),
+)
+del _S, _V, _C
+
+# 표에 없는 코드 중 오류로 보는 비트 (0x0008xxxx, 0x0000_8xxx 계열)
+UNKNOWN_ERROR_BITS = 0x00080000 | 0x00008000
+
+# P7xx 상태 코드를 사용하는 모델 이름(MODEL_NAME) 접두어
+P7XX_MODEL_PREFIXES = ("P520", "P720", "P728", "P750")
+
+
+class StatusDecoder:
+    """
+    상태 코드 해석기
+
+    상태 코드별 DecodedStatus를 미리 만들어 둔 표를 사용하므로, 해석은 사전 조회
+    한 번입니다. 표에 없는 코드(StatusCategory.UNKNOWN)는 기존 wait_until_ready와 같이
+    오류 비트(UNKNOWN_ERROR_BITS)가 있으면 오류로, 없으면 일시적인 상태로 보고 준비 완료로 해석합니다.
+    """
+    def __init__(self, name, *row_groups):
+        """
+        상태 코드 표를 만듭니다.
+
+        Args:
+            name (str): 해석기 이름 (로그용)
+            *row_groups: (코드, 상태, 심각도, 복구 가능, 분류, 설명) 행 목록. 뒤의 행이 앞의 행을 덮어씀
+        """
+        self.name = name
+        self._table = {}
+        for rows in row_groups:
+            for code, state, severity, recoverable, category, description in rows:
+                self._table[int(code)] = DecodedStatus(int(code), state, severity, recoverable, category, description)
+
+    def decode(self, status_code):
+        """
+        상태 코드를 해석합니다.
+
+        Args:
+            status_code (int): check_status가 반환한 상태 코드
+
+        Returns:
+            DecodedStatus: 해석된 상태
+        """
+        decoded = self._table.get(status_code)
+        if decoded is None:
+            if status_code & UNKNOWN_ERROR_BITS:
+                decoded = DecodedStatus(
+                    status_code, PrinterStatus.ERROR, StatusSeverity.ERROR, False,
+                    StatusCategory.UNKNOWN, f"알 수 없는 오류 상태 코드: 0x{status_code:08X}"
+                )
+            else:
+                decoded = DecodedStatus(
+                    status_code, PrinterStatus.READY, StatusSeverity.WARNING, True,
+                    StatusCategory.UNKNOWN, f"알 수 없는 상태 코드: 0x{status_code:08X} (준비된 것으로 간주)"
+                )
+        return decoded
+
+    def __contains__(self, status_code):
+        return status_code in self._table
+
+    def __repr__(self):
+        return f"StatusDecoder({self.name!r}, {len(self._table)} codes)"
+
+
+DEFAULT_DECODER = StatusDecoder("default", COMMON_STATUS_ROWS)
+_COMMON_CODES = {int(row[0]) for row in COMMON_STATUS_ROWS}
+P7XX_DECODER = StatusDecoder("p7xx", COMMON_STATUS_ROWS,
+                             [row for row in P7XX_STATUS_ROWS if int(row[0]) not in _COMMON_CODES])
+
+
+def get_decoder(model_name):
+    """
+    모델 이름에 맞는 상태 코드 해석기를 반환합니다.
+
+    Args:
+        model_name (str): 장치 정보의 모델 이름 (예: "P720L")
+
+    Returns:
+        StatusDecoder: P7xx 모델이면 P7XX_DECODER, 그 외에는 DEFAULT_DECODER
+    """
+    if not model_name:
+        return DEFAULT_DECODER
+
+    name = model_name.strip().upper()
+    # HiTi 접두어 제거 (예: "HiTi P720L")
+    if name.startswith("HITI"):
+        name = name[4:].strip()
+
+    if name.startswith(P7XX_MODEL_PREFIXES):
+        return P7XX_DECODER
+    return DEFAULT_DECODER
+
+
+def decode_status(status_code, model_name=None):
+    """
+    상태 코드를 모델에 맞게 해석합니다.
+
+    Args:
+        status_code (int): 상태 코드
+        model_name (str, optional): 모델 이름. None이면 공통 표 사용
+
+    Returns:
+        DecodedStatus: 해석된 상태
+    """
+    return get_decoder(model_name).decode(status_code)
@@ -0,0 +1,235 @@
+# hiti_sdk/tracing.py
+"""
+인쇄 경로 단계별 소요 시간 기록
+
+print_image/print_split_images 한 번마다 단계별 소요 시간(디코딩, 크기 조정, BGR 변환,
+to_bitmap, HITI_PrintOnePageA, 상태 대기), 처리한 바이트 수, 대기 중 확인된 상태 코드를
+PrintTrace로 모아 등록된 훅에 전달합니다. 등록된 훅이 없으면 아무것도 기록하지 않습니다.
+
+    from hiti_sdk import tracing
+    tracing.add_trace_hook(tracing.log_trace)
+"""
+import time
+import logging
+import threading
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 등록된 훅 (읽기 전용으로 교체하여 사용하므로 호출 시 잠금이 필요 없음)
+_hooks = ()
+_hooks_lock = threading.Lock()
+
+# 현재 스레드에서 기록 중인 PrintTrace
+_local = threading.local()
+
+
+class PrintTrace:
+    """
+    인쇄 작업 한 번의 단계별 기록
+
+    Attributes:
+        kind (str): "image" 또는 "split"
+        sources (list): 원본 이미지 경로
+        paper_type (PaperType): 용지 유형
+        orientation (Orientation): 인쇄 방향
+        copies (int): 인쇄 매수
+        started (float): 시작 시각 (time.time())
+        total (float): 전체 소요 시간(초)
+        phases (dict): 단계 이름 -> 소요 시간(초). 분할 인쇄의 하위 이미지 단계는 스레드별 시간의 합
+        bytes (dict): 항목 이름 -> 바이트 수 (source: 원본 파일, bitmap: 인쇄 비트맵)
+        status_codes (list): 대기 중 확인된 (경과 시간(초), 상태 코드). 같은 코드가 이어지면 한 번만 기록
+        cache_hit (bool): 페이지 캐시 적중 여부
+        error (str): 실패한 경우 오류 메시지. 성공하면 None
+    """
+    def __init__(self, kind, sources, paper_type, orientation, copies):
+        self.kind = kind
+        self.sources = list(sources)
+        self.paper_type = paper_type
+        self.orientation = orientation
+        self.copies = copies
+        self.started = time.time()
+        self.total = 0.0
+        self.phases = {}
+        self.bytes = {}
+        self.status_codes = []
+        self.cache_hit = False
+        self.error = None
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def phase(self, name):
+        """name 단계의 소요 시간을 더하는 컨텍스트 관리자"""
+        return _Phase(self, name)
+
+    def add_time(self, name, seconds):
+        """단계 소요 시간 추가"""
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def add_bytes(self, name, count):
+        """처리한 바이트 수 추가"""
+        with self._lock:
+            self.bytes[name] = self.bytes.get(name, 0) + count
+
+    def add_status(self, status_code):
+        """확인된 상태 코드 추가 (직전 코드와 같으면 무시)"""
+        with self._lock:
+            if not self.status_codes or self.status_codes[-1][1] != status_code:
+                self.status_codes.append((time.perf_counter() - self._start, status_code))
+
+    def to_dict(self):
+        """JSON으로 저장할 수 있는 dict로 변환"""
+        return {
+            "kind": self.kind,
+            "sources": self.sources,
+            "paper_type": int(self.paper_type),
+            "orientation": int(self.orientation),
+            "copies": self.copies,
+            "started": self.started,
+            "total": self.total,
+            "phases": dict(self.phases),
+            "bytes": dict(self.bytes),
+            "status_codes": [[round(t, 4), code] for t, code in self.status_codes],
+            "cache_hit": self.cache_hit,
+            "error": self.error,
+        }
+
+    def __repr__(self):
+        phases = ", ".join(f"{name}={seconds * 1000:.1f}ms" for name, seconds in self.phases.items())
+        return f"PrintTrace({self.kind}, total={self.total * 1000:.1f}ms, {phases})"
+
+
+class _Phase:
+    """PrintTrace.phase()가 반환하는 컨텍스트 관리자"""
+    __slots__ = ("trace", "name", "start")
+
+    def __init__(self, trace, name):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.trace.add_time(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullContext:
+    """기록 중이 아닐 때 사용하는 빈 컨텍스트 관리자"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL = _NullContext()
+
+
+class _Job:
+    """job()이 반환하는 컨텍스트 관리자: 현재 스레드에 PrintTrace를 설정하고 끝나면 훅 호출"""
+    __slots__ = ("trace", "previous", "hooks")
+
+    def __init__(self, trace, hooks):
+        self.trace = trace
+        self.hooks = hooks
+
+    def __enter__(self):
+        self.previous = getattr(_local, "trace", None)
+        _local.trace = self.trace
+        return self.trace
+
+    def __exit__(self, exc_type, exc, tb):
+        _local.trace = self.previous
+        trace = self.trace
+        trace.total = time.perf_counter() - trace._start
+        if exc is not None:
+            trace.error = str(exc)
+
+        for hook in self.hooks:
+            try:
+                hook(trace)
+            except Exception as e:
+                logger.error(f"인쇄 기록 훅 처리 중 오류: {e}")
+        return False
+
+
+def add_trace_hook(hook):
+    """
+    인쇄 기록 훅을 등록합니다.
+
+    Args:
+        hook (callable): hook(trace) 형태의 함수. 인쇄를 요청한 스레드에서 작업이 끝날 때 호출됩니다.
+    """
+    global _hooks
+    with _hooks_lock:
+        _hooks = _hooks + (hook,)
+
+
+def remove_trace_hook(hook):
+    """인쇄 기록 훅 등록을 해제합니다."""
+    global _hooks
+    with _hooks_lock:
+        _hooks = tuple(h for h in _hooks if h is not hook)
+
+
+def job(kind, sources, paper_type, orientation, copies):
+    """
+    인쇄 작업 기록을 시작합니다. 훅이 없으면 아무것도 하지 않는 컨텍스트 관리자를 반환합니다.
+
+    Returns:
+        컨텍스트 관리자. with 문의 값은 PrintTrace 또는 None
+    """
+    hooks = _hooks
+    if not hooks:
+        return _NULL
+    return _Job(PrintTrace(kind, sources, paper_type, orientation, copies), hooks)
+
+
+def current():
+    """현재 스레드에서 기록 중인 PrintTrace. 없으면 None"""
+    return getattr(_local, "trace", None)
+
+
+def phase(name, trace=None):
+    """
+    단계 소요 시간을 기록하는 컨텍스트 관리자를 반환합니다.
+
+    Args:
+        name (str): 단계 이름
+        trace (PrintTrace, optional): 기록할 PrintTrace. None이면 현재 스레드의 기록 사용 (다른 스레드에서 사용할 때 지정)
+    """
+    if trace is None:
+        trace = getattr(_local, "trace", None)
+        if trace is None:
+            return _NULL
+    return _Phase(trace, name)
+
+
+def watch(predicate):
+    """
+    상태 대기 조건 함수를 감싸 확인된 상태 코드를 현재 기록에 남깁니다.
+    기록 중이 아니면 predicate를 그대로 반환합니다.
+    """
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        return predicate
+
+    def traced(code):
+        trace.add_status(code)
+        return predicate(code)
+    return traced
+
+
+def log_trace(trace):
+    """PrintTrace를 한 줄로 로그에 남기는 훅"""
+    phases = " ".join(f"{name}={seconds * 1000:.0f}ms" for name, seconds in trace.phases.items())
+    codes = ",".join(f"0x{code:X}" for _, code in trace.status_codes)
+    result = f"실패({trace.error})" if trace.error else "성공"
+    logger.info(f"인쇄 기록 [{trace.kind}] {result} 전체={trace.total * 1000:.0f}ms {phases} "
+                f"비트맵={trace.bytes.get('bitmap', 0)}B 상태=[{codes}]")
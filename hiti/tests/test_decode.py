@@ -0,0 +1,52 @@
+# tests/test_decode.py
+"""JPEG 축소 디코딩 품질 테스트"""
+import math
+
+import pytest
+from PIL import Image, ImageChops, ImageStat
+
+from hiti_sdk.constants import PaperType
+from hiti_sdk.image import _open_image
+
+MIN_PSNR = 35.0
+
+
+def psnr(a, b):
+    """두 RGB 이미지의 PSNR(dB) 계산"""
+    stat = ImageStat.Stat(ImageChops.difference(a, b))
+    mse = sum(stat.sum2) / (len(stat.sum2) * a.size[0] * a.size[1])
+    if mse == 0:
+        return float('inf')
+    return 10 * math.log10(255 ** 2 / mse)
+
+
+@pytest.fixture(scope="module")
+def source(tmp_path_factory):
+    """카메라 사진과 비슷한 부드러운 그라디언트 + 노이즈 JPEG (축소 디코딩이 적용되는 크기)"""
+    width, height = 2800, 4000
+    gradient = Image.linear_gradient("L").resize((width, height))
+    path = tmp_path_factory.mktemp("decode") / "source.jpg"
+    Image.merge("RGB", (
+        gradient,
+        Image.radial_gradient("L").resize((width, height)),
+        Image.blend(gradient, Image.effect_noise((width, height), 24).convert("L"), 0.3),
+    )).save(path, quality=92)
+    return path
+
+
+@pytest.mark.parametrize("paper_type", [PaperType.PHOTO_4X6, PaperType.PHOTO_4X6_SPLIT_3UP])
+def test_draft_decode_psnr(source, paper_type):
+    size = PaperType.get_dimensions(paper_type)
+    if paper_type == PaperType.PHOTO_4X6_SPLIT_3UP:
+        size = (size[0] // 3, size[1])
+
+    with Image.open(source) as full:
+        expected = full.resize(size, Image.LANCZOS).convert('RGB')
+    with _open_image(source, size) as img:
+        img.load()
+        decoded_size = img.size
+        result = img.resize(size, Image.LANCZOS).convert('RGB')
+
+    assert decoded_size[0] < 2800  # 축소 디코딩이 적용됨
+    assert decoded_size[0] >= size[0] and decoded_size[1] >= size[1]
+    assert psnr(expected, result) >= MIN_PSNR
@@ -0,0 +1,37 @@
+# tests/test_image.py
+"""BGR 비트맵 변환 테스트"""
+import pytest
+from PIL import Image
+
+from hiti_sdk.image import _to_bgr_buffer
+
+
+def legacy_bgr_buffer(img):
+    """기존 getpixel 루프 방식의 BGR 변환 (비교 기준)"""
+    width, height = img.size
+    rowsize = ((width * 3 + 3) // 4) * 4
+    bitmap_data = bytearray(rowsize * height)
+    for y in range(height):
+        for x in range(width):
+            r, g, b = img.getpixel((x, y))
+            idx = y * rowsize + x * 3
+            bitmap_data[idx:idx+3] = bytes([b, g, r])
+    return bytes(bitmap_data)
+
+
+def make_test_image(width, height):
+    """픽셀마다 R, G, B가 다른 합성 테스트 이미지"""
+    img = Image.new("RGB", (width, height))
+    img.putdata([((x * 7 + y) % 256, (x * 3 + y * 5) % 256, (x + y * 11 + 1) % 256)
+                 for y in range(height) for x in range(width)])
+    return img
+
+
+@pytest.mark.parametrize("size", [(5, 3), (7, 4), (1, 1), (101, 13), (4, 2), (640, 3)])
+def test_to_bgr_buffer_matches_legacy(size):
+    img = make_test_image(*size)
+    width, height, rowsize, bitmap_data = _to_bgr_buffer(img)
+
+    assert (width, height) == size
+    assert rowsize % 4 == 0
+    assert bytes(bitmap_data) == legacy_bgr_buffer(img)
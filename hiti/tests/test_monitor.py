@@ -0,0 +1,57 @@
+# tests/test_monitor.py
+"""상태 모니터 테스트"""
+import time
+import threading
+
+from hiti_sdk.constants import DeviceStatus
+from hiti_sdk.monitor import StatusMonitor
+from hiti_sdk.status import DEFAULT_DECODER
+
+
+class _Device:
+    """check_status가 호출한 쪽이 정한 상태를 돌려주는 장치 (첫 확인은 release까지 멈춤)"""
+    printer_name = "test"
+    tracker = None
+
+    def __init__(self):
+        self.code = DeviceStatus.OK
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def check_status(self):
+        self.calls += 1
+        code = self.code
+        if self.calls == 1:
+            self.entered.set()
+            self.release.wait(5)
+        return code, DEFAULT_DECODER.decode(code).description
+
+    def decode_status(self, status_code):
+        return DEFAULT_DECODER.decode(status_code)
+
+
+def test_wait_for_ignores_polls_started_before_the_call():
+    device = _Device()
+    monitor = StatusMonitor(device, fast_interval=0.05, idle_interval=0.05)
+    monitor._thread = threading.current_thread()  # 모니터 스레드 없이 직접 확인
+
+    # 인쇄 요청 전에 READY를 읽은 확인이 대기 호출 뒤에 끝나는 경우
+    stale = threading.Thread(target=monitor.poll)
+    stale.start()
+    assert device.entered.wait(5)
+    device.code = DeviceStatus.PRINTING
+
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(
+        monitor.wait_for(lambda code: code == DeviceStatus.OK, timeout=0.5)))
+    waiter.start()
+    while not monitor._wait_intervals:
+        time.sleep(0.01)
+    device.release.set()
+    stale.join()
+    monitor.poll()  # 대기 시작 후의 확인: 인쇄 중
+    waiter.join()
+
+    assert result == [None]
+    assert monitor.latest[0] == DeviceStatus.PRINTING
@@ -0,0 +1,27 @@
+# tests/test_status.py
+"""상태 코드 해석 테스트"""
+import pytest
+
+from hiti_sdk.constants import DeviceStatus, DeviceStatusP7xx
+from hiti_sdk.status import PrinterStatus, StatusCategory, get_decoder
+
+
+@pytest.mark.parametrize("model_name", ["P520L", "P720L", "P728L", "P750L", "P525L"])
+def test_printing_decodes_as_printing(model_name):
+    decoded = get_decoder(model_name).decode(DeviceStatus.PRINTING)
+    assert decoded.state == PrinterStatus.PRINTING
+    assert decoded.active
+
+
+def test_p7xx_specific_codes():
+    decoder = get_decoder("P750L")
+    decoded = decoder.decode(DeviceStatusP7xx.PAPER_JAM_01)
+    assert decoded.state == PrinterStatus.ERROR
+    assert decoded.category == StatusCategory.PAPER
+
+
+def test_unknown_codes():
+    decoder = get_decoder("P525L")
+    assert decoder.decode(0x00080001).state == PrinterStatus.ERROR
+    assert decoder.decode(0x00000001).state == PrinterStatus.READY
+    assert decoder.decode(0x00000001).category == StatusCategory.UNKNOWN